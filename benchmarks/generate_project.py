@@ -0,0 +1,291 @@
+"""
+Generates synthetic pymodd projects of a configurable size for benchmarking `pymodd compile`
+
+usage: python benchmarks/generate_project.py PROJECT_DIRECTORY [--scripts 500] [--folders 20] ...
+"""
+import json
+import random
+from pathlib import Path
+from argparse import ArgumentParser
+
+from pymodd.variable_types import (
+    AttributeTypeBase,
+    ItemTypeBase,
+    MusicBase,
+    PlayerTypeBase,
+    SoundBase,
+    UnitTypeBase,
+)
+
+DEFAULT_GAME_JSON_FILE = Path(__file__).parent.parent.joinpath(
+    "pymodd", "utils", "Default Game.json"
+)
+
+ACTION_TEMPLATES = [
+    "set_variable(Variable.NUMBER_{variable}, Variable.NUMBER_{variable} + {number})",
+    "create_unit_for_player_at_position_with_rotation(UnitType.UNIT_TYPE_{unit_type}, LastTriggeringPlayer(), RandomPositionInRegion(EntireMapRegion()), {number})",
+    "set_entity_attribute(AttributeType.ATTRIBUTE_TYPE_{attribute_type}, LastTriggeringUnit(), AttributeMaxOfEntity(AttributeType.ATTRIBUTE_TYPE_{attribute_type}, LastTriggeringUnit()))",
+    "update_ui_target_for_player_for_miliseconds(UiTarget.CENTER, 'message {number}', LastTriggeringPlayer(), 5000)",
+    "create_floating_text_at_position_with_color('floating ' + 'text {number}', PositionOfEntity(LastTriggeringUnit()), '#ffffff')",
+    "move_entity_to_position(LastTriggeringUnit(), CenterOfRegion(EntireMapRegion()))",
+    "destroy_entity(ItemCurrentlyHeldByUnit(LastTriggeringUnit()))",
+]
+
+BLOCK_TEMPLATES = [
+    "if Variable.NUMBER_{variable} > {number}:",
+    "if NumberOfUnitsOfUnitType(UnitType.UNIT_TYPE_{unit_type}) < {number} and Variable.NUMBER_{variable} == 0:",
+    "for unit in AllUnitsOwnedByPlayer(LastTriggeringPlayer()):",
+    "while Variable.NUMBER_{variable} < {number}:",
+]
+
+
+def variable_class_name_of_category_class_name(category_class_name: str) -> str:
+    if category_class_name in ["Abilities", "Sound"]:
+        return category_class_name
+    if category_class_name == "Musics":
+        return "Music"
+    return category_class_name.removesuffix("s")
+
+
+def generate_project(
+    project_directory: str | Path,
+    scripts: int = 500,
+    folders: int = 20,
+    actions_per_script: int = 20,
+    nesting_depth: int = 3,
+    variables_per_category: int = 50,
+    entity_types: int = 20,
+    seed: int = 0,
+):
+    """Writes a pymodd project (mapping.py, scripts.py, entity_scripts.py, game_variables.py and utils/game.json)
+
+    Args:
+        project_directory (str | Path): directory to write the project in
+
+        scripts (int, optional): number of global scripts. Defaults to 500.
+
+        folders (int, optional): number of folders the global scripts are spread over. Defaults to 20.
+
+        actions_per_script (int, optional): number of actions in each script. Defaults to 20.
+
+        nesting_depth (int, optional): maximum depth of if/for/while blocks inside scripts. Defaults to 3.
+
+        variables_per_category (int, optional): number of variables for each variable category. Defaults to 50.
+
+        entity_types (int, optional): number of unit types, each one gets entity scripts. Defaults to 20.
+
+        seed (int, optional): seed of the generated content. Defaults to 0.
+    """
+    project_directory = Path(project_directory)
+    project_directory.joinpath("utils").mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    variables_per_category = max(1, variables_per_category)
+    entity_types = max(1, entity_types)
+
+    def random_values():
+        return {
+            "variable": rng.randrange(variables_per_category),
+            "unit_type": rng.randrange(entity_types),
+            "attribute_type": rng.randrange(variables_per_category),
+            "number": rng.randrange(1, 100),
+        }
+
+    def script_body_lines(actions: int, depth: int, indent: str) -> list[str]:
+        lines = []
+        while actions > 0:
+            if depth < nesting_depth and actions > 2 and rng.random() < 0.3:
+                block_actions = rng.randint(1, actions - 1)
+                lines.append(indent + rng.choice(BLOCK_TEMPLATES).format(**random_values()))
+                lines += script_body_lines(block_actions, depth + 1, indent + "    ")
+                actions -= block_actions
+                continue
+            lines.append(indent + rng.choice(ACTION_TEMPLATES).format(**random_values()))
+            actions -= 1
+        return lines
+
+    # game_variables.py
+    variable_classes = {
+        "UnitTypes": [
+            f"    UNIT_TYPE_{i} = UnitTypeBase('unitType{i}', name='Unit Type {i}')"
+            for i in range(entity_types)
+        ],
+        "ItemTypes": [
+            f"    ITEM_TYPE_{i} = ItemTypeBase('itemType{i}', name='Item Type {i}')"
+            for i in range(variables_per_category)
+        ],
+        "PlayerTypes": [
+            f"    PLAYER_TYPE_{i} = PlayerTypeBase('playerType{i}', name='Player Type {i}')"
+            for i in range(variables_per_category)
+        ],
+        "AttributeTypes": [
+            f"    ATTRIBUTE_TYPE_{i} = AttributeTypeBase('attributeType{i}', name='Attribute Type {i}')"
+            for i in range(variables_per_category)
+        ],
+        "Variables": [
+            f"    NUMBER_{i} = VariableBase('number{i}', DataType.NUMBER, default_value=0)"
+            for i in range(variables_per_category)
+        ],
+        "EntityVariables": [
+            f"    ENTITY_NUMBER_{i} = EntityVariableBase('entityNumber{i}', DataType.NUMBER)"
+            for i in range(variables_per_category)
+        ],
+        "PlayerVariables": [
+            f"    PLAYER_NUMBER_{i} = PlayerVariableBase('playerNumber{i}', DataType.NUMBER)"
+            for i in range(variables_per_category)
+        ],
+        "Musics": [
+            f"    MUSIC_{i} = MusicBase('music{i}', name='Music {i}')"
+            for i in range(variables_per_category)
+        ],
+        "Sound": [
+            f"    SOUND_{i} = SoundBase('sound{i}', name='Sound {i}')"
+            for i in range(variables_per_category)
+        ],
+    }
+    for empty_class_name in [
+        "ProjectileTypes",
+        "ItemTypeGroups",
+        "UnitTypeGroups",
+        "Regions",
+        "Shops",
+        "Dialogues",
+        "AnimationTypes",
+        "States",
+        "ParticleTypes",
+        "Abilities",
+    ]:
+        variable_classes[empty_class_name] = ["    pass"]
+    game_variables_content = (
+        "from pymodd.variable_types import AttributeTypeBase, EntityVariableBase, ItemTypeBase, MusicBase, "
+        "PlayerTypeBase, PlayerVariableBase, SoundBase, UnitTypeBase, VariableBase\n"
+        "from pymodd.variable.data_type import DataType\n"
+    )
+    for class_name, lines in variable_classes.items():
+        game_variables_content += f"\n\nclass {class_name}:\n" + "\n".join(lines) + "\n"
+    # the game data category is named after the class, while the compiler and scripts use the singular names
+    game_variables_content += "\n\n" + "".join(
+        f"{variable_class_name_of_category_class_name(class_name)} = {class_name}\n"
+        for class_name in variable_classes
+        if variable_class_name_of_category_class_name(class_name) != class_name
+    )
+    _ = project_directory.joinpath("game_variables.py").write_text(game_variables_content)
+
+    # scripts.py
+    scripts_content = (
+        "from pymodd.actions import *\n"
+        "from pymodd.functions import *\n"
+        "from pymodd.script import Trigger, UiTarget, script\n\n"
+        "from game_variables import *\n"
+    )
+    for i in range(scripts):
+        scripts_content += (
+            f"\n\n@script(triggers=[Trigger.EVERY_SECOND])\ndef script_{i}():\n"
+            + "\n".join(script_body_lines(actions_per_script, 0, "    "))
+            + "\n"
+        )
+    _ = project_directory.joinpath("scripts.py").write_text(scripts_content)
+
+    # entity_scripts.py
+    entity_scripts_content = (
+        "from pymodd.entity_script import EntityScripts, Key, KeyBehavior\n\n"
+        "from scripts import *\n"
+    )
+    for i in range(entity_types):
+        entity_scripts_content += (
+            f"\n\nclass UnitType{i}(EntityScripts):\n"
+            "    def _build(self):\n"
+            f"        self.entity_type = UnitType.UNIT_TYPE_{i}\n"
+            "        self.keybindings = {\n"
+            "            Key.E: KeyBehavior(self.use(), self.stop_using()),\n"
+            "        }\n"
+            "        self.scripts = [\n"
+            "            self.use(),\n"
+            "            self.stop_using(),\n"
+            "        ]\n\n"
+            "    @script(triggers=[])\n"
+            "    def use():\n"
+            + "\n".join(script_body_lines(actions_per_script, 0, "        "))
+            + "\n\n"
+            "    @script(triggers=[])\n"
+            "    def stop_using():\n"
+            + "\n".join(script_body_lines(actions_per_script, 0, "        "))
+            + "\n"
+        )
+    _ = project_directory.joinpath("entity_scripts.py").write_text(
+        entity_scripts_content
+    )
+
+    # mapping.py
+    folder_to_scripts: list[list[str]] = [[] for _ in range(max(1, folders))]
+    for i in range(scripts):
+        folder_to_scripts[i % len(folder_to_scripts)].append(f"script_{i}()")
+    folder_lines = [
+        f"            Folder('folder {i}', [{', '.join(folder_scripts)}]),"
+        for i, folder_scripts in enumerate(folder_to_scripts)
+    ]
+    entity_scripts_list = ", ".join(f"UnitType{i}()" for i in range(entity_types))
+    mapping_content = (
+        "from pymodd.game import Game\n"
+        "from pymodd.core.folder import Folder\n\n"
+        "from scripts import *\n"
+        "from entity_scripts import *\n\n\n"
+        "class SyntheticGame(Game):\n"
+        "    def _build(self):\n"
+        f"        self.entity_scripts = [{entity_scripts_list}]\n"
+        "        self.scripts = [\n" + "\n".join(folder_lines) + "\n        ]\n"
+    )
+    _ = project_directory.joinpath("mapping.py").write_text(mapping_content)
+
+    # utils/game.json
+    game_data = json.loads(DEFAULT_GAME_JSON_FILE.read_text())
+    game_data["title"] = "Synthetic Game"
+    data = game_data["data"]
+    for i in range(entity_types):
+        data["unitTypes"][f"unitType{i}"] = UnitTypeBase().get_template_data()
+    for i in range(variables_per_category):
+        data["itemTypes"][f"itemType{i}"] = ItemTypeBase().get_template_data()
+        data["playerTypes"][f"playerType{i}"] = PlayerTypeBase().get_template_data()
+        data["attributeTypes"][f"attributeType{i}"] = (
+            AttributeTypeBase().get_template_data()
+        )
+        data["variables"][f"number{i}"] = {"dataType": "number", "default": 0}
+        data["entityTypeVariables"][f"entityNumber{i}"] = {
+            "dataType": "number",
+            "default": None,
+        }
+        data["playerTypeVariables"][f"playerNumber{i}"] = {
+            "dataType": "number",
+            "default": None,
+        }
+        data["music"][f"music{i}"] = MusicBase().get_template_data()
+        data["sound"][f"sound{i}"] = SoundBase().get_template_data()
+    _ = project_directory.joinpath("utils", "game.json").write_text(
+        json.dumps(game_data)
+    )
+
+
+def main():
+    parser = ArgumentParser(description="Generate a synthetic pymodd project")
+    parser.add_argument("project_directory", type=str)
+    parser.add_argument("--scripts", type=int, default=500)
+    parser.add_argument("--folders", type=int, default=20)
+    parser.add_argument("--actions-per-script", type=int, default=20)
+    parser.add_argument("--nesting-depth", type=int, default=3)
+    parser.add_argument("--variables-per-category", type=int, default=50)
+    parser.add_argument("--entity-types", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generate_project(
+        args.project_directory,
+        scripts=args.scripts,
+        folders=args.folders,
+        actions_per_script=args.actions_per_script,
+        nesting_depth=args.nesting_depth,
+        variables_per_category=args.variables_per_category,
+        entity_types=args.entity_types,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
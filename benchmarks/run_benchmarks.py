@@ -0,0 +1,220 @@
+"""
+Times `pymodd compile` phase by phase on synthetic projects and compares the results with the stored baseline
+
+usage:
+    python benchmarks/run_benchmarks.py                      # compare with benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --save-baseline      # store the results as the new baseline
+    python benchmarks/run_benchmarks.py --sizes small medium --repeat 5
+"""
+import os
+import sys
+import json
+import time
+import runpy
+import platform
+import tempfile
+import subprocess
+from pathlib import Path
+from argparse import SUPPRESS, ArgumentParser
+
+from generate_project import generate_project
+
+BASELINE_FILE = Path(__file__).parent.joinpath("baseline.json")
+
+# keyword arguments of generate_project for each project size
+PROJECT_SIZES = {
+    "small": {
+        "scripts": 50,
+        "folders": 5,
+        "actions_per_script": 10,
+        "nesting_depth": 2,
+        "variables_per_category": 20,
+        "entity_types": 5,
+    },
+    "medium": {
+        "scripts": 500,
+        "folders": 20,
+        "actions_per_script": 20,
+        "nesting_depth": 3,
+        "variables_per_category": 200,
+        "entity_types": 20,
+    },
+    "large": {
+        "scripts": 1500,
+        "folders": 50,
+        "actions_per_script": 30,
+        "nesting_depth": 5,
+        "variables_per_category": 2000,
+        "entity_types": 100,
+    },
+}
+
+
+def time_compile_phases(project_directory: str) -> dict[str, float]:
+    """Compiles the project in this process and returns the seconds spent in each phase"""
+    phase_to_seconds: dict[str, float] = {}
+
+    def timed(phase, function, *args, **kwargs):
+        start_time = time.perf_counter()
+        result = function(*args, **kwargs)
+        phase_to_seconds[phase] = (
+            phase_to_seconds.get(phase, 0.0) + time.perf_counter() - start_time
+        )
+        return result
+
+    def import_pymodd():
+        import pymodd.game
+        import pymodd.script
+        import pymodd.actions
+        import pymodd.functions
+        import pymodd.console_scripts.pymodd_command
+
+        return pymodd
+
+    _ = timed("import pymodd", import_pymodd)
+    from pymodd.compiler.json_writer import write_json
+    from pymodd.console_scripts.pymodd_command import (
+        find_game_classes_in_project_data,
+        find_variable_classes_in_project_data,
+    )
+
+    os.chdir(project_directory)
+    sys.path.append(project_directory)
+    project_data = timed("runpy mapping.py", runpy.run_path, "mapping.py")
+    game_class = find_game_classes_in_project_data(project_data)[0]
+    variable_classes = find_variable_classes_in_project_data(project_data)
+
+    def load_game_data():
+        with open("utils/game.json") as file:
+            return json.load(file)
+
+    game_data = timed("json.load game.json", load_game_data)
+
+    # time the steps of Game.__init__ separately
+    update_data_with_variable_classes = game_class._update_data_with_variable_classes
+    build = game_class._build
+    game_class._update_data_with_variable_classes = lambda self, *args: timed(
+        "variable merge", update_data_with_variable_classes, self, *args
+    )
+    game_class._build = lambda self: timed("build", build, self)
+    game = game_class("utils/game.json", variable_classes, project_data, game_data)
+    game_class._update_data_with_variable_classes = update_data_with_variable_classes
+    game_class._build = build
+
+    game_dict = timed("compile scripts (to_dict)", game.to_dict)
+    Path("output").mkdir(exist_ok=True)
+    timed("write output", write_json, game_dict, "output/game.json")
+    phase_to_seconds["total"] = sum(phase_to_seconds.values())
+    return phase_to_seconds
+
+
+def run_benchmarks(sizes: list[str], repeat: int) -> dict[str, dict[str, float]]:
+    """
+    Returns:
+        dict(str, dict(str, float)): fastest seconds of each phase, for each project size
+    """
+    size_to_phase_seconds: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        for size in sizes:
+            project_directory = Path(temporary_directory, size)
+            generate_project(project_directory, **PROJECT_SIZES[size])
+            fastest_phase_seconds: dict[str, float] = {}
+            for _ in range(repeat):
+                # each compile runs in a new process, like `pymodd compile`
+                output = subprocess.run(
+                    [sys.executable, __file__, "--time-project", str(project_directory)],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                phase_seconds = json.loads(output.splitlines()[-1])
+                for phase, seconds in phase_seconds.items():
+                    fastest_phase_seconds[phase] = min(
+                        seconds, fastest_phase_seconds.get(phase, seconds)
+                    )
+            size_to_phase_seconds[size] = fastest_phase_seconds
+    return size_to_phase_seconds
+
+
+def print_results(
+    size_to_phase_seconds: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    max_slowdown: float,
+) -> bool:
+    """
+    Returns:
+        bool: whether every phase is within max_slowdown of the baseline
+    """
+    within_baseline = True
+    for size, phase_seconds in size_to_phase_seconds.items():
+        size_description = ", ".join(
+            f"{key}={value}" for key, value in PROJECT_SIZES[size].items()
+        )
+        print(f"\n{size} project ({size_description})")
+        baseline_phase_seconds = baseline.get(size, {})
+        for phase, seconds in phase_seconds.items():
+            line = f"  {phase:<28}{seconds * 1000:>10.1f} ms"
+            if (baseline_seconds := baseline_phase_seconds.get(phase)) is not None:
+                ratio = seconds / baseline_seconds if baseline_seconds > 0 else 1.0
+                line += f"{baseline_seconds * 1000:>12.1f} ms baseline  x{ratio:.2f}"
+                # ignore noise of phases that take less than a few milliseconds
+                if ratio > max_slowdown and seconds - baseline_seconds > 0.005:
+                    line += "  <- regression"
+                    within_baseline = False
+            print(line)
+    return within_baseline
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark pymodd compile phases")
+    parser.add_argument(
+        "--sizes", nargs="*", choices=list(PROJECT_SIZES), default=list(PROJECT_SIZES)
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="compiles per size, the fastest is kept"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help=f"store the results in {BASELINE_FILE.name}",
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=1.25,
+        help="ratio to the baseline above which a phase counts as a regression",
+    )
+    # used internally to time a project inside a new process
+    parser.add_argument("--time-project", help=SUPPRESS)
+    args = parser.parse_args()
+
+    if args.time_project is not None:
+        print(json.dumps(time_compile_phases(args.time_project)))
+        return
+
+    size_to_phase_seconds = run_benchmarks(args.sizes, args.repeat)
+    baseline_data = (
+        json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    )
+    within_baseline = print_results(
+        size_to_phase_seconds, baseline_data.get("results", {}), args.max_slowdown
+    )
+
+    if args.save_baseline:
+        baseline_data = {
+            "machine": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+            },
+            "results": {**baseline_data.get("results", {}), **size_to_phase_seconds},
+        }
+        _ = BASELINE_FILE.write_text(json.dumps(baseline_data, indent=4) + "\n")
+        print(f"\nbaseline written to {BASELINE_FILE}")
+    elif not within_baseline:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+from typing import Any
+
+
 def generate_project_from_json_file_content(json_file_content: str) -> None:
     '''Generates a pymodd project from a modd.io game json file
 
@@ -6,6 +9,25 @@ def generate_project_from_json_file_content(json_file_content: str) -> None:
     '''
 
 
+class RawJson:
+    '''Unparsed json of a game data category, written back to the compiled game as it is'''
+
+    json: str
+
+    def __init__(self, json: str) -> None: ...
+
+
+def load_game_json_file(json_file_path: str, parsed_data_categories: list[str] | None = None) -> dict[str, Any]:
+    '''Parses a modd.io game json file natively into python objects, keeping the order of keys
+
+    Args:
+        json_file_path (str): path of the modd.io game json file
+
+        parsed_data_categories (list[str] | None, optional): categories of the game's "data" to parse,
+            the others are left as RawJson. Every category is parsed when None. Defaults to None.
+    '''
+
+
 def log_success(message: str) -> None:
     '''Logs a success message with colorful formatting
 
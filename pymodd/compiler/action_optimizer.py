@@ -0,0 +1,241 @@
+from __future__ import annotations
+import math
+from typing import Any
+
+# numbers above this can not be represented exactly by the javascript numbers of modd.io
+MAX_SAFE_INTEGER = 2**53 - 1
+
+# keys of actions holding lists of actions
+ACTIONS_LIST_KEYS = ("actions", "then", "else")
+
+# keys a condition action can have for it to be replaced by one of its branches
+_REPLACEABLE_CONDITION_ACTION_KEYS = {"type", "conditions", "then", "else"}
+
+# marks conditions that can not be known while compiling
+_UNKNOWN = object()
+
+
+def optimized_actions_data(actions_data: list[Any]) -> list[Any]:
+    """Folds calculations, concatenations and exponents of constants, and replaces condition actions whose
+    conditions are known while compiling with the actions of the branch taken.
+    The actions data is not edited, parts that do not change are shared with the optimized actions data
+
+    Args:
+        actions_data (list): compiled actions of a script
+
+    Returns:
+        list: the optimized actions, the same list when nothing could be optimized
+    """
+    return _optimized_actions(actions_data)
+
+
+def _optimized_actions(actions_data: list[Any]) -> list[Any]:
+    optimized_actions: list[Any] = []
+    is_changed = False
+    for action_data in actions_data:
+        optimized_action = _optimized_value(action_data)
+        if (
+            type(optimized_action) is dict
+            and optimized_action.get("type") == "condition"
+            and optimized_action.keys() <= _REPLACEABLE_CONDITION_ACTION_KEYS
+        ):
+            is_true = _value_of_condition(optimized_action.get("conditions"))
+            if is_true is not _UNKNOWN:
+                branch = optimized_action.get("then" if is_true else "else")
+                if type(branch) is list:
+                    optimized_actions.extend(branch)
+                    is_changed = True
+                    continue
+        if optimized_action is not action_data:
+            is_changed = True
+        optimized_actions.append(optimized_action)
+    return optimized_actions if is_changed else actions_data
+
+
+def _optimized_value(value: Any) -> Any:
+    """
+    Returns:
+        Any: the value with its constant functions and conditions folded, the same object when nothing changed
+    """
+    value_type = type(value)
+    if value_type is list:
+        if _is_condition(value):
+            return _optimized_condition(value)
+        return _optimized_list(value)
+    if value_type is not dict:
+        return value
+    # actions that do not run are left as they were written
+    if value.get("disabled") is True:
+        return value
+
+    optimized_items: dict[str, Any] | None = None
+    for key, item_value in value.items():
+        if key in ACTIONS_LIST_KEYS and type(item_value) is list and "type" in value:
+            optimized_item_value = _optimized_actions(item_value)
+        else:
+            optimized_item_value = _optimized_value(item_value)
+        if optimized_item_value is not item_value:
+            if optimized_items is None:
+                optimized_items = dict(value)
+            optimized_items[key] = optimized_item_value
+    optimized = optimized_items if optimized_items is not None else value
+
+    function = optimized.get("function")
+    if function == "calculate":
+        return _folded_calculation(optimized)
+    if function == "concat":
+        return _folded_concatenation(optimized)
+    if function == "getExponent":
+        return _folded_exponent(optimized)
+    return optimized
+
+
+def _optimized_list(values: list[Any]) -> list[Any]:
+    optimized_values = [_optimized_value(value) for value in values]
+    if all(
+        optimized_value is value
+        for optimized_value, value in zip(optimized_values, values)
+    ):
+        return values
+    return optimized_values
+
+
+def _is_condition(value: list[Any]) -> bool:
+    return (
+        len(value) == 3
+        and type(value[0]) is dict
+        and "operator" in value[0]
+        and "operandType" in value[0]
+    )
+
+
+def _optimized_condition(condition: list[Any]) -> list[Any]:
+    comparison, item_a, item_b = condition
+    optimized_a, optimized_b = _optimized_value(item_a), _optimized_value(item_b)
+    operator = comparison.get("operator")
+    # conditions joined by AND/OR that are known on one side are replaced by the other side
+    if operator in ("AND", "OR") and _is_condition(optimized_a) and _is_condition(
+        optimized_b
+    ):
+        for known, other in [(optimized_a, optimized_b), (optimized_b, optimized_a)]:
+            is_true = _value_of_condition(known)
+            if is_true is _UNKNOWN:
+                continue
+            if is_true == (operator == "AND"):
+                return other
+            return known
+    if optimized_a is item_a and optimized_b is item_b:
+        return condition
+    return [comparison, optimized_a, optimized_b]
+
+
+def _value_of_condition(condition: Any) -> Any:
+    """
+    Returns:
+        Any: whether the condition is true, or _UNKNOWN if it depends on the game
+    """
+    if type(condition) is not list or not _is_condition(condition):
+        return _UNKNOWN
+    comparison, item_a, item_b = condition
+    operator = comparison.get("operator")
+    if operator in ("AND", "OR"):
+        value_a, value_b = _value_of_condition(item_a), _value_of_condition(item_b)
+        if operator == "AND":
+            if value_a is False or value_b is False:
+                return False
+            if value_a is True and value_b is True:
+                return True
+        else:
+            if value_a is True or value_b is True:
+                return True
+            if value_a is False and value_b is False:
+                return False
+        return _UNKNOWN
+
+    # only values of the same type are compared, javascript converts the others
+    if _is_number(item_a) and _is_number(item_b):
+        pass
+    elif (type(item_a) is str and type(item_b) is str) or (
+        type(item_a) is bool and type(item_b) is bool
+    ):
+        # strings and booleans are ordered differently in javascript
+        if operator not in ("==", "!="):
+            return _UNKNOWN
+    else:
+        return _UNKNOWN
+    if operator == "==":
+        return item_a == item_b
+    if operator == "!=":
+        return item_a != item_b
+    if operator == ">":
+        return item_a > item_b
+    if operator == "<":
+        return item_a < item_b
+    if operator == ">=":
+        return item_a >= item_b
+    if operator == "<=":
+        return item_a <= item_b
+    return _UNKNOWN
+
+
+def _folded_calculation(function_data: dict[str, Any]) -> Any:
+    items = function_data.get("items")
+    if len(function_data) != 2 or type(items) is not list or len(items) != 3:
+        return function_data
+    operator_data, item_a, item_b = items
+    if (
+        type(operator_data) is not dict
+        or not _is_number(item_a)
+        or not _is_number(item_b)
+    ):
+        return function_data
+    operator = operator_data.get("operator")
+    if operator == "+":
+        result = item_a + item_b
+    elif operator == "-":
+        result = item_a - item_b
+    elif operator == "*":
+        result = item_a * item_b
+    elif operator == "/" and item_b != 0:
+        result = item_a / item_b
+    elif operator == "%" and item_b != 0:
+        # the remainder of javascript has the sign of the dividend
+        result = math.fmod(item_a, item_b)
+    else:
+        return function_data
+    return _folded_number(result, function_data)
+
+
+def _folded_exponent(function_data: dict[str, Any]) -> Any:
+    base, power = function_data.get("base"), function_data.get("power")
+    if len(function_data) != 3 or not _is_number(base) or not _is_number(power):
+        return function_data
+    try:
+        result = math.pow(base, power)
+    except (OverflowError, ValueError):
+        return function_data
+    return _folded_number(result, function_data)
+
+
+def _folded_concatenation(function_data: dict[str, Any]) -> Any:
+    text_a, text_b = function_data.get("textA"), function_data.get("textB")
+    # numbers are written differently by python and javascript, only texts are folded
+    if len(function_data) != 3 or type(text_a) is not str or type(text_b) is not str:
+        return function_data
+    return text_a + text_b
+
+
+def _folded_number(result: float | int, function_data: dict[str, Any]) -> Any:
+    """
+    Returns:
+        Any: the result when it is written the same by python and javascript, otherwise the function
+    """
+    if not math.isfinite(result) or abs(result) > MAX_SAFE_INTEGER:
+        return function_data
+    if type(result) is float and result.is_integer():
+        return int(result)
+    return result
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) in (int, float) and abs(value) <= MAX_SAFE_INTEGER
@@ -0,0 +1,78 @@
+from __future__ import annotations
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Iterator
+
+
+class CompileProfiler:
+    """Records the wall time of each compile phase and of each compiled script"""
+
+    def __init__(self):
+        self.phase_to_seconds: dict[str, float] = {}
+        self.script_to_seconds: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, phase_name: str) -> Iterator[None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_to_seconds[phase_name] = (
+                self.phase_to_seconds.get(phase_name, 0.0)
+                + time.perf_counter()
+                - start_time
+            )
+
+    def record_script(self, script_label: str, seconds: float):
+        self.script_to_seconds[script_label] = (
+            self.script_to_seconds.get(script_label, 0.0) + seconds
+        )
+
+    def slowest_scripts(self, count: int) -> list[tuple[str, float]]:
+        return sorted(
+            self.script_to_seconds.items(), key=lambda pair: pair[1], reverse=True
+        )[:count]
+
+    def to_dict(self, top_scripts_count: int = 10) -> dict[str, Any]:
+        return {
+            "phases": self.phase_to_seconds,
+            "total": sum(self.phase_to_seconds.values()),
+            "compiledScriptsCount": len(self.script_to_seconds),
+            "compiledScriptsTotal": sum(self.script_to_seconds.values()),
+            "slowestScripts": [
+                {"script": script_label, "seconds": seconds}
+                for script_label, seconds in self.slowest_scripts(top_scripts_count)
+            ],
+        }
+
+    def print_report(self, top_scripts_count: int = 10):
+        total_seconds = sum(self.phase_to_seconds.values())
+        print("\ncompile profile:")
+        for phase_name, seconds in self.phase_to_seconds.items():
+            percentage = seconds / total_seconds * 100 if total_seconds > 0 else 0
+            print(f"  {phase_name:<28}{seconds * 1000:>10.1f} ms {percentage:>6.1f}%")
+        print(f"  {'total':<28}{total_seconds * 1000:>10.1f} ms")
+
+        compiled_seconds = sum(self.script_to_seconds.values())
+        print(
+            f"\n{len(self.script_to_seconds)} scripts compiled in {compiled_seconds * 1000:.1f} ms, slowest:"
+        )
+        for script_label, seconds in self.slowest_scripts(top_scripts_count):
+            percentage = seconds / compiled_seconds * 100 if compiled_seconds > 0 else 0
+            print(f"  {seconds * 1000:>10.1f} ms {percentage:>6.1f}%  {script_label}")
+
+
+# profiler that compile phases are recorded to, profiling is disabled when None
+active_profiler: CompileProfiler | None = None
+
+
+def profile_phase(phase_name: str) -> ContextManager[Any]:
+    """Times the code inside the with block as a compile phase, if profiling is enabled"""
+    if active_profiler is None:
+        return nullcontext()
+    return active_profiler.phase(phase_name)
+
+
+def record_script_compile_time(script_label: str, seconds: float):
+    if active_profiler is not None:
+        active_profiler.record_script(script_label, seconds)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+import ast
+import hashlib
+from types import CodeType
+
+# stale entries are only left behind by edited scripts, so the cache is simply cleared when it gets too big
+MAX_CACHED_CODES = 100_000
+
+_location_to_code: dict[tuple[str, int, int, int, int], CodeType] = {}
+
+
+def digest_of_source(source: str) -> str:
+    return hashlib.sha1(source.encode()).hexdigest()
+
+
+def compile_expression(node: ast.AST, source_digest: str | None = None) -> CodeType:
+    """Compiles the expression node, reusing the code object compiled for the same location of the same source
+
+    Args:
+        node (ast.AST): expression node parsed from the source
+
+        source_digest (str | None, optional): digest of the source the node was parsed from, the code object is not cached when None. Defaults to None.
+    """
+    if source_digest is None or getattr(node, "end_col_offset", None) is None:
+        return compile(ast.Expression(body=node), filename="<ast>", mode="eval")
+    location = (
+        source_digest,
+        node.lineno,
+        node.col_offset,
+        node.end_lineno,
+        node.end_col_offset,
+    )
+    if (code := _location_to_code.get(location)) is None:
+        if len(_location_to_code) >= MAX_CACHED_CODES:
+            _location_to_code.clear()
+        code = compile(ast.Expression(body=node), filename="<ast>", mode="eval")
+        _location_to_code[location] = code
+    return code
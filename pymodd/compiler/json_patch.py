@@ -0,0 +1,209 @@
+from __future__ import annotations
+from typing import Any
+
+from pymodd.utils.copy_json_data import copy_json_data
+
+
+def game_data_patch(
+    old_game_data: dict[str, Any],
+    new_game_data: dict[str, Any],
+    categories: list[str],
+) -> list[dict[str, Any]]:
+    """Creates an RFC 6902 JSON Patch that turns the old game data into the new one
+
+    Args:
+        old_game_data (dict): game data the patch is applied to
+
+        new_game_data (dict): compiled game data
+
+        categories (list[str]): categories of the game's "data" to compare, the others are expected to be unchanged
+
+    Returns:
+        list[dict]: operations of the patch
+    """
+    operations: list[dict[str, Any]] = []
+    old_categories_data = old_game_data["data"]
+    new_categories_data = new_game_data["data"]
+    for category in categories:
+        path = f"/data/{escape_json_pointer_token(category)}"
+        if category not in new_categories_data:
+            if category in old_categories_data:
+                operations.append({"op": "remove", "path": path})
+            continue
+        if category not in old_categories_data:
+            operations.append(
+                {"op": "add", "path": path, "value": new_categories_data[category]}
+            )
+            continue
+        _diff(
+            old_categories_data[category],
+            new_categories_data[category],
+            path,
+            operations,
+        )
+    return operations
+
+
+def _diff(old: Any, new: Any, path: str, operations: list[dict[str, Any]]):
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, old_value in old.items():
+            if key not in new:
+                operations.append(
+                    {"op": "remove", "path": f"{path}/{escape_json_pointer_token(key)}"}
+                )
+                continue
+            _diff(
+                old_value, new[key], f"{path}/{escape_json_pointer_token(key)}", operations
+            )
+        for key, new_value in new.items():
+            if key not in old:
+                operations.append(
+                    {
+                        "op": "add",
+                        "path": f"{path}/{escape_json_pointer_token(key)}",
+                        "value": new_value,
+                    }
+                )
+        return
+    # lists and values are replaced as a whole
+    if _json_type_of(old) is not _json_type_of(new) or old != new:
+        operations.append({"op": "replace", "path": path, "value": new})
+
+
+def _json_type_of(value: Any) -> type:
+    # subclasses of dict and list, such as template data instances, hold the same json as their base class
+    if isinstance(value, dict):
+        return dict
+    if isinstance(value, list):
+        return list
+    return type(value)
+
+
+def apply_json_patch(data: Any, operations: list[dict[str, Any]]) -> Any:
+    """Applies an RFC 6902 JSON Patch to the data, editing it in place
+
+    Returns:
+        Any: the patched data, a different object only when the whole document is replaced
+    """
+    for operation in operations:
+        op, path = operation.get("op"), operation.get("path")
+        if not isinstance(path, str):
+            raise ValueError(f"patch operation is missing its path: {operation}")
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise ValueError(f"patch operation is missing its value: {operation}")
+
+        if op == "test":
+            if _get(data, path) != operation["value"]:
+                raise ValueError(f"patch test failed at {path}")
+        elif op == "remove":
+            _remove(data, path)
+        elif op == "add":
+            data = _add(data, path, copy_json_data(operation["value"]))
+        elif op == "replace":
+            data = _replace(data, path, copy_json_data(operation["value"]))
+        elif op in ("move", "copy"):
+            from_path = operation.get("from")
+            if not isinstance(from_path, str):
+                raise ValueError(f"patch operation is missing from: {operation}")
+            value = _get(data, from_path)
+            if op == "move":
+                if path.startswith(from_path + "/"):
+                    raise ValueError(f"can not move {from_path} into itself")
+                _remove(data, from_path)
+            else:
+                value = copy_json_data(value)
+            data = _add(data, path, value)
+        else:
+            raise ValueError(f"unknown patch operation: {op}")
+    return data
+
+
+def escape_json_pointer_token(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_json_pointer_token(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _split_path(path: str) -> list[str]:
+    if path == "":
+        return []
+    if not path.startswith("/"):
+        raise ValueError(f"invalid json pointer: {path}")
+    return [_unescape_json_pointer_token(token) for token in path[1:].split("/")]
+
+
+def _child(container: Any, token: str, path: str) -> Any:
+    if isinstance(container, dict):
+        if token not in container:
+            raise ValueError(f"{path} does not exist")
+        return container[token]
+    if isinstance(container, list):
+        return container[_list_index(container, token, path)]
+    raise ValueError(f"{path} does not exist")
+
+
+def _list_index(container: list[Any], token: str, path: str, adding=False) -> int:
+    if adding and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise ValueError(f"invalid list index in {path}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not adding):
+        raise ValueError(f"{path} does not exist")
+    return index
+
+
+def _get(data: Any, path: str) -> Any:
+    for token in _split_path(path):
+        data = _child(data, token, path)
+    return data
+
+
+def _parent_and_token(data: Any, path: str) -> tuple[Any, str]:
+    tokens = _split_path(path)
+    parent = data
+    for token in tokens[:-1]:
+        parent = _child(parent, token, path)
+    return parent, tokens[-1]
+
+
+def _add(data: Any, path: str, value: Any) -> Any:
+    if path == "":
+        return value
+    parent, token = _parent_and_token(data, path)
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_list_index(parent, token, path, adding=True), value)
+    else:
+        raise ValueError(f"{path} does not exist")
+    return data
+
+
+def _replace(data: Any, path: str, value: Any) -> Any:
+    if path == "":
+        return value
+    parent, token = _parent_and_token(data, path)
+    if isinstance(parent, list):
+        parent[_list_index(parent, token, path)] = value
+        return data
+    _ = _child(parent, token, path)
+    # replacing keeps the position of the key
+    parent[token] = value
+    return data
+
+
+def _remove(data: Any, path: str):
+    if path == "":
+        raise ValueError("can not remove the whole document")
+    parent, token = _parent_and_token(data, path)
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise ValueError(f"{path} does not exist")
+        del parent[token]
+    elif isinstance(parent, list):
+        del parent[_list_index(parent, token, path)]
+    else:
+        raise ValueError(f"{path} does not exist")
@@ -0,0 +1,191 @@
+from __future__ import annotations
+import io
+import gzip
+import json
+import math
+from pathlib import Path
+from typing import Any, TextIO
+
+try:
+    from pymodd import _pymodd_helper
+except ImportError:
+    _pymodd_helper = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# file suffix of each compression of write_json
+COMPRESSION_TO_FILE_SUFFIX = {"gzip": ".gz", "zstd": ".zst"}
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# game data categories left unparsed by the native game json loader
+_RawJson = getattr(_pymodd_helper, "RawJson", None)
+
+# depth of nested dicts and lists written item by item, deeper values are encoded in one piece
+STREAMED_DEPTH = 3
+
+# integers and nesting orjson can encode
+ORJSON_MIN_INTEGER, ORJSON_MAX_INTEGER = -(2**63), 2**64 - 1
+ORJSON_MAX_DEPTH = 254
+
+
+def write_json(
+    data: Any,
+    file_path: str | Path,
+    compact: bool = False,
+    indent: int = 4,
+    compression: str | None = None,
+):
+    """Writes the data to the file in chunks instead of building the whole json string first
+
+    Args:
+        data (Any): json serializable data
+
+        file_path (str | Path): file to write the json to
+
+        compact (bool, optional): whether to leave out indentation and whitespace, uses orjson when it is installed and
+            encodes the whole data the same as json. Defaults to False.
+
+        indent (int, optional): spaces per indentation level when not compact. Defaults to 4.
+
+        compression (str | None, optional): "gzip" or "zstd" to compress the file, zstd requires the zstandard package. Defaults to None.
+    """
+    if compression is None:
+        file = open(file_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+    else:
+        file = io.TextIOWrapper(
+            io.BufferedWriter(
+                _open_compressed_file(file_path, compression), WRITE_BUFFER_SIZE
+            ),
+            encoding="utf-8",
+        )
+    with file:
+        JsonWriter(file, None if compact else indent).write(data)
+
+
+def _open_compressed_file(file_path: str | Path, compression: str) -> Any:
+    if compression == "gzip":
+        return gzip.open(file_path, "wb", compresslevel=6)
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError(
+                "zstd compression requires the zstandard package, install it with `pip install pymodd[zstd]`"
+            )
+        return zstandard.open(file_path, "wb")
+    raise ValueError(f"unknown compression: {compression}")
+
+
+class JsonWriter:
+    def __init__(self, file: TextIO, indent: int | None = 4):
+        """
+        Args:
+            file (TextIO): file to write to
+
+            indent (int | None, optional): spaces per indentation level, compact when None. Defaults to 4.
+        """
+        self.file = file
+        self.indent = indent
+        self._key_separator = ":" if indent is None else ": "
+        self._uses_orjson = False
+
+    def write(self, data: Any):
+        # a single encoder writes the whole document, orjson writes non-finite floats as null and leaves out escapes
+        self._uses_orjson = (
+            self.indent is None
+            and orjson is not None
+            and is_encoded_by_orjson_as_by_json(data)
+        )
+        self._write_value(data, 0)
+
+    def _write_value(self, value: Any, depth: int):
+        if _RawJson is not None and isinstance(value, _RawJson):
+            # unparsed json from the game json file is written as it is
+            _ = self.file.write(value.json)
+        elif (
+            depth >= STREAMED_DEPTH
+            or not isinstance(value, (dict, list))
+            or len(value) == 0
+        ):
+            _ = self.file.write(self._encode(value, depth))
+        elif isinstance(value, dict):
+            self._write_items(
+                "{",
+                "}",
+                (
+                    (f"{self._encode_key(key)}{self._key_separator}", item)
+                    for key, item in value.items()
+                ),
+                depth,
+            )
+        else:
+            self._write_items("[", "]", (("", item) for item in value), depth)
+
+    def _write_items(self, opening: str, closing: str, prefixed_items, depth: int):
+        if self.indent is None:
+            item_separator, closing_prefix = ",", ""
+        else:
+            item_separator = ",\n" + " " * (self.indent * (depth + 1))
+            closing_prefix = "\n" + " " * (self.indent * depth)
+        _ = self.file.write(opening)
+        for i, (prefix, item) in enumerate(prefixed_items):
+            _ = self.file.write(item_separator[1:] if i == 0 else item_separator)
+            _ = self.file.write(prefix)
+            self._write_value(item, depth + 1)
+        _ = self.file.write(closing_prefix + closing)
+
+    def _encode(self, value: Any, depth: int) -> str:
+        if self.indent is None:
+            if self._uses_orjson:
+                return orjson.dumps(value).decode()
+            return json.dumps(value, separators=(",", ":"))
+        encoded_value = json.dumps(value, indent=self.indent)
+        if depth == 0:
+            return encoded_value
+        # strings never contain raw newlines, so each line only needs the indentation of this depth
+        return encoded_value.replace("\n", "\n" + " " * (self.indent * depth))
+
+    def _encode_key(self, key: Any) -> str:
+        if self._uses_orjson:
+            return orjson.dumps(key).decode()
+        # json converts int, float, bool, and None keys to the string of their json value
+        return json.dumps(key if isinstance(key, str) else json.dumps(key))
+
+
+def is_encoded_by_orjson_as_by_json(value: Any, depth: int = 0) -> bool:
+    """
+    Returns:
+        bool: whether orjson encodes the value to the same data as json, which needs str keys, 64 bit integers,
+            finite floats and at most ORJSON_MAX_DEPTH levels of nesting
+    """
+    value_type = type(value)
+    if value_type is str or value_type is bool or value is None:
+        return True
+    if value_type is int:
+        return ORJSON_MIN_INTEGER <= value <= ORJSON_MAX_INTEGER
+    if value_type is float:
+        return math.isfinite(value)
+    if isinstance(value, dict):
+        for key in value:
+            if type(key) is not str:
+                return False
+        items = value.values()
+    elif isinstance(value, (list, tuple)):
+        items = value
+    else:
+        # unparsed json is written as it is
+        return _RawJson is not None and isinstance(value, _RawJson)
+    if depth >= ORJSON_MAX_DEPTH:
+        return False
+    for item in items:
+        # strings are checked here, as most items are strings and calls are slow
+        if type(item) is not str and not is_encoded_by_orjson_as_by_json(
+            item, depth + 1
+        ):
+            return False
+    return True
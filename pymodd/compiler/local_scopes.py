@@ -0,0 +1,46 @@
+from __future__ import annotations
+from typing import Any
+
+# marks a variable that was not defined before a scope assigned it
+_UNDEFINED = object()
+
+
+class LocalScopes:
+    """
+    Lexical scopes of the local variables of a script. All visible variables are kept in a single dict,
+    which can be passed to eval directly. Each scope remembers the values its variables shadowed,
+    so they are restored when the scope is popped
+    """
+
+    def __init__(self):
+        self.locals_data: dict[str, Any] = {}
+        # for each scope, the names it assigned mapped to the values they shadowed
+        self._scope_shadowed_values: list[dict[str, Any]] = [{}]
+
+    @property
+    def depth(self) -> int:
+        return len(self._scope_shadowed_values) - 1
+
+    def push(self):
+        self._scope_shadowed_values.append({})
+
+    def pop(self):
+        for name, shadowed_value in self._scope_shadowed_values.pop().items():
+            self._restore(name, shadowed_value)
+
+    def set(self, name: str, value: Any):
+        """Assigns the variable in the current scope"""
+        shadowed_values = self._scope_shadowed_values[-1]
+        if name not in shadowed_values:
+            shadowed_values[name] = self.locals_data.get(name, _UNDEFINED)
+        self.locals_data[name] = value
+
+    def delete(self, name: str):
+        """Deletes a variable assigned in the current scope, raises KeyError if there is none"""
+        self._restore(name, self._scope_shadowed_values[-1].pop(name))
+
+    def _restore(self, name: str, shadowed_value: Any):
+        if shadowed_value is _UNDEFINED:
+            del self.locals_data[name]
+        else:
+            self.locals_data[name] = shadowed_value
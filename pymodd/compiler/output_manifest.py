@@ -0,0 +1,52 @@
+from __future__ import annotations
+import json
+import hashlib
+from typing import Any
+
+MANIFEST_VERSION = 1
+
+# categories whose entity types are hashed one by one
+ENTITY_TYPE_CATEGORIES = ["unitTypes", "itemTypes", "projectileTypes"]
+
+
+def game_data_manifest(
+    game_data: dict[str, Any], categories: list[str]
+) -> dict[str, Any]:
+    """Hashes the sections of the compiled game, so tooling can tell which sections changed between builds.
+    Sections are "scripts", "<entity category>/<entity id>" for each entity type, and the name of every other category
+
+    Args:
+        game_data (dict): compiled game data
+
+        categories (list[str]): categories of the game's "data" to hash
+
+    Returns:
+        dict: the manifest, with the sha256 of the canonical json of each section
+    """
+    section_to_hash: dict[str, str] = {}
+    categories_data = game_data["data"]
+    for category in categories:
+        if (category_data := categories_data.get(category)) is None:
+            continue
+        if category in ENTITY_TYPE_CATEGORIES and isinstance(category_data, dict):
+            for entity_id, entity_data in category_data.items():
+                section_to_hash[f"{category}/{entity_id}"] = hash_of_json_data(
+                    entity_data
+                )
+            continue
+        section_to_hash[category] = hash_of_json_data(category_data)
+    return {
+        "version": MANIFEST_VERSION,
+        "algorithm": "sha256",
+        "title": game_data.get("title"),
+        "sections": section_to_hash,
+    }
+
+
+def hash_of_json_data(data: Any) -> str:
+    """
+    Returns:
+        str: sha256 of the canonical json of the data (sorted keys, no whitespace), the same for equal data
+    """
+    canonical_json = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical_json.encode()).hexdigest()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+import time
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from pymodd.core.script import Script
+from pymodd.compiler.script_cache import ScriptCompileCache
+from pymodd.compiler.compile_profiler import record_script_compile_time
+from pymodd.compiler.project_scripts import find_script_classes_of_project
+
+
+class ScriptCompilePool:
+    """
+    Compiles scripts over a pool of worker processes. Workers are forked from this process, so they share
+    the loaded project with it, including the ids generated for its variables and the keys of its scripts.
+    Compiled actions are stored in a ScriptCompileCache so they are merged back in the original order
+    """
+
+    def __init__(self, jobs: int, project_directory: str | Path):
+        """
+        Args:
+            jobs (int): number of worker processes
+
+            project_directory (str | Path): directory of the pymodd project containing mapping.py
+        """
+        self.jobs = jobs
+        self.project_directory = str(Path(project_directory).absolute())
+        self._executor: ProcessPoolExecutor | None = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Returns whether processes can be forked, scripts are compiled in this process otherwise"""
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    def compile_missing_scripts(
+        self,
+        scripts: list[Script],
+        project_globals_data: dict[str, Any],
+        compile_cache: ScriptCompileCache,
+    ):
+        """Compiles the scripts that are not in the compile cache and stores their actions in it"""
+        fingerprint_to_identity: dict[str, str] = {}
+        for script in scripts:
+            if script.identity is None:
+                continue
+            # fingerprints are kept by the cache for the rest of the compile, merging the scripts reuses them
+            fingerprint = compile_cache.fingerprint_of(script, project_globals_data)
+            if fingerprint is None or compile_cache.contains(fingerprint):
+                continue
+            _ = fingerprint_to_identity.setdefault(fingerprint, script.identity)
+        if len(fingerprint_to_identity) == 0:
+            return
+
+        identities = list(fingerprint_to_identity.values())
+        chunk_size = max(1, len(identities) // (self.jobs * 4))
+        actions_datas = self._get_executor(project_globals_data).map(
+            _compile_script_in_worker, identities, chunksize=chunk_size
+        )
+        for (fingerprint, identity), (actions_data, seconds) in zip(
+            fingerprint_to_identity.items(), actions_datas
+        ):
+            compile_cache.store(fingerprint, actions_data)
+            record_script_compile_time(identity, seconds)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self, project_globals_data: dict[str, Any]) -> ProcessPoolExecutor:
+        if self._executor is None:
+            identity_to_script_class = find_script_classes_of_project(
+                project_globals_data, self.project_directory
+            )
+            # arguments of forked workers are not pickled, they are the objects of this process
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.jobs,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_initialize_worker,
+                initargs=(project_globals_data, identity_to_script_class),
+            )
+        return self._executor
+
+
+# ---------------------------------------------------------------------------- #
+#                                Worker Process                                #
+# ---------------------------------------------------------------------------- #
+
+_worker_project_globals_data: dict[str, Any] = {}
+_worker_identity_to_script_class: dict[str, type[Script]] = {}
+
+
+def _initialize_worker(
+    project_globals_data: dict[str, Any],
+    identity_to_script_class: dict[str, type[Script]],
+):
+    global _worker_project_globals_data, _worker_identity_to_script_class
+    _worker_project_globals_data = project_globals_data
+    _worker_identity_to_script_class = identity_to_script_class
+
+
+def _compile_script_in_worker(identity: str) -> tuple[list[Any], float]:
+    """
+    Returns:
+        tuple(list, float): compiled actions of the script and the seconds spent compiling it
+    """
+    start_time = time.perf_counter()
+    script = _worker_identity_to_script_class[identity]()
+    actions_data = script.compile_actions_data(  # pyright: ignore[reportAttributeAccessIssue]
+        _worker_project_globals_data
+    )
+    return actions_data, time.perf_counter() - start_time
@@ -0,0 +1,56 @@
+from __future__ import annotations
+import os
+import sys
+import linecache
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def isolated_project(project_directory: str | Path) -> Iterator[None]:
+    """Runs the code inside the with block from the project directory with the project importable.
+    Afterwards the working directory and sys.path are restored and the project's modules are unloaded,
+    so projects with the same module names (scripts, game_variables...) can be compiled in one process
+    """
+    project_directory = Path(project_directory).absolute()
+    previous_working_directory = os.getcwd()
+    previous_sys_path = list(sys.path)
+    # loaded modules with the names of the project's modules would be imported instead of them
+    top_level_names = _top_level_module_names_of_directory(project_directory)
+    shadowed_modules = {
+        module_name: sys.modules.pop(module_name)
+        for module_name in list(sys.modules)
+        if module_name.split(".")[0] in top_level_names
+    }
+    os.chdir(project_directory)
+    sys.path.insert(0, str(project_directory))
+    try:
+        yield
+    finally:
+        unload_modules_of_directory(project_directory)
+        sys.modules.update(shadowed_modules)
+        sys.path[:] = previous_sys_path
+        os.chdir(previous_working_directory)
+
+
+def _top_level_module_names_of_directory(directory: Path) -> set[str]:
+    return {
+        path.stem if path.is_file() else path.name
+        for path in directory.iterdir()
+        if (path.is_file() and path.suffix == ".py")
+        or (path.is_dir() and path.name.isidentifier())
+    }
+
+
+def unload_modules_of_directory(directory: str | Path):
+    """Removes modules imported from the directory so the next import reads their new source"""
+    directory = Path(directory).absolute()
+    for module_name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file is not None and Path(module_file).absolute().is_relative_to(
+            directory
+        ):
+            del sys.modules[module_name]
+    # inspect.getsource reads source through linecache
+    linecache.checkcache()
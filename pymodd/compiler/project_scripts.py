@@ -0,0 +1,101 @@
+from __future__ import annotations
+import sys
+import json
+from pathlib import Path
+from typing import Any
+
+from pymodd.core.script import Script
+
+SCRIPT_POSITIONS_FILE_NAME = "script_positions.json"
+
+
+class ScriptPositionNotStoredError(LookupError):
+    """Raised when a script is compiled without building the game, but no full compile stored its key and order"""
+
+    def __init__(self, script_identity: str | None):
+        super().__init__(
+            f"the key and order of the script {script_identity} were not stored by a full compile, "
+            "compile the project without --lazy first"
+        )
+        self.script_identity = script_identity
+
+
+def find_script_classes_of_project(
+    project_globals_data: dict[str, Any], project_directory: str | Path
+) -> dict[str, type[Script]]:
+    """Finds the script classes defined in mapping.py and in the modules imported from the project directory
+
+    Returns:
+        dict(str, type[Script]): script classes by their identities
+    """
+    project_directory = Path(project_directory).absolute()
+    namespaces: list[dict[str, Any]] = [project_globals_data]
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if module_file is not None and Path(module_file).absolute().is_relative_to(
+            project_directory
+        ):
+            namespaces.append(vars(module))
+    identity_to_script_class: dict[str, type[Script]] = {}
+    for namespace in namespaces:
+        _find_script_classes(namespace, identity_to_script_class)
+    return identity_to_script_class
+
+
+def _find_script_classes(
+    namespace: dict[str, Any], identity_to_script_class: dict[str, type[Script]]
+):
+    """Finds script classes in the namespace, including ones defined inside classes (entity scripts)"""
+    for value in namespace.values():
+        if not isinstance(value, type):
+            continue
+        if issubclass(value, Script):
+            if value.identity is not None:
+                _ = identity_to_script_class.setdefault(value.identity, value)
+            continue
+        if value.__module__ in ("builtins", "typing"):
+            continue
+        for attribute_value in vars(value).values():
+            if (
+                isinstance(attribute_value, type)
+                and issubclass(attribute_value, Script)
+                and attribute_value.identity is not None
+            ):
+                _ = identity_to_script_class.setdefault(
+                    attribute_value.identity, attribute_value
+                )
+
+
+def use_script_keys(
+    identity_to_script_class: dict[str, type[Script]],
+    identity_to_script_key: dict[str, str],
+):
+    """Gives the script classes the keys of the scripts with the same identities"""
+    for identity, script_class in identity_to_script_class.items():
+        if (script_key := identity_to_script_key.get(identity)) is not None:
+            Script._class_to_key[script_class] = script_key
+
+
+def save_script_positions(directory: str | Path, scripts: list[Script]):
+    """Stores the keys and orders of the scripts, so they can be compiled in the same position without building the game"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    identity_to_position = {
+        script.identity: {"key": script.key, "order": script.order}
+        for script in scripts
+        if script.identity is not None and script.key is not None
+    }
+    _ = directory.joinpath(SCRIPT_POSITIONS_FILE_NAME).write_text(
+        json.dumps(identity_to_position, indent=4)
+    )
+
+
+def load_script_positions(directory: str | Path) -> dict[str, dict[str, Any]]:
+    """
+    Returns:
+        dict(str, dict): keys and orders stored by save_script_positions by script identity, empty if none were stored
+    """
+    try:
+        return json.loads(Path(directory, SCRIPT_POSITIONS_FILE_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
@@ -0,0 +1,81 @@
+from __future__ import annotations
+import time
+from pathlib import Path
+
+from pymodd.compiler.project_isolation import unload_modules_of_directory
+from pymodd.variable import variable_table
+
+
+class ProjectWatcher:
+    """
+    Polls the files of a pymodd project for changes and unloads the project's modules
+    so they can be imported again inside the same interpreter
+    """
+
+    WATCHED_FILE_NAMES = [
+        "scripts.py",
+        "entity_scripts.py",
+        "game_variables.py",
+        "mapping.py",
+        "utils/game.json",
+    ]
+
+    def __init__(self, project_directory: str | Path, poll_interval: float = 0.5):
+        """
+        Args:
+            project_directory (str | Path): directory of the pymodd project
+
+            poll_interval (float, optional): seconds to wait between checking the files. Defaults to 0.5.
+        """
+        self.project_directory = Path(project_directory).absolute()
+        self.poll_interval = poll_interval
+        self.watched_files = [
+            self.project_directory.joinpath(file_name)
+            for file_name in ProjectWatcher.WATCHED_FILE_NAMES
+        ]
+        self._file_to_modified_time = self._modified_times()
+
+    def _modified_times(self) -> dict[Path, int | None]:
+        file_to_modified_time: dict[Path, int | None] = {}
+        # tables of game_variables.py are watched too
+        table_files = sorted(
+            file
+            for file in variable_table.read_table_files
+            if file.is_relative_to(self.project_directory)
+        )
+        for file in [*self.watched_files, *table_files]:
+            try:
+                file_to_modified_time[file] = file.stat().st_mtime_ns
+            except OSError:
+                file_to_modified_time[file] = None
+        return file_to_modified_time
+
+    def changed_files(self) -> list[Path]:
+        """
+        Returns:
+            list[Path]: files modified, created, or deleted since the last check
+        """
+        file_to_modified_time = self._modified_times()
+        changed_files = [
+            file
+            for file, modified_time in file_to_modified_time.items()
+            # tables read for the first time are not changes
+            if file in self._file_to_modified_time
+            and self._file_to_modified_time[file] != modified_time
+        ]
+        self._file_to_modified_time = file_to_modified_time
+        return changed_files
+
+    def wait_for_changes(self) -> list[Path]:
+        """Blocks until at least one watched file changes
+
+        Returns:
+            list[Path]: the changed files
+        """
+        while len(changed_files := self.changed_files()) == 0:
+            time.sleep(self.poll_interval)
+        return changed_files
+
+    def unload_project_modules(self):
+        """Removes modules imported from the project directory so the next import reads their new source"""
+        unload_modules_of_directory(self.project_directory)
@@ -0,0 +1,425 @@
+from __future__ import annotations
+import ast
+import sys
+import json
+import hashlib
+import importlib.util
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import Any
+
+from pymodd.core.base import Base
+from pymodd.core.script import Script
+from pymodd.utils.to_dict import to_dict
+
+PYMODD_PACKAGE_DIRECTORY = Path(__file__).absolute().parent.parent
+
+
+class ScriptCompileCache:
+    """
+    Stores the compiled actions of scripts on disk so that unchanged scripts are not compiled again.
+    Entries are keyed by a fingerprint of the script's code and of the project globals the script uses.
+    """
+
+    FILE_NAME = "compiled_scripts.json"
+    VERSION = 1
+
+    def __init__(
+        self,
+        cache_directory: str | Path | None = None,
+        project_directory: str | Path | None = None,
+    ):
+        """
+        Args:
+            cache_directory (str | Path | None): directory the cache file is kept in. if none is given, the cache only lives in memory
+
+            project_directory (str | Path | None): directory of the pymodd project, whose modules are followed for the
+                globals scripts reference. Defaults to the current directory.
+        """
+        self.project_directory = Path(
+            project_directory if project_directory is not None else Path.cwd()
+        ).absolute()
+        self.cache_file: Path | None = (
+            Path(cache_directory, ScriptCompileCache.FILE_NAME)
+            if cache_directory is not None
+            else None
+        )
+        self.fingerprint_to_actions_data: dict[str, list[Any]] = {}
+        self.used_fingerprints: set[str] = set()
+        self.hits, self.misses = 0, 0
+        # (path, mtime, size) -> hash of the file's content
+        self._file_state_to_hash: dict[tuple[str, int, int], str] = {}
+        # (path, mtime, size) -> names of the modules the file imports
+        self._file_state_to_imported_module_names: dict[
+            tuple[str, int, int], list[str]
+        ] = {}
+        # descriptions of the current compile, found again for the project globals of the next one
+        self._project_globals_data: dict[str, Any] | None = None
+        self._id_to_described_value: dict[int, tuple[Any, str | None]] = {}
+        self._module_name_to_dependencies_hash: dict[str, str] = {}
+        self._id_to_class_json: dict[int, tuple[type, str | None]] = {}
+        self._function_id_to_fingerprint: dict[int, tuple[Any, str | None]] = {}
+        self._compiler_hash: str | None = None
+        self._load()
+
+    def _load(self):
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") != ScriptCompileCache.VERSION:
+            return
+        self.fingerprint_to_actions_data = data.get("scripts", {})
+
+    def save(self, drop_unused_entries: bool = True):
+        """
+        Writes the cache to the cache file
+
+        Args:
+            drop_unused_entries (bool, optional): drop entries that were not used since the cache was loaded. Should only be
+                enabled after compiling every script. Defaults to True.
+        """
+        if self.cache_file is None:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        actions_data_to_save = {
+            fingerprint: actions_data
+            for fingerprint, actions_data in self.fingerprint_to_actions_data.items()
+            if not drop_unused_entries or fingerprint in self.used_fingerprints
+        }
+        temporary_file = self.cache_file.with_suffix(".tmp")
+        _ = temporary_file.write_text(
+            json.dumps(
+                {"version": ScriptCompileCache.VERSION, "scripts": actions_data_to_save}
+            )
+        )
+        _ = temporary_file.replace(self.cache_file)
+
+    def get(self, fingerprint: str | None) -> list[Any] | None:
+        if fingerprint is None:
+            return None
+        actions_data = self.fingerprint_to_actions_data.get(fingerprint)
+        if actions_data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.used_fingerprints.add(fingerprint)
+        return actions_data
+
+    def contains(self, fingerprint: str | None) -> bool:
+        return fingerprint in self.fingerprint_to_actions_data
+
+    def store(self, fingerprint: str | None, actions_data: list[Any]):
+        if fingerprint is None:
+            return
+        self.fingerprint_to_actions_data[fingerprint] = actions_data
+        self.used_fingerprints.add(fingerprint)
+
+    def fingerprint_of(
+        self, script: Script, project_globals_data: dict[str, Any]
+    ) -> str | None:
+        """
+        Returns:
+            str | None: fingerprint of the script's code and of every project global it references,
+                or None if the script can not be cached
+        """
+        if project_globals_data is not self._project_globals_data:
+            self._start_compile(project_globals_data)
+        build_actions_function = script.build_actions_function
+        # scripts are fingerprinted once per compile, when compiled in parallel and again when merged
+        fingerprinted_function = self._function_id_to_fingerprint.get(
+            id(build_actions_function)
+        )
+        if (
+            fingerprinted_function is not None
+            and fingerprinted_function[0] is build_actions_function
+        ):
+            return fingerprinted_function[1]
+        fingerprint = self._fingerprint_of_function(
+            build_actions_function, project_globals_data
+        )
+        self._function_id_to_fingerprint[id(build_actions_function)] = (
+            build_actions_function,
+            fingerprint,
+        )
+        return fingerprint
+
+    def _fingerprint_of_function(
+        self, build_actions_function: Any, project_globals_data: dict[str, Any]
+    ) -> str | None:
+        code = getattr(build_actions_function, "__code__", None)
+        if not isinstance(code, CodeType):
+            return None
+
+        hasher = hashlib.sha256()
+        hasher.update(_hash_of_code(code).encode())
+        # changes to the compiler itself invalidate every entry
+        hasher.update(self._hash_of_compiler().encode())
+
+        for name in sorted(names_referenced_by_code(code)):
+            if name not in project_globals_data:
+                continue
+            description = self._describe_global_value(project_globals_data[name])
+            if description is None:
+                return None
+            hasher.update(f"\0{name}\0{description}".encode())
+        return hasher.hexdigest()
+
+    def _start_compile(self, project_globals_data: dict[str, Any]):
+        """Forgets the descriptions of the previous compile, the project may have changed since"""
+        self._project_globals_data = project_globals_data
+        self._id_to_described_value.clear()
+        self._module_name_to_dependencies_hash.clear()
+        self._id_to_class_json.clear()
+        self._function_id_to_fingerprint.clear()
+        self._compiler_hash = None
+
+    def _hash_of_compiler(self) -> str:
+        """Returns the hash of every source file of the pymodd package"""
+        if self._compiler_hash is None:
+            hasher = hashlib.sha256()
+            for file_path in sorted(PYMODD_PACKAGE_DIRECTORY.rglob("*.py")):
+                hasher.update(
+                    f"{file_path.relative_to(PYMODD_PACKAGE_DIRECTORY).as_posix()}\0"
+                    f"{self._hash_of_file(str(file_path))}\0".encode()
+                )
+            self._compiler_hash = hasher.hexdigest()
+        return self._compiler_hash
+
+    def _describe_global_value(self, value: Any) -> str | None:
+        """Returns a deterministic description of a project global, or None if there is none. Descriptions are
+        kept until the next compile, so each global is only described once however many scripts use it
+        """
+        described_value = self._id_to_described_value.get(id(value))
+        if described_value is not None and described_value[0] is value:
+            return described_value[1]
+        description = self._description_of_global_value(value)
+        # the value is kept with its description so its id is not reused by another value
+        self._id_to_described_value[id(value)] = (value, description)
+        return description
+
+    def _description_of_global_value(self, value: Any) -> str | None:
+        if isinstance(value, type) and issubclass(value, Script):
+            # scripts are referenced through their keys
+            script_key = Script._class_to_key.get(value)
+            if script_key is None:
+                return None
+            return f"script:{script_key}"
+        if isinstance(value, ModuleType):
+            return (
+                f"module:{value.__name__}:{self._hash_of_dependencies(value.__name__)}"
+            )
+        if isinstance(value, type):
+            attributes_json = self._json_of_variable_class(value)
+            if attributes_json is None:
+                return None
+            return (
+                f"class:{value.__module__}.{value.__qualname__}:"
+                f"{self._hash_of_dependencies(value.__module__)}:{attributes_json}"
+            )
+        if callable(value) and hasattr(value, "__module__"):
+            return (
+                f"callable:{value.__module__}.{getattr(value, '__qualname__', '')}:"
+                f"{self._hash_of_dependencies(value.__module__)}"
+            )
+        if isinstance(value, Base):
+            try:
+                return (
+                    f"value:{json.dumps(to_dict(value), sort_keys=True, default=str)}"
+                )
+            except (TypeError, ValueError):
+                return None
+        if isinstance(value, (str, int, float, bool, type(None), tuple, list, dict)):
+            return f"value:{value!r}"
+        return None
+
+    def _hash_of_dependencies(self, module_name: str | None) -> str:
+        """
+        Returns:
+            str: hash of the module and of every project module it imports, directly or through other project modules.
+                Variable classes of those modules are hashed by their variables, as they may be made from tables
+                (helpers.get_ai() returning Variable.AI changes when the variable does)
+        """
+        module_name = module_name or ""
+        if (
+            dependencies_hash := self._module_name_to_dependencies_hash.get(module_name)
+        ) is not None:
+            return dependencies_hash
+
+        hasher = hashlib.sha256()
+        module_names_to_visit = [module_name]
+        visited_module_names = {module_name}
+        dependency_lines: list[str] = []
+        while module_names_to_visit:
+            module = sys.modules.get(module_names_to_visit.pop())
+            module_file = getattr(module, "__file__", None)
+            if module is None or module_file is None:
+                continue
+            dependency_lines.append(
+                f"{module.__name__}:{self._hash_of_file(module_file)}"
+            )
+            if not self._is_project_file(module_file):
+                continue
+            # values imported with `from module import NAME` do not know the module they came from
+            for dependency_module_name in self._imported_module_names_of(module):
+                if dependency_module_name not in visited_module_names:
+                    visited_module_names.add(dependency_module_name)
+                    module_names_to_visit.append(dependency_module_name)
+            for global_value in list(vars(module).values()):
+                if isinstance(global_value, ModuleType):
+                    dependency_module_name = global_value.__name__
+                else:
+                    dependency_module_name = getattr(global_value, "__module__", None)
+                    if (
+                        isinstance(global_value, type)
+                        and not issubclass(global_value, Script)
+                        and (
+                            attributes_json := self._json_of_variable_class(
+                                global_value
+                            )
+                        )
+                        not in (None, "{}")
+                    ):
+                        dependency_lines.append(
+                            f"{dependency_module_name}.{global_value.__qualname__}:{attributes_json}"
+                        )
+                if (
+                    isinstance(dependency_module_name, str)
+                    and dependency_module_name not in visited_module_names
+                ):
+                    visited_module_names.add(dependency_module_name)
+                    module_names_to_visit.append(dependency_module_name)
+        for dependency_line in sorted(dependency_lines):
+            hasher.update(f"{dependency_line}\0".encode())
+        dependencies_hash = self._module_name_to_dependencies_hash[module_name] = (
+            hasher.hexdigest()
+        )
+        return dependencies_hash
+
+    def _json_of_variable_class(self, variable_class: type) -> str | None:
+        described_class = self._id_to_class_json.get(id(variable_class))
+        if described_class is None or described_class[0] is not variable_class:
+            described_class = self._id_to_class_json[id(variable_class)] = (
+                variable_class,
+                json_of_variable_class(variable_class),
+            )
+        return described_class[1]
+
+    def _imported_module_names_of(self, module: ModuleType) -> list[str]:
+        """Returns the names of the modules imported anywhere in the module's source, and of the submodules that may be
+        imported from them"""
+        module_file: str = module.__file__ or ""
+        try:
+            file_stat = Path(module_file).stat()
+        except OSError:
+            return []
+        file_state = (module_file, file_stat.st_mtime_ns, file_stat.st_size)
+        if (
+            imported_module_names := self._file_state_to_imported_module_names.get(
+                file_state
+            )
+        ) is not None:
+            return imported_module_names
+        try:
+            module_tree = ast.parse(Path(module_file).read_bytes())
+        except (OSError, SyntaxError, ValueError):
+            module_tree = ast.Module(body=[], type_ignores=[])
+        imported_module_names = []
+        for node in ast.walk(module_tree):
+            if isinstance(node, ast.Import):
+                imported_module_names += [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                try:
+                    imported_module_name = importlib.util.resolve_name(
+                        "." * node.level + (node.module or ""), module.__package__
+                    )
+                except (ImportError, ValueError):
+                    continue
+                imported_module_names.append(imported_module_name)
+                imported_module_names += [
+                    f"{imported_module_name}.{alias.name}"
+                    for alias in node.names
+                    if alias.name != "*"
+                ]
+        self._file_state_to_imported_module_names[file_state] = imported_module_names
+        return imported_module_names
+
+    def _is_project_file(self, file_path: str) -> bool:
+        """Returns whether the file is one of the project's modules, and not of pymodd or an installed package"""
+        path = Path(file_path).absolute()
+        return (
+            path.is_relative_to(self.project_directory)
+            and not path.is_relative_to(PYMODD_PACKAGE_DIRECTORY)
+            and "site-packages" not in path.parts
+        )
+
+    def _hash_of_file(self, file_path: str) -> str:
+        try:
+            file_stat = Path(file_path).stat()
+        except OSError:
+            return ""
+        file_state = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+        if (file_hash := self._file_state_to_hash.get(file_state)) is None:
+            file_hash = hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+            self._file_state_to_hash[file_state] = file_hash
+        return file_hash
+
+
+def json_of_variable_class(variable_class: type) -> str | None:
+    """Returns the JSON of the variables of a variable class (Variable, UnitType...), as they may hold generated ids"""
+    attributes_data = {
+        attribute_name: to_dict(attribute_value)
+        for attribute_name, attribute_value in vars(variable_class).items()
+        if isinstance(attribute_value, Base)
+    }
+    try:
+        return json.dumps(attributes_data, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+
+
+def _hash_of_code(code: CodeType) -> str:
+    """Returns a hash of what the code does, which unlike its source does not need to be read from its file.
+    Line numbers are left out, so moving a script does not change it"""
+    hasher = hashlib.sha256(sys.version.encode())
+    _update_hasher_with_code(hasher, code)
+    return hasher.hexdigest()
+
+
+def _update_hasher_with_code(hasher: Any, code: CodeType):
+    hasher.update(code.co_code)
+    hasher.update(getattr(code, "co_exceptiontable", b""))
+    hasher.update(
+        repr(
+            (
+                code.co_argcount,
+                code.co_posonlyargcount,
+                code.co_kwonlyargcount,
+                code.co_flags,
+                code.co_names,
+                code.co_varnames,
+                code.co_freevars,
+                code.co_cellvars,
+            )
+        ).encode()
+    )
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            hasher.update(b"\0code\0")
+            _update_hasher_with_code(hasher, constant)
+        elif isinstance(constant, frozenset):
+            # the order of sets changes between processes
+            hasher.update(f"\0{sorted(map(repr, constant))!r}".encode())
+        else:
+            hasher.update(f"\0{constant!r}".encode())
+
+
+def names_referenced_by_code(code: CodeType) -> set[str]:
+    """Returns every global and attribute name used by the code object and the code objects nested inside it"""
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            names |= names_referenced_by_code(constant)
+    return names
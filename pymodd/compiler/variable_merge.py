@@ -0,0 +1,170 @@
+from __future__ import annotations
+from typing import Any
+
+from pymodd.variable.data_path import DataPath
+from pymodd.variable.variable_type import VariableType
+
+# marks a value that is missing from the game data
+_MISSING = object()
+
+# ids of each change listed by print_report
+PRINTED_IDS_COUNT = 10
+
+
+class VariableMergeReport:
+    """Variables added, updated, and removed in each category of the game data by a merge"""
+
+    def __init__(self):
+        self.category_to_added_ids: dict[str, list[str]] = {}
+        self.category_to_updated_ids: dict[str, list[str]] = {}
+        self.category_to_removed_ids: dict[str, list[str]] = {}
+
+    def is_empty(self) -> bool:
+        return not any(
+            len(ids) > 0
+            for category_to_ids in [
+                self.category_to_added_ids,
+                self.category_to_updated_ids,
+                self.category_to_removed_ids,
+            ]
+            for ids in category_to_ids.values()
+        )
+
+    def to_dict(self) -> dict[str, dict[str, list[str]]]:
+        """
+        Returns:
+            dict(str, dict(str, list[str])): ids of the added, updated, and removed variables of each changed category
+        """
+        categories = dict.fromkeys(
+            [
+                *self.category_to_added_ids,
+                *self.category_to_updated_ids,
+                *self.category_to_removed_ids,
+            ]
+        )
+        report_data: dict[str, dict[str, list[str]]] = {}
+        for category in categories:
+            changes = {
+                "added": self.category_to_added_ids.get(category, []),
+                "updated": self.category_to_updated_ids.get(category, []),
+                "removed": self.category_to_removed_ids.get(category, []),
+            }
+            if any(len(ids) > 0 for ids in changes.values()):
+                report_data[category] = changes
+        return report_data
+
+    def print_report(self):
+        print("\nvariable changes:")
+        if self.is_empty():
+            print("  none")
+            return
+        for category, changes in self.to_dict().items():
+            print(f"  {category}:")
+            for change, ids in changes.items():
+                if len(ids) > 0:
+                    listed_ids = ", ".join(ids[:PRINTED_IDS_COUNT])
+                    if len(ids) > PRINTED_IDS_COUNT:
+                        listed_ids += f", and {len(ids) - PRINTED_IDS_COUNT} more"
+                    print(f"    {change} ({len(ids)}): {listed_ids}")
+
+
+def merge_variables_into_game_data(
+    categories_data: dict[str, Any],
+    category_to_variables: dict[str, list[VariableType]],
+    report: VariableMergeReport | None = None,
+):
+    """Updates the categories of the game data with the variables in linear time.
+    Variables that already exist keep their data with the user provided values applied, new ones
+    are created from their templates, and variables of a category that are no longer included are removed
+
+    Args:
+        categories_data (dict): the "data" of the game json, edited in place
+
+        category_to_variables (dict(str, list[VariableType])): variables of each category
+
+        report (VariableMergeReport | None, optional): records the changes when given. Defaults to None.
+    """
+    for category, variables in category_to_variables.items():
+        # skip categories that do not exist (TODO: check what to do about REGIONS)
+        if category not in categories_data:
+            continue
+        category_data: dict[str, Any] = categories_data[category]
+        added_ids: list[str] = []
+        updated_ids: list[str] = []
+        variables_and_datas: list[tuple[VariableType, dict[str, Any]]] = []
+        for variable in variables:
+            old_variable_data = category_data.get(variable.id)
+            if old_variable_data is None:
+                added_ids.append(variable.id)
+                variable_data = variable.get_template_data()
+            else:
+                if report is not None and _changes_data(variable, old_variable_data):
+                    updated_ids.append(variable.id)
+                variable_data = old_variable_data
+            category_data[variable.id] = variable_data
+            variables_and_datas.append((variable, variable_data))
+        _apply_user_provided_values(variables_and_datas)
+
+        # remove variables no longer included
+        included_ids = {variable.id for variable in variables}
+        removed_ids = [
+            variable_id
+            for variable_id in category_data.keys()
+            if variable_id not in included_ids
+        ]
+        for removed_id in removed_ids:
+            category_data.pop(removed_id)
+
+        if report is not None:
+            report.category_to_added_ids[category] = added_ids
+            report.category_to_updated_ids[category] = updated_ids
+            report.category_to_removed_ids[category] = removed_ids
+
+
+def _apply_user_provided_values(
+    variables_and_datas: list[tuple[VariableType, dict[str, Any]]]
+):
+    """Applies the user provided values of the variables to their datas in bulk.
+    Variables setting the same paths are grouped, and each path is applied to the whole group at once
+    """
+    paths_to_datas_and_values: dict[
+        tuple[DataPath, ...], tuple[list[dict[str, Any]], list[list[Any]]]
+    ] = {}
+    for variable, variable_data in variables_and_datas:
+        if (
+            type(variable).updated_data_with_user_provided_values
+            is not VariableType.updated_data_with_user_provided_values
+        ):
+            # variables with their own way of applying values are updated one by one
+            _ = variable.updated_data_with_user_provided_values(variable_data)
+            continue
+        paths = tuple(variable.data_path_to_new_value)
+        if len(paths) == 0:
+            continue
+        if (datas_and_values := paths_to_datas_and_values.get(paths)) is None:
+            datas_and_values = paths_to_datas_and_values[paths] = (
+                [],
+                [[] for _ in paths],
+            )
+        datas, values_of_paths = datas_and_values
+        datas.append(variable_data)
+        for values, new_value in zip(
+            values_of_paths, variable.data_path_to_new_value.values()
+        ):
+            values.append(new_value)
+
+    for paths, (datas, values_of_paths) in paths_to_datas_and_values.items():
+        for path, values in zip(paths, values_of_paths):
+            path.set_in_each(datas, values)
+
+
+def _changes_data(variable: VariableType, variable_data: dict[str, Any]) -> bool:
+    """
+    Returns:
+        bool: whether any of the variable's user provided values differs from the value in its data
+    """
+    for path, new_value in variable.data_path_to_new_value.items():
+        value = path.get(variable_data, _MISSING)
+        if value is _MISSING or value != new_value:
+            return True
+    return False
@@ -1,13 +1,38 @@
 import sys
 import json
 import runpy
+import time
+import traceback
 from pathlib import Path
 from argparse import ArgumentParser
-from typing import Any, Type, TypeVar
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Type, TypeVar
 
 from pymodd import _pymodd_helper
-from pymodd.game import Game
+from pymodd.game import (
+    EDITED_GAME_DATA_CATEGORIES,
+    Game,
+    copy_of_game_data,
+    load_game_data,
+)
 from pymodd.entity_script import EntityScripts
+from pymodd.core.script import Script
+from pymodd.compiler.script_cache import ScriptCompileCache
+from pymodd.compiler.process_pool import ScriptCompilePool
+from pymodd.compiler.project_watcher import ProjectWatcher
+from pymodd.compiler.project_isolation import isolated_project
+from pymodd.compiler.json_writer import COMPRESSION_TO_FILE_SUFFIX, write_json
+from pymodd.compiler.output_manifest import game_data_manifest
+from pymodd.compiler.json_patch import apply_json_patch, game_data_patch
+from pymodd.compiler.project_scripts import (
+    find_script_classes_of_project,
+    load_script_positions,
+    save_script_positions,
+    use_script_keys,
+    ScriptPositionNotStoredError,
+)
+from pymodd.compiler import compile_profiler
+from pymodd.compiler.compile_profiler import CompileProfiler, profile_phase
 
 
 # make sure game_variables.py contain classes with these names
@@ -33,6 +58,9 @@ VARIABLE_TYPE_CLASS_NAMES = [
     "Sound",
 ]
 
+# directory inside the project where compiled scripts are cached
+SCRIPT_COMPILE_CACHE_DIRECTORY = ".pymodd_cache"
+
 
 def generate_project(args):
     json_file = Path(args.json_file_path)
@@ -45,6 +73,34 @@ def generate_project(args):
     _pymodd_helper.generate_project_from_json_file_content(json_file.read_text())
 
 
+def apply_patch(args):
+    game_json_file = Path(args.game_json_file)
+    patch_file = Path(args.patch_file)
+    for file in [game_json_file, patch_file]:
+        if not Path.exists(file):
+            _pymodd_helper.log_error(f"{file} file not found")
+            return
+
+    _pymodd_helper.log_cli_start_message("Patching", Path.cwd().name)
+    game_data = load_game_data(str(game_json_file))
+    try:
+        game_data = apply_json_patch(game_data, json.loads(patch_file.read_text()))
+    except ValueError as error:
+        _pymodd_helper.log_error(f"invalid patch: {error}")
+        _pymodd_helper.log_cli_end_message("patching", False)
+        return
+
+    output_file = Path(
+        args.output
+        if args.output is not None
+        else f"output/{game_data.get('title')}.json"
+    )
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    write_json(game_data, output_file, compact=args.compact)
+    _pymodd_helper.log_success(f"{output_file} written")
+    _pymodd_helper.log_cli_end_message("patching", True)
+
+
 def compile_project(args):
     required_files = [Path("mapping.py")]
     for file in required_files:
@@ -55,88 +111,376 @@ def compile_project(args):
             return
 
     sys.path.append(str(Path.cwd().absolute()))
-    project_data = runpy.run_path("mapping.py")
+    if args.watch:
+        watch_project(args)
+        return
+    script_compile_cache = (
+        ScriptCompileCache(SCRIPT_COMPILE_CACHE_DIRECTORY) if not args.no_cache else None
+    )
+    is_successful = compile_project_once(args, script_compile_cache)
+    _pymodd_helper.log_cli_end_message("compilation", is_successful)
+
+
+def compile_all_projects(args):
+    project_directories = [
+        Path(directory).absolute() for directory in args.project_directories
+    ]
+    # options of compile that only apply to a single project
+    args.only_scripts, args.lazy, args.watch = None, False, False
+
+    start_time = time.perf_counter()
+    if args.workers > 1:
+        # projects are compiled in parallel instead of their scripts
+        args.jobs = 1
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            results = list(
+                executor.map(
+                    compile_project_in_directory,
+                    project_directories,
+                    [args] * len(project_directories),
+                )
+            )
+    else:
+        results = [
+            compile_project_in_directory(project_directory, args)
+            for project_directory in project_directories
+        ]
+    total_seconds = time.perf_counter() - start_time
+
+    print(
+        f"\ncompiled {len(project_directories)} projects in {total_seconds:.2f} s "
+        f"({sum(seconds for _, seconds in results):.2f} s compiling projects):"
+    )
+    for project_directory, (is_successful, seconds) in zip(
+        project_directories, results
+    ):
+        print(
+            f"  {project_directory.name:<28}{seconds:>8.2f} s"
+            + ("" if is_successful else "  failed")
+        )
+    _pymodd_helper.log_cli_end_message(
+        "compilation of every project",
+        all(is_successful for is_successful, _ in results),
+    )
+
+
+def compile_project_in_directory(
+    project_directory: Path, args
+) -> tuple[bool, float]:
+    """Compiles the project isolated from the other projects compiled in this process
+
+    Returns:
+        tuple(bool, float): whether the compilation was successful and the seconds it took
+    """
+    start_time = time.perf_counter()
+    if not project_directory.joinpath("mapping.py").exists():
+        _pymodd_helper.log_error(
+            f"mapping.py file not found: is {project_directory} a pymodd project?"
+        )
+        return False, time.perf_counter() - start_time
+
+    is_successful = False
+    try:
+        with isolated_project(project_directory):
+            script_compile_cache = (
+                ScriptCompileCache(SCRIPT_COMPILE_CACHE_DIRECTORY)
+                if not args.no_cache
+                else None
+            )
+            is_successful = compile_project_once(args, script_compile_cache)
+    except SystemExit:
+        # compile errors are logged before exiting
+        pass
+    except Exception:
+        traceback.print_exc()
+    _pymodd_helper.log_cli_end_message("compilation", is_successful)
+    return is_successful, time.perf_counter() - start_time
+
+
+def watch_project(args):
+    """Compiles the project every time one of its files change, keeping the loaded game and compiled scripts in memory"""
+    project_watcher = ProjectWatcher(Path.cwd())
+    # the cache is kept in memory between compiles, so only changed scripts are compiled again
+    script_compile_cache = ScriptCompileCache(
+        SCRIPT_COMPILE_CACHE_DIRECTORY if not args.no_cache else None
+    )
+    game_json_file = Path("utils/game.json")
+    game_data = load_game_data(str(game_json_file))
+    while True:
+        try:
+            is_successful = compile_project_once(
+                args, script_compile_cache, copy_of_game_data(game_data)
+            )
+            _pymodd_helper.log_cli_end_message("compilation", is_successful)
+        except SystemExit:
+            # compile errors are logged before exiting
+            _pymodd_helper.log_cli_end_message("compilation", False)
+        except Exception:
+            traceback.print_exc()
+            _pymodd_helper.log_cli_end_message("compilation", False)
+
+        print("watching for changes, press ctrl+c to stop...")
+        try:
+            changed_files = project_watcher.wait_for_changes()
+        except KeyboardInterrupt:
+            return
+        if game_json_file.absolute() in changed_files:
+            game_data = load_game_data(str(game_json_file))
+        project_watcher.unload_project_modules()
+
+
+def compile_project_once(
+    args,
+    script_compile_cache: ScriptCompileCache | None,
+    game_data: dict[str, Any] | None = None,
+) -> bool:
+    """
+    Returns:
+        bool: whether the compilation was successful
+    """
+    if args.profile or args.profile_json is not None:
+        compile_profiler.active_profiler = CompileProfiler()
+    with profile_phase("runpy mapping.py"):
+        project_data = runpy.run_path("mapping.py")
+
+    compiles_only_scripts = args.only_scripts is not None and len(args.only_scripts) > 0
+    if compiles_only_scripts and args.lazy:
+        # compile the scripts without building the game or loading its json file
+        try:
+            is_successful = compile_scripts_individually(
+                args,
+                project_data,
+                script_compile_cache,
+                lazy_script_finder_of_project(project_data),
+            )
+        except ScriptPositionNotStoredError as error:
+            # the script would be written with another key and order than a full compile gives it
+            _pymodd_helper.log_error(str(error))
+            is_successful = False
+        finish_compile(args, script_compile_cache)
+        return is_successful
 
     game_classes = find_game_classes_in_project_data(project_data)
     if len(game_classes) == 0:
         _pymodd_helper.log_error(
             "no class subclassing Game was found in mapping.py, one is required"
         )
-        return
+        return False
     if len(game_classes) > 1:
         _pymodd_helper.log_error(
             "more than one class subclassing Game was found in mapping.py, only one is required"
         )
-        return
+        return False
 
     variable_classes = find_variable_classes_in_project_data(project_data)
-    game = game_classes[0]("utils/game.json", variable_classes, project_data)
-
-    # create output directory
-    Path("output/").mkdir(parents=True, exist_ok=True)
+    game = game_classes[0](
+        "utils/game.json", variable_classes, project_data, game_data
+    )
+    game.script_compile_cache = script_compile_cache
+    game.optimizes_actions = args.optimize
+    if args.jobs > 1 and not ScriptCompilePool.is_supported():
+        # workers must share the loaded project, ids generated for variables differ between imports of it
+        print("--jobs needs processes to be forked on this platform, compiling scripts in one process")
+    elif args.jobs > 1:
+        if game.script_compile_cache is None:
+            # results of the workers are passed back through the cache
+            game.script_compile_cache = ScriptCompileCache()
+        game.script_compile_pool = ScriptCompilePool(args.jobs, Path.cwd())
 
-    project_directory_name = Path.cwd().name
     is_successful = True
-
-    if args.only_scripts is None or len(args.only_scripts) == 0:
+    if not compiles_only_scripts:
         # compile project if no scripts are given
-        _pymodd_helper.log_cli_start_message("Compiling", project_directory_name)
-        compiled_json_file = Path(f"output/{game.name}.json")
-        compiled_json_file.write_text(json.dumps(game.to_dict(), indent=4))
+        Path("output/").mkdir(parents=True, exist_ok=True)
+        _pymodd_helper.log_cli_start_message("Compiling", Path.cwd().name)
+        with profile_phase("compile scripts (to_dict)"):
+            game_data = game.to_dict()
+        if args.emit_patch:
+            # the game data was edited while compiling, so the stored game is loaded again
+            with profile_phase("json patch"):
+                patch = game_data_patch(
+                    load_game_data("utils/game.json"),
+                    game_data,
+                    EDITED_GAME_DATA_CATEGORIES,
+                )
+            output_data, compiled_json_file_name = patch, f"{game.name}.patch.json"
+        else:
+            output_data, compiled_json_file_name = game_data, f"{game.name}.json"
+        if args.compress is not None:
+            compiled_json_file_name += COMPRESSION_TO_FILE_SUFFIX[args.compress]
+        compiled_json_file = Path("output", compiled_json_file_name)
+        with profile_phase("write output"):
+            write_json(
+                output_data,
+                compiled_json_file,
+                compact=args.compact,
+                compression=args.compress,
+            )
         _pymodd_helper.log_success(f"{compiled_json_file} written")
+        if args.manifest:
+            manifest_file = Path(f"output/{game.name}.manifest.json")
+            with profile_phase("manifest"):
+                manifest = game_data_manifest(game_data, EDITED_GAME_DATA_CATEGORIES)
+            _ = manifest_file.write_text(json.dumps(manifest, indent=4))
+            _pymodd_helper.log_success(f"{manifest_file} written")
+        if args.variable_changes:
+            game.variable_merge_report.print_report()
+        # lets --lazy compiles place scripts the same way without building the game
+        save_script_positions(SCRIPT_COMPILE_CACHE_DIRECTORY, game.all_scripts())
     else:
-        # compile scripts individually if they are provided
-        _pymodd_helper.log_cli_start_message(
-            "Compiling scripts for", project_directory_name
+
+        def find_script(entity_id: str | None, script_name: str) -> Script | None:
+            if entity_id is None:
+                return game.find_script(script_name)
+            for entity_script in game.entity_scripts:
+                if entity_id == entity_script.entity_type.id:
+                    return entity_script.find_script(script_name)
+            return None
+
+        is_successful = compile_scripts_individually(
+            args, game.project_globals_data, game.script_compile_cache, find_script
         )
 
-        for script_info in args.only_scripts:
-            script_info = script_info.split("/")
+    if game.script_compile_pool is not None:
+        game.script_compile_pool.shutdown()
+    finish_compile(args, game.script_compile_cache)
+    return is_successful
 
-            if len(script_info) not in range(2, 4):
-                is_successful = False
-                _pymodd_helper.log_error(
-                    "script must be provided in the format: `folder_id/script_function_name` or `entity_id/folder_id/script_function_name"
-                )
-                continue
-
-            script_data = None
-            output_file_name = None
-            if len(script_info) == 2:
-                # global scripts
-                [script_parent_id, script_function_name] = script_info
-                script_data = game.find_script(script_function_name.replace("_", " "))
-                output_file_name = script_function_name
-            else:
-                # entity scripts
-                [entity_id, script_parent_id, script_function_name] = script_info
-                for entity_script in game.entity_scripts:
-                    if entity_id != entity_script.entity_type.id:
-                        continue
-                    script_data = entity_script.find_script(
-                        script_function_name.replace("_", " ")
-                    )
-                    break
-                output_file_name = f"{entity_id}-{script_function_name}"
-
-            if script_data is None:
-                _pymodd_helper.log_error(
-                    f"{script_function_name} script does not exist"
-                )
-                is_successful = False
-                continue
 
-            script_data = script_data.to_dict(
-                project_globals_data=game.project_globals_data
+def compile_scripts_individually(
+    args,
+    project_globals_data: dict[str, Any],
+    script_compile_cache: ScriptCompileCache | None,
+    find_script: Callable[[str | None, str], Script | None],
+) -> bool:
+    """Compiles the scripts given with --only-scripts into their own json files
+
+    Args:
+        find_script (Callable): returns the script with the name, of the entity with the id or a global script when the id is None
+
+    Returns:
+        bool: whether every script was compiled
+    """
+    Path("output/").mkdir(parents=True, exist_ok=True)
+    _pymodd_helper.log_cli_start_message("Compiling scripts for", Path.cwd().name)
+    is_successful = True
+    for script_info in args.only_scripts:
+        script_info = script_info.split("/")
+
+        if len(script_info) not in range(2, 4):
+            is_successful = False
+            _pymodd_helper.log_error(
+                "script must be provided in the format: `folder_id/script_function_name` or `entity_id/folder_id/script_function_name"
             )
-            script_data["parent"] = script_parent_id
+            continue
+
+        script_data = None
+        output_file_name = None
+        if len(script_info) == 2:
+            # global scripts
+            [script_parent_id, script_function_name] = script_info
+            script_data = find_script(None, script_function_name.replace("_", " "))
+            output_file_name = script_function_name
+        else:
+            # entity scripts
+            [entity_id, script_parent_id, script_function_name] = script_info
+            script_data = find_script(
+                entity_id, script_function_name.replace("_", " ")
+            )
+            output_file_name = f"{entity_id}-{script_function_name}"
 
-            # write data
-            compiled_script_json_file = Path(f"output/{output_file_name}.json")
-            _ = compiled_script_json_file.write_text(json.dumps(script_data))
-            _pymodd_helper.log_success(f"{compiled_script_json_file} written")
+        if script_data is None:
+            _pymodd_helper.log_error(f"{script_function_name} script does not exist")
+            is_successful = False
+            continue
 
-    _pymodd_helper.log_cli_end_message("compilation", is_successful)
+        with profile_phase("compile scripts (to_dict)"):
+            script_data = script_data.to_dict(
+                project_globals_data=project_globals_data,
+                compile_cache=script_compile_cache,
+                optimizes_actions=args.optimize,
+            )
+        script_data["parent"] = script_parent_id
+
+        # write data
+        compiled_script_json_file = Path(f"output/{output_file_name}.json")
+        _ = compiled_script_json_file.write_text(json.dumps(script_data))
+        _pymodd_helper.log_success(f"{compiled_script_json_file} written")
+    return is_successful
+
+
+def lazy_script_finder_of_project(
+    project_data: dict[str, Any],
+) -> Callable[[str | None, str], Script | None]:
+    """
+    Returns:
+        Callable: finds scripts without building the game, only the entity scripts searched are built.
+            Raises ScriptPositionNotStoredError for scripts whose positions were not stored by a full compile
+    """
+    identity_to_script_class = find_script_classes_of_project(project_data, Path.cwd())
+    # positions stored by the last full compile, they come from building the game otherwise
+    identity_to_position = load_script_positions(SCRIPT_COMPILE_CACHE_DIRECTORY)
+    use_script_keys(
+        identity_to_script_class,
+        {
+            identity: position["key"]
+            for identity, position in identity_to_position.items()
+        },
+    )
+    global_script_classes: list[type[Script]] = [
+        value
+        for value in project_data.values()
+        if isinstance(value, type) and issubclass(value, Script)
+    ]
+    entity_scripts_classes: list[type[EntityScripts]] = [
+        value
+        for value in project_data.values()
+        if isinstance(value, type)
+        and issubclass(value, EntityScripts)
+        and value != EntityScripts
+    ]
+
+    def positioned(script: Script | None) -> Script | None:
+        if script is None:
+            return None
+        position = identity_to_position.get(str(script.identity))
+        if position is None:
+            raise ScriptPositionNotStoredError(script.identity)
+        script.order = position["order"]
+        return script
+
+    def find_script(entity_id: str | None, script_name: str) -> Script | None:
+        if entity_id is None:
+            for script_class in global_script_classes:
+                if script_class.default_name == script_name:
+                    return positioned(script_class())
+            return None
+        for entity_scripts_class in entity_scripts_classes:
+            entity_scripts = entity_scripts_class()
+            if (
+                entity_scripts.entity_type is not None
+                and entity_scripts.entity_type.id == entity_id
+            ):
+                return positioned(entity_scripts.find_script(script_name))
+        return None
+
+    return find_script
+
+
+def finish_compile(args, script_compile_cache: ScriptCompileCache | None):
+    """Saves the compile cache and reports the compile profile"""
+    if script_compile_cache is not None:
+        script_compile_cache.save(
+            drop_unused_entries=args.only_scripts is None or len(args.only_scripts) == 0
+        )
+    if (profiler := compile_profiler.active_profiler) is not None:
+        compile_profiler.active_profiler = None
+        if args.profile:
+            profiler.print_report(args.profile_top)
+        if args.profile_json is not None:
+            _ = Path(args.profile_json).write_text(
+                json.dumps(profiler.to_dict(args.profile_top), indent=4)
+            )
+            _pymodd_helper.log_success(f"{args.profile_json} written")
 
 
 def find_game_classes_in_project_data(project_data: dict[str, Any]) -> list[Type[Game]]:
@@ -166,12 +510,75 @@ def find_variable_classes_in_project_data(project_data: dict[str, Any]) -> list[
     )
 
 
+def add_compile_arguments(parser: ArgumentParser):
+    """Adds the options shared by compile and compile-all"""
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"compile every script again instead of reusing the compiled scripts stored in `{SCRIPT_COMPILE_CACHE_DIRECTORY}/`",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="number of worker processes to compile scripts with. defaults to 1",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=list(COMPRESSION_TO_FILE_SUFFIX),
+        help="compress the compiled game, zstd requires the zstandard package",
+    )
+    parser.add_argument(
+        "--manifest",
+        action="store_true",
+        help="write a manifest with the sha256 of the scripts, of each entity type, and of each variable category",
+    )
+    parser.add_argument(
+        "--emit-patch",
+        action="store_true",
+        help="write an RFC 6902 json patch of the changes to utils/game.json instead of the whole compiled game",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="write the compiled game without indentation, uses orjson if it is installed",
+    )
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="fold calculations of constants and remove branches of conditions known while compiling from the compiled scripts",
+    )
+    parser.add_argument(
+        "--variable-changes",
+        action="store_true",
+        help="print the variables added, updated, and removed from the game",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print the time spent in each compile phase and the slowest scripts",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="FILE",
+        help="write the time spent in each compile phase and the slowest scripts to a json file",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="number of slowest scripts to include in the profile. defaults to 10",
+    )
+
+
 def main_cli():
     parser = ArgumentParser(prog="pymodd")
     parser.set_defaults(func=lambda _: parser.print_help())
     subparsers = parser.add_subparsers(
         title="subcommands",
-        description="generate-project, compile",
+        description="generate-project, compile, compile-all, apply-patch",
         metavar="",
         required=True,
     )
@@ -199,8 +606,62 @@ def main_cli():
             for entity scripts provide the entity_id/script_folder_id/script_function_name: `2Di32W/K3Gd92/drop_item`.
             will NOT compile the entire game""",
     )
+    parser_compile.add_argument(
+        "--lazy",
+        action="store_true",
+        help="with --only-scripts, compile the scripts without building the game or loading utils/game.json",
+    )
+    parser_compile.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running and compile again whenever a file of the project changes",
+    )
+    add_compile_arguments(parser_compile)
     parser_compile.set_defaults(func=compile_project)
 
+    parser_compile_all = subparsers.add_parser(
+        "compile-all",
+        description="Compile many pymodd projects in one process, each one isolated from the others",
+    )
+    parser_compile_all.add_argument(
+        "project_directories",
+        nargs="+",
+        help="the directories of the pymodd projects to compile",
+    )
+    parser_compile_all.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="number of worker processes to compile projects with, scripts of each project are then compiled in one process. defaults to 1",
+    )
+    add_compile_arguments(parser_compile_all)
+    parser_compile_all.set_defaults(func=compile_all_projects)
+
+    parser_apply_patch = subparsers.add_parser(
+        "apply-patch",
+        description="Apply a patch written by `pymodd compile --emit-patch` to a modd.io json file",
+    )
+    parser_apply_patch.add_argument(
+        "patch_file", type=str, help="the path of the patch json file"
+    )
+    parser_apply_patch.add_argument(
+        "--game-json-file",
+        default="utils/game.json",
+        help="the modd.io json file to apply the patch to. defaults to utils/game.json",
+    )
+    parser_apply_patch.add_argument(
+        "--output",
+        "-o",
+        help="the path of the patched json file. defaults to output/<game title>.json",
+    )
+    parser_apply_patch.add_argument(
+        "--compact",
+        action="store_true",
+        help="write the patched game without indentation",
+    )
+    parser_apply_patch.set_defaults(func=apply_patch)
+
     args = parser.parse_args()
     args.func(args)
 
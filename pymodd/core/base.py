@@ -4,5 +4,7 @@ class Base:
     The to_dict function should be implemented to return a python dict in the Modd JSON schema
     """
 
+    __slots__ = ()
+
     def to_dict(self):
         raise NotImplementedError("to_dict method not implemented")
@@ -1,19 +1,35 @@
 from typing import override
-from pymodd.utils.generate_random_key import generate_random_key
+from pymodd.utils.generate_key_from_text import generate_key_from_text
 
 from .file import File
 
 
 class Folder(File):
+    # keys of folders that already exist in the game json file, each one is given to the first folder with the same name
+    _name_to_existing_key: dict[str, str] = {}
+
     def __init__(self, name: str, scripts: list[File]):
         super().__init__()
         self.name: str | None = name
-        self.key: str | None = generate_random_key()
+        # keys stay the same across compiles so unchanged folders produce the same output
+        existing_key = Folder._name_to_existing_key.pop(name, None)
+        self.key: str | None = (
+            existing_key
+            if existing_key is not None
+            else generate_key_from_text(
+                "/".join([name, *(str(script.key) for script in scripts)])
+            )
+        )
         self.scripts: list[File] = scripts
         # set position of scripts inside the folder
         for i, script in enumerate(scripts):
             script.set_position(i, self.key)
 
+    @staticmethod
+    def use_existing_keys(folder_name_to_key: dict[str, str]):
+        """Makes folders reuse the keys of the folders with the same names in the game json file"""
+        Folder._name_to_existing_key = dict(folder_name_to_key)
+
     @override
     def to_dict(self) -> dict[str, str | int | bool | None]:
         return {
@@ -1,19 +1,48 @@
+from types import MappingProxyType
 from typing import Any, override
 
 from pymodd.core.base import Base
+from pymodd.core.function_data_interner import interned_function_data
+from pymodd.utils.copy_json_data import copy_json_data
+
+# marks functions that have not been serialized yet
+_NOT_SERIALIZED = object()
 
 
 class Function(Base):
     """
     The base class for all functions in pymodd.
+    Functions can not be changed once they are serialized, their data is made once and shared by every use
     """
 
+    __slots__ = ("function", "options", "_data")
+
     def __init__(self):
         self.function: str | dict[str, Any] | None = None
-        self.options: dict[str, Any] = {}
+        self.options: dict[str, Any] | MappingProxyType[str, Any] = {}
 
     @override
     def to_dict(self):
+        """
+        Returns:
+            a copy of the data of the function, which can be edited
+        """
+        return copy_json_data(self.shared_data())
+
+    def shared_data(self) -> Any:
+        """
+        Returns:
+            the data of the function, made on the first call. it is shared by every use of the function and by identical
+            functions, the data of actions and scripts is built from it so it must never be edited
+        """
+        if (data := getattr(self, "_data", _NOT_SERIALIZED)) is _NOT_SERIALIZED:
+            data = self._data = self._serialize()
+            # the options can no longer be edited, the data made from them is kept
+            if type(self.options) is dict:
+                self.options = MappingProxyType(self.options)
+        return data
+
+    def _serialize(self) -> Any:
         # check for direct values (Number, Boolean, String)
         if type(self.function) is dict and self.function.get("direct"):
             return self.function.get("value")
@@ -21,7 +50,8 @@ class Function(Base):
         data = {"function": self.function}
         if self.options is not None:
             data.update(self.options)
-        return data
+        # identical functions share one dict
+        return interned_function_data(data)
 
     # removes lsp warnings
     def __gt__(self, other):
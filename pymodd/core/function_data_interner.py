@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import Any
+
+# interned datas kept before the table is cleared, so watch mode does not grow forever
+MAX_INTERNED_FUNCTION_DATAS = 100_000
+
+_key_to_function_data: dict[tuple[Any, ...], dict[str, Any]] = {}
+# interned datas by id, nested interned datas are keyed by their ids instead of their content
+_id_to_function_data: dict[int, dict[str, Any]] = {}
+
+_PRIMITIVE_TYPES = (str, int, bool, type(None))
+
+
+def interned_function_data(data: dict[str, Any]) -> dict[str, Any]:
+    """Hash-conses the data of a function, so identical functions (ThisEntity(), LastTriggeringPlayer()...)
+    share one dict in the compiled scripts, however many times they are used
+
+    Returns:
+        dict: the interned dict equal to the data, shared and never to be edited in place. the data itself
+        when it holds values that can not be compared (not JSON)
+    """
+    key = _key_of_value(data)
+    if key is None:
+        return data
+    if (function_data := _key_to_function_data.get(key)) is not None:
+        return function_data
+    if len(_key_to_function_data) >= MAX_INTERNED_FUNCTION_DATAS:
+        clear_interned_function_datas()
+    _key_to_function_data[key] = data
+    _id_to_function_data[id(data)] = data
+    return data
+
+
+def clear_interned_function_datas():
+    _key_to_function_data.clear()
+    _id_to_function_data.clear()
+
+
+def _key_of_value(value: Any) -> Any:
+    """
+    Returns:
+        Any: hashable key equal for values with the same JSON, or None if the value is not JSON
+    """
+    value_type = type(value)
+    if value_type in _PRIMITIVE_TYPES:
+        return (value_type, value)
+    if value_type is float:
+        # 0.0 and -0.0 are equal but written differently
+        return (float, repr(value))
+    if value_type is dict:
+        if _id_to_function_data.get(id(value)) is value:
+            return ("#", id(value))
+        items_key: list[Any] = ["{"]
+        for item_key, item_value in value.items():
+            if (item_value_key := _key_of_value(item_value)) is None:
+                return None
+            items_key.append((item_key, item_value_key))
+        return tuple(items_key)
+    if value_type is list:
+        values_key: list[Any] = ["["]
+        for item_value in value:
+            if (item_value_key := _key_of_value(item_value)) is None:
+                return None
+            values_key.append(item_value_key)
+        return tuple(values_key)
+    return None
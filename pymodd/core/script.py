@@ -1,5 +1,6 @@
 from typing import Any, override
 from pymodd.utils.generate_random_key import generate_random_key
+from pymodd.utils.generate_key_from_text import generate_key_from_text
 
 from .file import File
 
@@ -8,10 +9,16 @@ class Script(File):
     # this dict maps classes by calling id() (memory addresses)
     # this works because one new NewScript class is created for each @script decorator
     _class_to_key: dict[type, str] = {}
+    # keys of scripts that already exist in the game json file, each one is given to the first script with the same name
+    _name_to_existing_key: dict[str, str] = {}
+    # module and qualified name of the function that builds the script's actions, same across processes
+    identity: str | None = None
+    # name of the script, available before the script is instantiated
+    default_name: str | None = None
 
     def __new__(cls, *args, **kwargs):
         if cls._class_to_key.get(cls, None) is None:
-            cls._class_to_key[cls] = generate_random_key()
+            cls._class_to_key[cls] = Script._key_of_new_script_class(cls)
         return super(Script, cls).__new__(cls, *args, **kwargs)
 
     def __init__(self):
@@ -22,5 +29,27 @@ class Script(File):
         self.actions = []
         self.build_actions_function = lambda *args, **kwargs: None
 
-    def to_dict(self, project_globals_data: dict[str, Any] = {}):
+    def to_dict(
+        self,
+        project_globals_data: dict[str, Any] = {},
+        compile_cache: Any = None,
+        optimizes_actions: bool = False,
+    ):
         return super().to_dict()
+
+    @staticmethod
+    def use_existing_keys(script_name_to_key: dict[str, str]):
+        """Makes scripts reuse the keys of the scripts with the same names in the game json file"""
+        Script._name_to_existing_key = dict(script_name_to_key)
+
+    @staticmethod
+    def _key_of_new_script_class(script_class: type) -> str:
+        # keys stay the same across compiles so unchanged scripts produce the same output
+        existing_key = Script._name_to_existing_key.pop(
+            script_class.default_name or "", None
+        )
+        if existing_key is not None:
+            return existing_key
+        if script_class.identity is not None:
+            return generate_key_from_text(script_class.identity)
+        return generate_random_key()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+from collections import deque
+from typing import Any
+
+from .folder import Folder
+from .script import Script
+
+
+class ScriptIndex:
+    """
+    Index of the scripts and folders of a Game or EntityScripts, built with one breadth first walk
+    """
+
+    def __init__(self, files: list[Any]):
+        """
+        Args:
+            files (list): top level scripts and folders
+        """
+        # every script and folder, in breadth first order
+        self.files: list[Any] = []
+        self.scripts: list[Script] = []
+        self.name_to_script: dict[str, Script] = {}
+        self.key_to_script: dict[str, Script] = {}
+        # paths are the names of the parent folders and the script joined by "/"
+        self.path_to_script: dict[str, Script] = {}
+        self.key_to_folder: dict[str, Folder] = {}
+
+        files_queue: deque[tuple[Any, str]] = deque((file, "") for file in files)
+        while len(files_queue) > 0:
+            file, folder_path = files_queue.popleft()
+            self.files.append(file)
+            if isinstance((folder := file), Folder):
+                _ = self.key_to_folder.setdefault(str(folder.key), folder)
+                folder_path = f"{folder_path}{folder.name}/"
+                files_queue.extend((file, folder_path) for file in folder.scripts)
+            elif isinstance((script := file), Script):
+                self.scripts.append(script)
+                # the first script found is used when names repeat, like a breadth first search
+                _ = self.name_to_script.setdefault(str(script.name), script)
+                _ = self.key_to_script.setdefault(str(script.key), script)
+                _ = self.path_to_script.setdefault(
+                    f"{folder_path}{script.name}", script
+                )
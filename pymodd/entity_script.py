@@ -6,6 +6,7 @@ from typing import Any, override
 
 from pymodd.core.base import Base
 from pymodd.core.script import Script
+from pymodd.compiler.script_cache import ScriptCompileCache
 
 import pymodd.game
 import pymodd.variable_types
@@ -17,6 +18,10 @@ class EntityScripts(pymodd.game.Game):
         self.entity_type: pymodd.variable_types.UnitTypeBase | None = None
         self.keybindings: dict[Key, KeyBehavior] = {}
         self.scripts: list[Any] = []
+        self.script_compile_cache: ScriptCompileCache | None = None
+        self.optimizes_actions: bool = False
+        self.entity_scripts: list[Any] = []
+        self._script_index = None
         self._build()
         # set position of scripts inside entity_scripts
         for i, script in enumerate(self.scripts):
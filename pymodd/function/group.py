@@ -15,6 +15,8 @@ import pymodd.actions
 
 
 class Group(Function):
+    __slots__ = ()
+
     def _get_iterating_action(self):
         raise NotImplementedError("_get_iteration_object not implemented")
 
@@ -23,6 +25,8 @@ class Group(Function):
 
 
 class EntityGroup(Group):
+    __slots__ = ()
+
     @override
     def _get_iterating_action(self):
         return pymodd.actions.for_all_entities_in
@@ -33,6 +37,8 @@ class EntityGroup(Group):
 
 
 class UnitGroup(Group):
+    __slots__ = ()
+
     @override
     def _get_iterating_action(self):
         return pymodd.actions.for_all_units_in
@@ -43,6 +49,8 @@ class UnitGroup(Group):
 
 
 class ProjectileGroup(Group):
+    __slots__ = ()
+
     @override
     def _get_iterating_action(self):
         return pymodd.actions.for_all_projectiles_in
@@ -53,6 +61,8 @@ class ProjectileGroup(Group):
 
 
 class ItemGroup(Group):
+    __slots__ = ()
+
     @override
     def _get_iterating_action(self):
         return pymodd.actions.for_all_items_in
@@ -63,6 +73,8 @@ class ItemGroup(Group):
 
 
 class PlayerGroup(Group):
+    __slots__ = ()
+
     @override
     def _get_iterating_action(self):
         return pymodd.actions.for_all_players_in
@@ -73,6 +85,8 @@ class PlayerGroup(Group):
 
 
 class ItemTypeGroup(Group):
+    __slots__ = ()
+
     @override
     def _get_iterating_action(self):
         return pymodd.actions.for_all_item_types_in
@@ -83,6 +97,8 @@ class ItemTypeGroup(Group):
 
 
 class UnitTypeGroup(Group):
+    __slots__ = ()
+
     @override
     def _get_iterating_action(self):
         return pymodd.actions.for_all_unit_types_in
@@ -93,6 +109,8 @@ class UnitTypeGroup(Group):
 
 
 class DebrisGroup(Group):
+    __slots__ = ()
+
     @override
     def _get_iterating_action(self):
         return pymodd.actions.for_all_debris_in
@@ -103,6 +121,8 @@ class DebrisGroup(Group):
 
 
 class RegionGroup(Group):
+    __slots__ = ()
+
     @override
     def _get_iterating_action(self):
         return pymodd.actions.for_all_regions_in
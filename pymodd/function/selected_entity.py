@@ -5,60 +5,80 @@ import pymodd.variable_types
 
 
 class SelectedEntity(Entity):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "getSelectedEntity"
         self.options = {}
 
 
 class SelectedPlayer(Player):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "selectedPlayer"
         self.options = {}
 
 
 class SelectedUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "selectedUnit"
         self.options = {}
 
 
 class SelectedItem(Item):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "selectedItem"
         self.options = {}
 
 
 class SelectedProjectile(Projectile):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "selectedProjectile"
         self.options = {}
 
 
 class SelectedDebris(Debris):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "selectedDebris"
         self.options = {}
 
 
 class SelectedParticle(Particle):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "selectedParticle"
         self.options = {}
 
 
 class SelectedRegion(Region):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "selectedRegion"
         self.options = {}
 
 
 class SelectedUnitType(pymodd.variable_types.UnitTypeBase):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "selectedUnitType"
         self.options = {}
 
 
 class SelectedItemType(pymodd.variable_types.ItemTypeBase):
+    __slots__ = ()
+
     def __init__(self):  # pyright: ignore[reportMissingSuperCall]
         self.function: str | dict[str, Any] | None = "selectedItemType"
         self.options = {}
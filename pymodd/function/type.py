@@ -7,51 +7,71 @@ from pymodd.core.function import Function
 
 
 class Entity(Function):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Player(Entity):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Unit(Entity):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Projectile(Entity):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Item(Entity):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Debris(Entity):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Position(Function):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Attribute(Function):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Sensor(Function):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Number(Function):
+    __slots__ = ()
+
     def __init__(self, number: int):
         super().__init__()
         self.function = {
@@ -98,6 +118,8 @@ class Number(Function):
 
 
 class String(Function):
+    __slots__ = ()
+
     def __init__(self, string: str):
         super().__init__()
         self.function = {
@@ -114,6 +136,8 @@ class String(Function):
 
 
 class Boolean(Function):
+    __slots__ = ()
+
     def __init__(self, boolean: bool):
         super().__init__()
         self.function = {
@@ -123,16 +147,22 @@ class Boolean(Function):
 
 
 class Object(Function):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Particle(Function):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Region(Function):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -145,6 +175,8 @@ class Region(Function):
 class Condition(Function):
     """Deprecated, use python comparison operators instead"""
 
+    __slots__ = ("item_a", "operator", "item_b", "comparison")
+
     def __init__(self, item_a: Base, operator: str, item_b: Base):
         super().__init__()
         self.item_a: Base = item_a
@@ -156,7 +188,7 @@ class Condition(Function):
             self.comparison: str = type_of_item(item_a) or type_of_item(item_b)
 
     @override
-    def to_dict(self):
+    def _serialize(self):
         return [
             {
                 "operandType": self.comparison,
@@ -170,6 +202,8 @@ class Condition(Function):
 class Calculation(Number):
     """Deprecated, use python arithmetic operators instead"""
 
+    __slots__ = ()
+
     def __init__(self, item_a: Function, operator: str, item_b: Function):
         super().__init__(0)
         self.function: str = "calculate"
@@ -185,6 +219,8 @@ class Calculation(Number):
 class Exponent(Number):
     """Exponent operator, peprecated, use python arithmetic operators instead"""
 
+    __slots__ = ()
+
     def __init__(self, base: Function, power: Function):
         super().__init__(0)
         self.function: str = "getExponent"
@@ -197,6 +233,8 @@ class Exponent(Number):
 class Concat(String):
     """Deprecated, use python `+` operator instead"""
 
+    __slots__ = ()
+
     def __init__(self, text_a: Function, text_b: Function):
         super().__init__("")
         self.function: str = "concat"
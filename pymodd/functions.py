@@ -38,6 +38,8 @@ import pymodd.variable_types
 
 
 class Undefined(Function):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "undefinedValue"
         self.options = {}
@@ -49,6 +51,8 @@ class Undefined(Function):
 
 
 class ThisEntity(Entity):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "thisEntity"
         self.options = {}
@@ -60,18 +64,24 @@ class ThisEntity(Entity):
 
 
 class LastPlayerSelectingDialogueOption(Player):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastPlayerSelectingDialogueOption"
         self.options = {}
 
 
 class LastTriggeringPlayer(Player):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getTriggeringPlayer"
         self.options = {}
 
 
 class OwnerOfEntity(Player):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getOwner"
         self.options = {
@@ -80,6 +90,8 @@ class OwnerOfEntity(Player):
 
 
 class PlayerFromId(Player):
+    __slots__ = ()
+
     def __init__(self, string):
         self.function = "getPlayerFromId"
         self.options = {
@@ -93,30 +105,40 @@ class PlayerFromId(Player):
 
 
 class LastPurchasedUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastPurchasedUnit"
         self.options = {}
 
 
 class LastOverlappingUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastOverlappingUnit"
         self.options = {}
 
 
 class LastOverlappedUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastOverlappedUnit"
         self.options = {}
 
 
 class LastTouchingUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastTouchingUnit"
         self.options = {}
 
 
 class SourceUnitOfProjectile(Unit):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getSourceUnitOfProjectile"
         self.options = {
@@ -125,24 +147,32 @@ class SourceUnitOfProjectile(Unit):
 
 
 class LastCastingUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastCastingUnit"
         self.options = {}
 
 
 class LastTouchedUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastTouchedUnit"
         self.options = {}
 
 
 class LastCreatedUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastCreatedUnit"
         self.options = {}
 
 
 class GetPlayerSelectedUnit(Unit):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "getPlayerSelectedUnit"
         self.options = {
@@ -151,6 +181,8 @@ class GetPlayerSelectedUnit(Unit):
 
 
 class OwnerOfItem(Unit):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getOwnerOfItem"
         self.options = {
@@ -159,24 +191,32 @@ class OwnerOfItem(Unit):
 
 
 class LastTriggeringUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getTriggeringUnit"
         self.options = {}
 
 
 class LastAttackedUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastAttackedUnit"
         self.options = {}
 
 
 class LastAttackingUnit(Unit):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastAttackingUnit"
         self.options = {}
 
 
 class OwnerUnitOfSensor(Unit):
+    __slots__ = ()
+
     def __init__(self, sensor):
         self.function = "ownerUnitOfSensor"
         self.options = {
@@ -185,6 +225,8 @@ class OwnerUnitOfSensor(Unit):
 
 
 class UnitFromId(Unit):
+    __slots__ = ()
+
     def __init__(self, string):
         self.function = "getUnitFromId"
         self.options = {
@@ -193,6 +235,8 @@ class UnitFromId(Unit):
 
 
 class TargetUnit(Unit):
+    __slots__ = ()
+
     def __init__(self, unit):
         self.function = "targetUnit"
         self.options = {
@@ -206,6 +250,8 @@ class TargetUnit(Unit):
 
 
 class ItemInFrontOfUnit(Item):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getItemInFrontOfUnit"
         self.options = {
@@ -214,6 +260,8 @@ class ItemInFrontOfUnit(Item):
 
 
 class ItemAtSlot(Item):
+    __slots__ = ()
+
     def __init__(self, slot, unit):
         self.function = "getItemAtSlot"
         self.options = {
@@ -223,12 +271,16 @@ class ItemAtSlot(Item):
 
 
 class LastTriggeringItem(Item):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getTriggeringItem"
         self.options = {}
 
 
 class ItemCurrentlyHeldByUnit(Item):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getItemCurrentlyHeldByUnit"
         self.options = {
@@ -237,12 +289,16 @@ class ItemCurrentlyHeldByUnit(Item):
 
 
 class LastUsedItem(Item):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "lastUsedItem"
         self.options = {}
 
 
 class SourceItemOfProjectile(Item):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getSourceItemOfProjectile"
         self.options = {
@@ -251,18 +307,24 @@ class SourceItemOfProjectile(Item):
 
 
 class LastCreatedItem(Item):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastCreatedItem"
         self.options = {}
 
 
 class LastOverlappingItem(Item):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastOverlappingItem"
         self.options = {}
 
 
 class ItemInInventorySlot(Item):
+    __slots__ = ()
+
     def __init__(self, slot, entity):
         self.function = "getItemInInventorySlot"
         self.options = {
@@ -272,12 +334,16 @@ class ItemInInventorySlot(Item):
 
 
 class LastTouchedItem(Item):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastTouchedItem"
         self.options = {}
 
 
 class LastAttackingItem(Item):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastAttackingItem"
         self.options = {}
@@ -289,24 +355,32 @@ class LastAttackingItem(Item):
 
 
 class LastCreatedProjectile(Projectile):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastCreatedProjectile"
         self.options = {}
 
 
 class LastTriggeringProjectile(Projectile):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getTriggeringProjectile"
         self.options = {}
 
 
 class LastTouchedProjectile(Projectile):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastTouchedProjectile"
         self.options = {}
 
 
 class LastOverlappingProjectile(Projectile):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getLastOverlappingProjectile"
         self.options = {}
@@ -318,6 +392,8 @@ class LastOverlappingProjectile(Projectile):
 
 
 class LastTriggeringDebris(Debris):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getTriggeringDebris"
         self.options = {}
@@ -329,6 +405,8 @@ class LastTriggeringDebris(Debris):
 
 
 class XyCoordinate(Position):
+    __slots__ = ()
+
     def __init__(self, x, y):
         self.function = "xyCoordinate"
         self.options = {
@@ -338,6 +416,8 @@ class XyCoordinate(Position):
 
 
 class PositionOfMouseCursorOfPlayer(Position):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "getMouseCursorPosition"
         self.options = {
@@ -346,6 +426,8 @@ class PositionOfMouseCursorOfPlayer(Position):
 
 
 class CenterOfRegion(Position):
+    __slots__ = ()
+
     def __init__(self, region):
         self.function = "centerOfRegion"
         self.options = {
@@ -354,6 +436,8 @@ class CenterOfRegion(Position):
 
 
 class EntityLastRaycastCollisionPosition(Position):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "entityLastRaycastCollisionPosition"
         self.options = {
@@ -362,6 +446,8 @@ class EntityLastRaycastCollisionPosition(Position):
 
 
 class PositionOfEntity(Position):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getEntityPosition"
         self.options = {
@@ -370,6 +456,8 @@ class PositionOfEntity(Position):
 
 
 class GetPositionInFrontOfPosition(Position):
+    __slots__ = ()
+
     def __init__(self, position, distance, angle):
         self.function = "getPositionInFrontOfPosition"
         self.options = {
@@ -380,6 +468,8 @@ class GetPositionInFrontOfPosition(Position):
 
 
 class RandomPositionInRegion(Position):
+    __slots__ = ()
+
     def __init__(self, region):
         self.function = "getRandomPositionInRegion"
         self.options = {
@@ -393,6 +483,8 @@ class RandomPositionInRegion(Position):
 
 
 class LastTriggeringAttribute(Attribute):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getTriggeringAttribute"
         self.options = {}
@@ -404,6 +496,8 @@ class LastTriggeringAttribute(Attribute):
 
 
 class SensorOfUnit(Sensor):
+    __slots__ = ()
+
     def __init__(self, unit):
         self.function = "getSensorOfUnit"
         self.options = {
@@ -412,6 +506,8 @@ class SensorOfUnit(Sensor):
 
 
 class LastTriggeringSensor(Sensor):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getTriggeringSensor"
         self.options = {}
@@ -423,6 +519,8 @@ class LastTriggeringSensor(Sensor):
 
 
 class CurrentStateOfEntity(pymodd.variable_types.StateBase):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getEntityState"
         self.options = {
@@ -436,6 +534,8 @@ class CurrentStateOfEntity(pymodd.variable_types.StateBase):
 
 
 class RandomNumberBetween(Number):
+    __slots__ = ()
+
     def __init__(self, min, max):
         self.function = "getRandomNumberBetween"
         self.options = {
@@ -445,6 +545,8 @@ class RandomNumberBetween(Number):
 
 
 class UnitsFacingAngle(Number):
+    __slots__ = ()
+
     def __init__(self, unit):
         self.function = "unitsFacingAngle"
         self.options = {
@@ -453,12 +555,16 @@ class UnitsFacingAngle(Number):
 
 
 class HeightOfMap(Number):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getMapHeight"
         self.options = {}
 
 
 class ToFixed(Number):
+    __slots__ = ()
+
     def __init__(self, value, precision):
         self.function = "toFixed"
         self.options = {
@@ -468,6 +574,8 @@ class ToFixed(Number):
 
 
 class ItemQuantity(Number):
+    __slots__ = ()
+
     def __init__(self, item):
         self.function = "getItemQuantity"
         self.options = {
@@ -476,6 +584,8 @@ class ItemQuantity(Number):
 
 
 class Cos(Number):
+    __slots__ = ()
+
     def __init__(self, angle):
         self.function = "cos"
         self.options = {
@@ -484,6 +594,8 @@ class Cos(Number):
 
 
 class HeightOfEntity(Number):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "entityHeight"
         self.options = {
@@ -492,6 +604,8 @@ class HeightOfEntity(Number):
 
 
 class AttributeMaxOfPlayer(Number):
+    __slots__ = ()
+
     def __init__(self, attribute, entity):
         self.function = "playerAttributeMax"
         self.options = {
@@ -501,6 +615,8 @@ class AttributeMaxOfPlayer(Number):
 
 
 class ValueOfPlayerAttribute(Number):
+    __slots__ = ()
+
     def __init__(self, attribute, entity):
         self.function = "getPlayerAttribute"
         self.options = {
@@ -510,12 +626,16 @@ class ValueOfPlayerAttribute(Number):
 
 
 class WidthOfMap(Number):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getMapWidth"
         self.options = {}
 
 
 class WidthOfEntity(Number):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "entityWidth"
         self.options = {
@@ -524,12 +644,16 @@ class WidthOfEntity(Number):
 
 
 class NumberOfPlayers(Number):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getPlayerCount"
         self.options = {}
 
 
 class Arctan(Number):
+    __slots__ = ()
+
     def __init__(self, number):
         self.function = "arctan"
         self.options = {
@@ -538,6 +662,8 @@ class Arctan(Number):
 
 
 class MathFloor(Number):
+    __slots__ = ()
+
     def __init__(self, value):
         self.function = "mathFloor"
         self.options = {
@@ -546,6 +672,8 @@ class MathFloor(Number):
 
 
 class YCoordinateOfRegion(Number):
+    __slots__ = ()
+
     def __init__(self, region):
         self.function = "getYCoordinateOfRegion"
         self.options = {
@@ -554,6 +682,8 @@ class YCoordinateOfRegion(Number):
 
 
 class SquareRoot(Number):
+    __slots__ = ()
+
     def __init__(self, number):
         self.function = "squareRoot"
         self.options = {
@@ -562,12 +692,16 @@ class SquareRoot(Number):
 
 
 class UnitCount(Number):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getUnitCount"
         self.options = {}
 
 
 class AngleBetweenPositions(Number):
+    __slots__ = ()
+
     def __init__(self, position_a, position_b):
         self.function = "angleBetweenPositions"
         self.options = {
@@ -577,6 +711,8 @@ class AngleBetweenPositions(Number):
 
 
 class WidthOfRegion(Number):
+    __slots__ = ()
+
     def __init__(self, region):
         self.function = "getWidthOfRegion"
         self.options = {
@@ -585,6 +721,8 @@ class WidthOfRegion(Number):
 
 
 class AttributeMinOfEntity(Number):
+    __slots__ = ()
+
     def __init__(self, attribute, entity):
         self.function = "entityAttributeMin"
         self.options = {
@@ -594,6 +732,8 @@ class AttributeMinOfEntity(Number):
 
 
 class StringToNumber(Number):
+    __slots__ = ()
+
     def __init__(self, value):
         self.function = "stringToNumber"
         self.options = {
@@ -602,6 +742,8 @@ class StringToNumber(Number):
 
 
 class QuantityOfUnitTypeInUnitTypeGroup(Number):
+    __slots__ = ()
+
     def __init__(self, unit_type, unit_type_group):
         self.function = "getQuantityOfUnitTypeInUnitTypeGroup"
         self.options = {
@@ -611,6 +753,8 @@ class QuantityOfUnitTypeInUnitTypeGroup(Number):
 
 
 class YCoordinateOfPosition(Number):
+    __slots__ = ()
+
     def __init__(self, position):
         self.function = "getPositionY"
         self.options = {
@@ -619,6 +763,8 @@ class YCoordinateOfPosition(Number):
 
 
 class DistanceBetweenPositions(Number):
+    __slots__ = ()
+
     def __init__(self, position_a, position_b):
         self.function = "distanceBetweenPositions"
         self.options = {
@@ -628,6 +774,8 @@ class DistanceBetweenPositions(Number):
 
 
 class AttributeMaxOfEntity(Number):
+    __slots__ = ()
+
     def __init__(self, attribute, entity):
         self.function = "entityAttributeMax"
         self.options = {
@@ -637,6 +785,8 @@ class AttributeMaxOfEntity(Number):
 
 
 class AttributeMinOfPlayer(Number):
+    __slots__ = ()
+
     def __init__(self, attribute, entity):
         self.function = "playerAttributeMin"
         self.options = {
@@ -646,6 +796,8 @@ class AttributeMinOfPlayer(Number):
 
 
 class Sin(Number):
+    __slots__ = ()
+
     def __init__(self, angle):
         self.function = "sin"
         self.options = {
@@ -654,6 +806,8 @@ class Sin(Number):
 
 
 class XCoordinateOfRegion(Number):
+    __slots__ = ()
+
     def __init__(self, region):
         self.function = "getXCoordinateOfRegion"
         self.options = {
@@ -662,6 +816,8 @@ class XCoordinateOfRegion(Number):
 
 
 class YVelocityOfEntity(Number):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getEntityVelocityY"
         self.options = {
@@ -670,6 +826,8 @@ class YVelocityOfEntity(Number):
 
 
 class XCoordinateOfPosition(Number):
+    __slots__ = ()
+
     def __init__(self, position):
         self.function = "getPositionX"
         self.options = {
@@ -678,6 +836,8 @@ class XCoordinateOfPosition(Number):
 
 
 class LastPlayedTimeOfPlayer(Number):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "lastPlayedTimeOfPlayer"
         self.options = {
@@ -686,6 +846,8 @@ class LastPlayedTimeOfPlayer(Number):
 
 
 class MaxBetweenTwoNumbers(Number):
+    __slots__ = ()
+
     def __init__(self, num_a, num_b):
         self.function = "getMax"
         self.options = {
@@ -695,6 +857,8 @@ class MaxBetweenTwoNumbers(Number):
 
 
 class RotationSpeedOfUnitType(Number):
+    __slots__ = ()
+
     def __init__(self, unit_type):
         self.function = "getRotateSpeed"
         self.options = {
@@ -703,6 +867,8 @@ class RotationSpeedOfUnitType(Number):
 
 
 class CurrentAmmoOfItem(Number):
+    __slots__ = ()
+
     def __init__(self, item):
         self.function = "getCurrentAmmoOfItem"
         self.options = {
@@ -711,6 +877,8 @@ class CurrentAmmoOfItem(Number):
 
 
 class HeightOfRegion(Number):
+    __slots__ = ()
+
     def __init__(self, region):
         self.function = "getHeightOfRegion"
         self.options = {
@@ -719,6 +887,8 @@ class HeightOfRegion(Number):
 
 
 class MaxQuantityOfItem(Number):
+    __slots__ = ()
+
     def __init__(self, item):
         self.function = "getItemMaxQuantity"
         self.options = {
@@ -727,6 +897,8 @@ class MaxQuantityOfItem(Number):
 
 
 class AbsoluteValueOfNumber(Number):
+    __slots__ = ()
+
     def __init__(self, number):
         self.function = "absoluteValueOfNumber"
         self.options = {
@@ -735,6 +907,8 @@ class AbsoluteValueOfNumber(Number):
 
 
 class ValueOfEntityAttribute(Number):
+    __slots__ = ()
+
     def __init__(self, attribute, entity):
         self.function = "getEntityAttribute"
         self.options = {
@@ -744,12 +918,16 @@ class ValueOfEntityAttribute(Number):
 
 
 class CurrentUnixTimeStamp(Number):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "currentTimeStamp"
         self.options = {}
 
 
 class XVelocityOfEntity(Number):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getEntityVelocityX"
         self.options = {
@@ -758,6 +936,8 @@ class XVelocityOfEntity(Number):
 
 
 class DefaultQuantityOfItemType(Number):
+    __slots__ = ()
+
     def __init__(self, item_type):
         self.function = "defaultQuantityOfItemType"
         self.options = {
@@ -766,6 +946,8 @@ class DefaultQuantityOfItemType(Number):
 
 
 class QuantityOfItemTypeInItemTypeGroup(Number):
+    __slots__ = ()
+
     def __init__(self, item_type, item_type_group):
         self.function = "getQuantityOfItemTypeInItemTypeGroup"
         self.options = {
@@ -775,12 +957,16 @@ class QuantityOfItemTypeInItemTypeGroup(Number):
 
 
 class NumberOfItems(Number):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getNumberOfItemsPresent"
         self.options = {}
 
 
 class Min(Number):
+    __slots__ = ()
+
     def __init__(self, num_a, num_b):
         self.function = "getMin"
         self.options = {
@@ -790,6 +976,8 @@ class Min(Number):
 
 
 class MaxValueOfItemType(Number):
+    __slots__ = ()
+
     def __init__(self, item_type):
         self.function = "maxValueOfItemType"
         self.options = {
@@ -798,6 +986,8 @@ class MaxValueOfItemType(Number):
 
 
 class AngleBetweenMouseAndWindowCenter(Number):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "angleBetweenMouseAndWindowCenter"
         self.options = {
@@ -806,6 +996,8 @@ class AngleBetweenMouseAndWindowCenter(Number):
 
 
 class NumberOfUnitsOfUnitType(Number):
+    __slots__ = ()
+
     def __init__(self, unit_type):
         self.function = "getNumberOfUnitsOfUnitType"
         self.options = {
@@ -814,6 +1006,8 @@ class NumberOfUnitsOfUnitType(Number):
 
 
 class NumberOfPlayersOfPlayerType(Number):
+    __slots__ = ()
+
     def __init__(self, player_type):
         self.function = "getNumberOfPlayersOfPlayerType"
         self.options = {
@@ -822,6 +1016,8 @@ class NumberOfPlayersOfPlayerType(Number):
 
 
 class LengthOfString(Number):
+    __slots__ = ()
+
     def __init__(self, string):
         self.function = "getLengthOfString"
         self.options = {
@@ -830,6 +1026,8 @@ class LengthOfString(Number):
 
 
 class StringArrayLength(Number):
+    __slots__ = ()
+
     def __init__(self, string):
         self.function = "getStringArrayLength"
         self.options = {
@@ -838,6 +1036,8 @@ class StringArrayLength(Number):
 
 
 class SelectedInventorySlot(Number):
+    __slots__ = ()
+
     def __init__(self, unit):
         self.function = "selectedInventorySlot"
         self.options = {
@@ -846,6 +1046,8 @@ class SelectedInventorySlot(Number):
 
 
 class LogBase10(Number):
+    __slots__ = ()
+
     def __init__(self, value):
         self.function = "log10"
         self.options = {
@@ -854,6 +1056,8 @@ class LogBase10(Number):
 
 
 class UnitSensorRadius(Number):
+    __slots__ = ()
+
     def __init__(self, unit):
         self.function = "unitSensorRadius"
         self.options = {
@@ -862,6 +1066,8 @@ class UnitSensorRadius(Number):
 
 
 class NumberToDegrees(Number):
+    __slots__ = ()
+
     def __init__(self, number):
         self.function = "toDegrees"
         self.options = {
@@ -870,6 +1076,8 @@ class NumberToDegrees(Number):
 
 
 class NumberToRadians(Number):
+    __slots__ = ()
+
     def __init__(self, number):
         self.function = "toRadians"
         self.options = {
@@ -878,6 +1086,8 @@ class NumberToRadians(Number):
 
 
 class GetMapTileId(Number):
+    __slots__ = ()
+
     def __init__(self, x, y, layer):
         self.function = "getMapTileId"
         self.options = {
@@ -888,6 +1098,8 @@ class GetMapTileId(Number):
 
 
 class ElementCount(Number):
+    __slots__ = ()
+
     def __init__(self, object):
         self.function = "elementCount"
         self.options = {
@@ -896,6 +1108,8 @@ class ElementCount(Number):
 
 
 class GetDefaultAttributeValueOfUnitType(Number):
+    __slots__ = ()
+
     def __init__(self, unit_type):
         self.function = "getDefaultAttributeValueOfUnitType"
         self.options = {
@@ -904,6 +1118,8 @@ class GetDefaultAttributeValueOfUnitType(Number):
 
 
 class GetCameraWidth(Number):
+    __slots__ = ()
+
     def __init__(
         self,
     ):
@@ -912,6 +1128,8 @@ class GetCameraWidth(Number):
 
 
 class GetCameraHeight(Number):
+    __slots__ = ()
+
     def __init__(
         self,
     ):
@@ -925,6 +1143,8 @@ class GetCameraHeight(Number):
 
 
 class EntityTypeOfEntity(String):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getEntityType"
         self.options = {
@@ -933,6 +1153,8 @@ class EntityTypeOfEntity(String):
 
 
 class LastCustomInputOfPlayer(String):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "playerCustomInput"
         self.options = {
@@ -941,6 +1163,8 @@ class LastCustomInputOfPlayer(String):
 
 
 class NameOfPlayer(String):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getPlayerName"
         self.options = {
@@ -949,6 +1173,8 @@ class NameOfPlayer(String):
 
 
 class NameOfUnitType(String):
+    __slots__ = ()
+
     def __init__(self, unit_type):
         self.function = "getUnitTypeName"
         self.options = {
@@ -957,6 +1183,8 @@ class NameOfUnitType(String):
 
 
 class NameOfRegion(String):
+    __slots__ = ()
+
     def __init__(self, region):
         self.function = "nameOfRegion"
         self.options = {
@@ -965,6 +1193,8 @@ class NameOfRegion(String):
 
 
 class NameOfItemType(String):
+    __slots__ = ()
+
     def __init__(self, item_type):
         self.function = "getItemTypeName"
         self.options = {
@@ -973,6 +1203,8 @@ class NameOfItemType(String):
 
 
 class SubstringOf(String):
+    __slots__ = ()
+
     def __init__(self, string, from_index, to_index):
         self.function = "substringOf"
         self.options = {
@@ -983,6 +1215,8 @@ class SubstringOf(String):
 
 
 class LastChatMessageSentByPlayer(String):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "getLastChatMessageSentByPlayer"
         self.options = {
@@ -991,6 +1225,8 @@ class LastChatMessageSentByPlayer(String):
 
 
 class ToLowerCase(String):
+    __slots__ = ()
+
     def __init__(self, string):
         self.function = "toLowerCase"
         self.options = {
@@ -999,6 +1235,8 @@ class ToLowerCase(String):
 
 
 class ReplaceValuesInString(String):
+    __slots__ = ()
+
     def __init__(self, source_string, match_string, new_string):
         self.function = "replaceValuesInString"
         self.options = {
@@ -1009,6 +1247,8 @@ class ReplaceValuesInString(String):
 
 
 class UnixTimeToFormattedString(String):
+    __slots__ = ()
+
     def __init__(self, seconds):
         """formats to (hh::mm:ss)"""
         self.function = "getTimeString"
@@ -1018,6 +1258,8 @@ class UnixTimeToFormattedString(String):
 
 
 class DescriptionOfItem(String):
+    __slots__ = ()
+
     def __init__(self, item):
         self.function = "getItemDescription"
         self.options = {
@@ -1026,6 +1268,8 @@ class DescriptionOfItem(String):
 
 
 class DataOfUnit(String):
+    __slots__ = ()
+
     def __init__(self, unit):
         self.function = "getUnitData"
         self.options = {
@@ -1034,6 +1278,8 @@ class DataOfUnit(String):
 
 
 class DataOfPlayer(String):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "getPlayerData"
         self.options = {
@@ -1042,6 +1288,8 @@ class DataOfPlayer(String):
 
 
 class IdOfUnit(String):
+    __slots__ = ()
+
     def __init__(self, unit):
         self.function = "getUnitId"
         self.options = {
@@ -1050,6 +1298,8 @@ class IdOfUnit(String):
 
 
 class IdOfPlayer(String):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "getPlayerId"
         self.options = {
@@ -1058,6 +1308,8 @@ class IdOfPlayer(String):
 
 
 class StringArrayElement(String):
+    __slots__ = ()
+
     def __init__(self, number, string):
         self.function = "getStringArrayElement"
         self.options = {
@@ -1067,6 +1319,8 @@ class StringArrayElement(String):
 
 
 class InsertStringArrayElement(String):
+    __slots__ = ()
+
     def __init__(self, value, string):
         self.function = "insertStringArrayElement"
         self.options = {
@@ -1076,6 +1330,8 @@ class InsertStringArrayElement(String):
 
 
 class UpdateStringArrayElement(String):
+    __slots__ = ()
+
     def __init__(self, number, string, value):
         self.function = "updateStringArrayElement"
         self.options = {
@@ -1086,6 +1342,8 @@ class UpdateStringArrayElement(String):
 
 
 class RemoveStringArrayElement(String):
+    __slots__ = ()
+
     def __init__(self, number, string):
         self.function = "removeStringArrayElement"
         self.options = {
@@ -1095,6 +1353,8 @@ class RemoveStringArrayElement(String):
 
 
 class NameOfEntity(String):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "entityName"
         self.options = {
@@ -1103,6 +1363,8 @@ class NameOfEntity(String):
 
 
 class NumberToString(String):
+    __slots__ = ()
+
     def __init__(self, value):
         self.function = "numberToString"
         self.options = {
@@ -1111,6 +1373,8 @@ class NumberToString(String):
 
 
 class GetMapJson(String):
+    __slots__ = ()
+
     def __init__(
         self,
     ):
@@ -1119,6 +1383,8 @@ class GetMapJson(String):
 
 
 class LastReceivedPostResponse(String):
+    __slots__ = ()
+
     def __init__(
         self,
     ):
@@ -1127,6 +1393,8 @@ class LastReceivedPostResponse(String):
 
 
 class LastUpdatedVariableName(String):
+    __slots__ = ()
+
     def __init__(
         self,
     ):
@@ -1135,6 +1403,8 @@ class LastUpdatedVariableName(String):
 
 
 class ObjectToString(String):
+    __slots__ = ()
+
     def __init__(self, object):
         self.function = "objectToString"
         self.options = {
@@ -1148,6 +1418,8 @@ class ObjectToString(String):
 
 
 class IsPlayerLoggedIn(Boolean):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "isPlayerLoggedIn"
         self.options = {
@@ -1156,6 +1428,8 @@ class IsPlayerLoggedIn(Boolean):
 
 
 class PlayerIsCreator(Boolean):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "playerIsCreator"
         self.options = {
@@ -1164,6 +1438,8 @@ class PlayerIsCreator(Boolean):
 
 
 class AreBothPlayersFriendly(Boolean):
+    __slots__ = ()
+
     def __init__(self, player_a, player_b):
         self.function = "playersAreFriendly"
         self.options = {
@@ -1173,6 +1449,8 @@ class AreBothPlayersFriendly(Boolean):
 
 
 class IsPlayerControlledByHuman(Boolean):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "playerIsControlledByHuman"
         self.options = {
@@ -1181,6 +1459,8 @@ class IsPlayerControlledByHuman(Boolean):
 
 
 class AreBothPlayersHostile(Boolean):
+    __slots__ = ()
+
     def __init__(self, player_a, player_b):
         self.function = "playersAreHostile"
         self.options = {
@@ -1190,6 +1470,8 @@ class AreBothPlayersHostile(Boolean):
 
 
 class RegionOverlapsWithRegion(Boolean):
+    __slots__ = ()
+
     def __init__(self, region_a, region_b):
         self.function = "regionOverlapsWithRegion"
         self.options = {
@@ -1199,6 +1481,8 @@ class RegionOverlapsWithRegion(Boolean):
 
 
 class AreBothPlayersNeutral(Boolean):
+    __slots__ = ()
+
     def __init__(self, player_a, player_b):
         self.function = "playersAreNeutral"
         self.options = {
@@ -1208,6 +1492,8 @@ class AreBothPlayersNeutral(Boolean):
 
 
 class PlayerHasAdblockEnabled(Boolean):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "playerHasAdblockEnabled"
         self.options = {
@@ -1216,6 +1502,8 @@ class PlayerHasAdblockEnabled(Boolean):
 
 
 class EntityExists(Boolean):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "entityExists"
         self.options = {
@@ -1224,6 +1512,8 @@ class EntityExists(Boolean):
 
 
 class IsPositionInWall(Boolean):
+    __slots__ = ()
+
     def __init__(self, positionx, positiony):
         self.function = "isPositionInWall"
         self.options = {
@@ -1233,6 +1523,8 @@ class IsPositionInWall(Boolean):
 
 
 class StringContainsString(Boolean):
+    __slots__ = ()
+
     def __init__(self, source_string, pattern_string):
         self.function = "subString"
         self.options = {
@@ -1242,6 +1534,8 @@ class StringContainsString(Boolean):
 
 
 class StringStartsWith(Boolean):
+    __slots__ = ()
+
     def __init__(self, source_string, pattern_string):
         self.function = "stringStartsWith"
         self.options = {
@@ -1251,6 +1545,8 @@ class StringStartsWith(Boolean):
 
 
 class StringEndsWith(Boolean):
+    __slots__ = ()
+
     def __init__(self, source_string, pattern_string):
         self.function = "stringEndsWith"
         self.options = {
@@ -1260,6 +1556,8 @@ class StringEndsWith(Boolean):
 
 
 class IsAIEnabled(Boolean):
+    __slots__ = ()
+
     def __init__(self, unit):
         self.function = "isAIEnabled"
         self.options = {
@@ -1268,6 +1566,8 @@ class IsAIEnabled(Boolean):
 
 
 class IsPlayerABot(Boolean):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "isBotPlayer"
         self.options = {
@@ -1276,6 +1576,8 @@ class IsPlayerABot(Boolean):
 
 
 class IsPlayerAComputer(Boolean):
+    __slots__ = ()
+
     def __init__(self, player_is_a_computer):
         self.function = "isComputerPlayer"
         self.options = {
@@ -1284,6 +1586,8 @@ class IsPlayerAComputer(Boolean):
 
 
 class RoleExistsForPlayer(Boolean):
+    __slots__ = ()
+
     def __init__(self, name, player):
         self.function = "roleExistsForPlayer"
         self.options = {
@@ -1293,6 +1597,8 @@ class RoleExistsForPlayer(Boolean):
 
 
 class StringIsANumber(Boolean):
+    __slots__ = ()
+
     def __init__(self, string_is_a_number):
         self.function = "stringIsANumber"
         self.options = {
@@ -1301,6 +1607,8 @@ class StringIsANumber(Boolean):
 
 
 class UnitIsCarryingItemType(Boolean):
+    __slots__ = ()
+
     def __init__(self, unit, item_type):
         self.function = "unitIsCarryingItemType"
         self.options = {
@@ -1315,6 +1623,8 @@ class UnitIsCarryingItemType(Boolean):
 
 
 class StringToObject(Object):
+    __slots__ = ()
+
     def __init__(self, string):
         self.function = "stringToObject"
         self.options = {
@@ -1323,6 +1633,8 @@ class StringToObject(Object):
 
 
 class ElementFromObject(Object):
+    __slots__ = ()
+
     def __init__(self, key, object):
         self.function = "elementFromObject"
         self.options = {
@@ -1332,6 +1644,8 @@ class ElementFromObject(Object):
 
 
 class EmptyObject(Object):
+    __slots__ = ()
+
     def __init__(
         self,
     ):
@@ -1345,6 +1659,8 @@ class EmptyObject(Object):
 
 
 class ItemParticle(Particle):
+    __slots__ = ()
+
     def __init__(self, particle_type, entity):
         self.function = "getItemParticle"
         self.options = {
@@ -1354,6 +1670,8 @@ class ItemParticle(Particle):
 
 
 class UnitParticle(Particle):
+    __slots__ = ()
+
     def __init__(self, particle_type, entity):
         self.function = "getUnitParticle"
         self.options = {
@@ -1373,6 +1691,8 @@ class UnitParticle(Particle):
 
 
 class ValueOfEntityVariable(pymodd.variable_types.EntityVariableBase):
+    __slots__ = ()
+
     def __init__(self, entity_variable_type, entity):
         self.function = "getValueOfEntityVariable"
         self.data_type = entity_variable_type.data_type
@@ -1388,6 +1708,8 @@ class ValueOfEntityVariable(pymodd.variable_types.EntityVariableBase):
 
 
 class ValueOfPlayerVariable(pymodd.variable_types.PlayerVariableBase):
+    __slots__ = ()
+
     def __init__(self, player_variable_type, player):
         self.function = "getValueOfPlayerVariable"
         self.data_type = player_variable_type.data_type
@@ -1403,18 +1725,24 @@ class ValueOfPlayerVariable(pymodd.variable_types.PlayerVariableBase):
 
 
 class LastTriggeringRegion(Region):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getTriggeringRegion"
         self.options = {}
 
 
 class EntireMapRegion(Region):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "getEntireMapRegion"
         self.options = {}
 
 
 class EntityBounds(Region):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "entityBounds"
         self.options = {
@@ -1423,6 +1751,8 @@ class EntityBounds(Region):
 
 
 class DynamicRegion(Region):
+    __slots__ = ()
+
     def __init__(self, x, y, width, height):
         self.function = "dynamicRegion"
         self.options = {
@@ -1439,6 +1769,8 @@ class DynamicRegion(Region):
 
 
 class UnitTypeOfUnit(pymodd.variable_types.UnitTypeBase):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getUnitTypeOfUnit"
         self.options = {
@@ -1447,12 +1779,16 @@ class UnitTypeOfUnit(pymodd.variable_types.UnitTypeBase):
 
 
 class IdOfLastPurchasedUnitTypet(pymodd.variable_types.UnitTypeBase):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "lastPurchasedUnitTypetId"
         self.options = {}
 
 
 class RandomUnitTypeFromUnitTypeGroup(pymodd.variable_types.UnitTypeBase):
+    __slots__ = ()
+
     def __init__(self, unit_type_group):
         self.function = "getRandomUnitTypeFromUnitTypeGroup"
         self.options = {
@@ -1466,6 +1802,8 @@ class RandomUnitTypeFromUnitTypeGroup(pymodd.variable_types.UnitTypeBase):
 
 
 class ItemTypeOfItem(pymodd.variable_types.ItemTypeBase):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getItemTypeOfItem"
         self.options = {
@@ -1474,6 +1812,8 @@ class ItemTypeOfItem(pymodd.variable_types.ItemTypeBase):
 
 
 class RandomItemTypeFromItemTypeGroup(pymodd.variable_types.ItemTypeBase):
+    __slots__ = ()
+
     def __init__(self, item_type_group):
         self.function = "getRandomItemTypeFromItemTypeGroup"
         self.options = {
@@ -1487,6 +1827,8 @@ class RandomItemTypeFromItemTypeGroup(pymodd.variable_types.ItemTypeBase):
 
 
 class ProjectileTypeOfProjectile(pymodd.variable_types.ProjectileTypeBase):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getProjectileTypeOfProjectile"
         self.options = {
@@ -1500,6 +1842,8 @@ class ProjectileTypeOfProjectile(pymodd.variable_types.ProjectileTypeBase):
 
 
 class PlayerTypeOfPlayer(pymodd.variable_types.PlayerTypeBase):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "playerTypeOfPlayer"
         self.options = {
@@ -1513,6 +1857,8 @@ class PlayerTypeOfPlayer(pymodd.variable_types.PlayerTypeBase):
 
 
 class AttributeTypeOfAttribute(pymodd.variable_types.AttributeTypeBase):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "getAttributeTypeOfAttribute"
         self.options = {
@@ -1531,18 +1877,24 @@ class AttributeTypeOfAttribute(pymodd.variable_types.AttributeTypeBase):
 
 
 class AllEntitiesCollidingWithLastRaycast(EntityGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "entitiesCollidingWithLastRaycast"
         self.options = {}
 
 
 class AllEntitiesInTheGame(EntityGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allEntities"
         self.options = {}
 
 
 class AllEntitiesInRegion(EntityGroup):
+    __slots__ = ()
+
     def __init__(self, region):
         self.function = "entitiesInRegion"
         self.options = {
@@ -1551,6 +1903,8 @@ class AllEntitiesInRegion(EntityGroup):
 
 
 class AllEntitiesInFrontOfEntityInDynamicRegionAtDistance(EntityGroup):
+    __slots__ = ()
+
     def __init__(self, entity, width: Number, height: Number, distance: Number):
         self.function = "entitiesInRegionInFrontOfEntityAtDistance"
         self.options = {
@@ -1562,6 +1916,8 @@ class AllEntitiesInFrontOfEntityInDynamicRegionAtDistance(EntityGroup):
 
 
 class AllEntitiesBetweenTwoPositions(EntityGroup):
+    __slots__ = ()
+
     def __init__(self, position_a, position_b):
         self.function = "entitiesBetweenTwoPositions"
         self.options = {
@@ -1576,6 +1932,8 @@ class AllEntitiesBetweenTwoPositions(EntityGroup):
 
 
 class AllUnitsOwnedByPlayer(UnitGroup):
+    __slots__ = ()
+
     def __init__(self, player):
         self.function = "allUnitsOwnedByPlayer"
         self.options = {
@@ -1584,6 +1942,8 @@ class AllUnitsOwnedByPlayer(UnitGroup):
 
 
 class AllUnitsAttachedToUnit(UnitGroup):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "allUnitsAttachedToUnit"
         self.options = {
@@ -1592,12 +1952,16 @@ class AllUnitsAttachedToUnit(UnitGroup):
 
 
 class AllUnitsInTheGame(UnitGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allUnits"
         self.options = {}
 
 
 class AllUnitsAttachedToItem(UnitGroup):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "allUnitsAttachedToItem"
         self.options = {
@@ -1606,6 +1970,8 @@ class AllUnitsAttachedToItem(UnitGroup):
 
 
 class AllUnitsMountedOnUnit(UnitGroup):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "allUnitsMountedOnUnit"
         self.options = {
@@ -1614,6 +1980,8 @@ class AllUnitsMountedOnUnit(UnitGroup):
 
 
 class AllUnitsInRegion(UnitGroup):
+    __slots__ = ()
+
     def __init__(self, region):
         self.function = "allUnitsInRegion"
         self.options = {
@@ -1622,6 +1990,8 @@ class AllUnitsInRegion(UnitGroup):
 
 
 class AllUnitsOfUnitType(UnitGroup):
+    __slots__ = ()
+
     def __init__(self, unit_type):
         self.function = "allUnitsOfUnitType"
         self.options = {
@@ -1635,6 +2005,8 @@ class AllUnitsOfUnitType(UnitGroup):
 
 
 class AllProjectilesAttachedToUnit(ProjectileGroup):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "allProjectilesAttachedToUnit"
         self.options = {
@@ -1643,12 +2015,16 @@ class AllProjectilesAttachedToUnit(ProjectileGroup):
 
 
 class AllProjectilesInTheGame(ProjectileGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allProjectiles"
         self.options = {}
 
 
 class AllProjectilesofProjectileType(ProjectileGroup):
+    __slots__ = ()
+
     def __init__(self, projectile_type):
         self.function = "allProjectilesofProjectileType"
         self.options = {
@@ -1662,18 +2038,24 @@ class AllProjectilesofProjectileType(ProjectileGroup):
 
 
 class AllItemsDroppedOnGround(ItemGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allItemsDroppedOnGround"
         self.options = {}
 
 
 class AllItemsInTheGame(ItemGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allItems"
         self.options = {}
 
 
 class AllItemsAttachedToUnit(ItemGroup):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "allItemsAttachedToUnit"
         self.options = {
@@ -1682,6 +2064,8 @@ class AllItemsAttachedToUnit(ItemGroup):
 
 
 class AllItemsOwnedByUnit(ItemGroup):
+    __slots__ = ()
+
     def __init__(self, entity):
         self.function = "allItemsOwnedByUnit"
         self.options = {
@@ -1690,6 +2074,8 @@ class AllItemsOwnedByUnit(ItemGroup):
 
 
 class AllItemsOfItemType(ItemGroup):
+    __slots__ = ()
+
     def __init__(self, item_type):
         self.function = "allItemsOfItemType"
         self.options = {
@@ -1703,24 +2089,32 @@ class AllItemsOfItemType(ItemGroup):
 
 
 class AllHumanPlayersInTheGame(PlayerGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "humanPlayers"
         self.options = {}
 
 
 class AllComputerPlayersInTheGame(PlayerGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "computerPlayers"
         self.options = {}
 
 
 class AllPlayersInTheGame(PlayerGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allPlayers"
         self.options = {}
 
 
 class AllBotPlayersInTheGame(PlayerGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "botPlayers"
         self.options = {}
@@ -1732,6 +2126,8 @@ class AllBotPlayersInTheGame(PlayerGroup):
 
 
 class AllItemTypesInTheGame(ItemTypeGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allItemTypesInGame"
         self.options = {}
@@ -1743,6 +2139,8 @@ class AllItemTypesInTheGame(ItemTypeGroup):
 
 
 class AllUnitTypesInTheGame(UnitTypeGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allUnitTypesInGame"
         self.options = {}
@@ -1754,6 +2152,8 @@ class AllUnitTypesInTheGame(UnitTypeGroup):
 
 
 class AllDebrisInTheGame(DebrisGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allDebris"
         self.options = {}
@@ -1765,6 +2165,8 @@ class AllDebrisInTheGame(DebrisGroup):
 
 
 class AllRegionsInTheGame(RegionGroup):
+    __slots__ = ()
+
     def __init__(self):
         self.function = "allRegions"
         self.options = {}
@@ -5,10 +5,25 @@ from typing import Any
 from caseconverter import camelcase
 
 from pymodd.core.script import Script
+from pymodd.compiler.script_cache import ScriptCompileCache
+from pymodd.compiler.process_pool import ScriptCompilePool
+from pymodd.compiler.compile_profiler import profile_phase
+from pymodd.compiler.variable_merge import (
+    VariableMergeReport,
+    merge_variables_into_game_data,
+)
 from pymodd.variable.variable_type import VariableType
 from pymodd.core.base import Base
 from pymodd.core.folder import Folder
+from pymodd.core.script_index import ScriptIndex
 from pymodd.core.file import File
+from pymodd.utils.copy_json_data import copy_json_data
+
+try:
+    from pymodd import _pymodd_helper
+except ImportError:
+    # the game json file is loaded with json when the extension is not built
+    _pymodd_helper = None
 
 
 class Game(Base):
@@ -17,17 +32,42 @@ class Game(Base):
         json_file_path: str,
         game_variable_classes: list[type],
         project_globals_data: dict[str, Any],
+        game_data: dict[str, Any] | None = None,
     ):
+        """
+        Args:
+            json_file_path (str): path of the modd.io game json file
+
+            game_data (dict, optional): already loaded content of the game json file, used instead of reading json_file_path.
+                It is edited while compiling, pass a copy (see copy_of_game_data) to keep the original
+        """
         self.project_globals_data: dict[str, Any] = project_globals_data
-        with open(json_file_path, "r") as file:
-            data = json.load(file)
+        # reuses compiled actions of unchanged scripts when set
+        self.script_compile_cache: ScriptCompileCache | None = None
+        # compiles scripts over worker processes when set, requires script_compile_cache
+        self.script_compile_pool: ScriptCompilePool | None = None
+        # folds constants and removes branches that never run from the compiled actions when set
+        self.optimizes_actions: bool = False
+        # variables added, updated, and removed from the game data
+        self.variable_merge_report = VariableMergeReport()
+        if game_data is None:
+            with profile_phase("json.load game.json"):
+                game_data = load_game_data(json_file_path)
+        data = game_data
+        # reuse the keys of scripts and folders that already exist in the game
+        script_name_to_key, folder_name_to_key = existing_keys_of_game_data(data)
+        Script.use_existing_keys(script_name_to_key)
+        Folder.use_existing_keys(folder_name_to_key)
         self.name: str = data.get("title")
         self.data: Any = data
         # holds EntityScripts
         self.entity_scripts: list[Any] = []
         self.scripts: list[File] = []
-        self._update_data_with_variable_classes(game_variable_classes)
-        self._build()
+        self._script_index: ScriptIndex | None = None
+        with profile_phase("variable merge"):
+            self._update_data_with_variable_classes(game_variable_classes)
+        with profile_phase("build"):
+            self._build()
         # set position of scripts inside game
         for i, script in enumerate(self.scripts):
             script.set_position(i, None)
@@ -36,56 +76,42 @@ class Game(Base):
         # pull variable objects out from each class and place them in categories
         variable_category_to_variables: dict[str, list[VariableType]] = {}
         for klass in variable_classes:
-            variable_category = variable_category_name_from_variable_class_name(
-                klass.__name__
+            variables = variable_category_to_variables.setdefault(
+                variable_category_name_from_variable_class_name(klass.__name__), []
+            )
+            variables.extend(
+                value
+                for name, value in vars(klass).items()
+                if not name.startswith("_") and isinstance(value, VariableType)
             )
-            _ = variable_category_to_variables.setdefault(variable_category, [])
-            # get variables name from the class
-            class_var_names: list[str] = [
-                item
-                for item in vars(klass)
-                if not item.startswith("_") and not callable(item)
-            ]
-            # get the variable type instance assigned to that name
-            for var_name in class_var_names:
-                variable_category_to_variables[variable_category].append(
-                    getattr(klass, var_name)
-                )
-
         # update old game data (JSON) with new/modified variable objects
-        for variable_category, variables in variable_category_to_variables.items():
-            # skip categories that do not exist (TODO: check what to do about REGIONS)
-            if variable_category not in self.data["data"].keys():
-                continue
-            # get game data JSON for this category
-            old_category_data: dict[str, Any] = self.data["data"][variable_category]
-            old_variable_ids = list(old_category_data.keys())
-            for variable in variables:
-                # check if variable already existed in the old data
-                variable_exists = variable.id in old_category_data.keys()
-                old_category_data[variable.id] = (
-                    variable.updated_data_with_user_provided_values(
-                        old_category_data[variable.id]
-                        if variable_exists
-                        else variable.get_template_data()
-                    )
-                )
-                if variable.id in old_variable_ids:
-                    old_variable_ids.remove(variable.id)
-            # remove variables no longer included
-            for unincluded_variable_id in old_variable_ids:
-                old_category_data.pop(unincluded_variable_id)
+        merge_variables_into_game_data(
+            self.data["data"],
+            variable_category_to_variables,
+            self.variable_merge_report,
+        )
 
     def _build(self) -> None:
         pass
 
     def to_dict(self) -> Any:
+        # compile scripts in parallel, results are read back from the compile cache
+        if (
+            self.script_compile_pool is not None
+            and self.script_compile_cache is not None
+        ):
+            self.script_compile_pool.compile_missing_scripts(
+                self.all_scripts(), self.project_globals_data, self.script_compile_cache
+            )
+
         # update global scripts
         self.data["data"]["scripts"] = self.flatten_scripts_data()
 
         # update data of each entity_type
         for entity_script in self.entity_scripts:
             entity_script.project_globals_data = self.project_globals_data
+            entity_script.script_compile_cache = self.script_compile_cache
+            entity_script.optimizes_actions = self.optimizes_actions
             entity_category, entity_id = (
                 f"{camelcase(entity_script.entity_type.__class__.__name__)[:-4]}s",
                 entity_script.entity_type.id,
@@ -121,34 +147,132 @@ class Game(Base):
             dict(str, dict): keys are script keys, values are datas of scripts
         """
         flattened_scripts = {}
-        scripts_queue = self.scripts.copy()
-        while len(scripts_queue) > 0:
-            script = scripts_queue.pop(0)  # pyright: ignore[reportAssignmentType]
+        for script in self.script_index().files:
             script_data = None
-            # add folder's scripts to the queue
             if isinstance((folder := script), Folder):
                 script_data = folder.to_dict()
-                scripts_queue += folder.scripts
             elif isinstance((s := script), Script):
                 script: Script
-                script_data = script.to_dict(self.project_globals_data)
+                script_data = script.to_dict(
+                    self.project_globals_data,
+                    self.script_compile_cache,
+                    self.optimizes_actions,
+                )
             else:
                 script_data = {"key": None}
             flattened_scripts[script_data["key"]] = script_data
         return flattened_scripts
 
+    def script_index(self) -> ScriptIndex:
+        """
+        Returns:
+            ScriptIndex: index of the scripts and folders, built on first use
+        """
+        if self._script_index is None:
+            self._script_index = ScriptIndex(self.scripts)
+        return self._script_index
+
+    def all_scripts(self) -> list[Script]:
+        """
+        Returns:
+            list[Script]: every global and entity script of the game, in the order they are compiled
+        """
+        scripts: list[Script] = []
+        for scripts_owner in [self, *self.entity_scripts]:
+            scripts += scripts_owner.script_index().scripts
+        return scripts
+
     def find_script(self, script_name: str) -> Script | None:
-        scripts_queue = self.scripts.copy()
-        while len(scripts_queue) > 0:
-            script = scripts_queue.pop(0)  # pyright: ignore[reportAssignmentType]
-            # add folder's scripts to the queue
-            if isinstance((folder := script), Folder):
-                scripts_queue += folder.scripts
+        return self.script_index().name_to_script.get(script_name)
+
+
+# categories of the game data that are edited while compiling
+EDITED_GAME_DATA_CATEGORIES = [
+    "scripts",
+    "unitTypes",
+    "itemTypes",
+    "projectileTypes",
+    "playerTypes",
+    "variables",
+    "entityTypeVariables",
+    "playerTypeVariables",
+    "animationTypes",
+    "attributeTypes",
+    "particleTypes",
+    "abilities",
+    "states",
+    "shops",
+    "dialogues",
+    "music",
+    "sound",
+]
+
+
+def load_game_data(json_file_path: str) -> dict[str, Any]:
+    """Loads the game json file, natively when the _pymodd_helper extension supports it.
+    The native loader leaves categories that are never edited unparsed (as RawJson), they are written back as they are
+    """
+    if hasattr(_pymodd_helper, "load_game_json_file"):
+        return _pymodd_helper.load_game_json_file(
+            json_file_path, EDITED_GAME_DATA_CATEGORIES
+        )
+    with open(json_file_path, "r") as file:
+        return json.load(file)
+
+
+def copy_of_game_data(game_data: dict[str, Any]) -> dict[str, Any]:
+    """Copies loaded game data for another compile, categories that are never edited (map, tilesets...) are shared"""
+    copied_game_data = dict(game_data)
+    copied_game_data["data"] = {
+        category: (
+            copy_json_data(category_data)
+            if category in EDITED_GAME_DATA_CATEGORIES
+            else category_data
+        )
+        for category, category_data in game_data["data"].items()
+    }
+    return copied_game_data
+
+
+def existing_keys_of_game_data(
+    game_data: dict[str, Any],
+) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Returns:
+        tuple(dict(str, str), dict(str, str)): keys of the game's scripts and of its folders by their names.
+            names used more than once are left out, since their keys can not be matched
+    """
+    scripts_datas: list[dict[str, Any]] = [game_data["data"].get("scripts") or {}]
+    for entity_category in ["unitTypes", "itemTypes", "projectileTypes"]:
+        for entity_data in (game_data["data"].get(entity_category) or {}).values():
+            if isinstance(entity_data, dict):
+                scripts_datas.append(entity_data.get("scripts") or {})
+
+    script_name_to_key: dict[str, str] = {}
+    folder_name_to_key: dict[str, str] = {}
+    repeated_script_names: set[str] = set()
+    repeated_folder_names: set[str] = set()
+    for scripts_data in scripts_datas:
+        for key, script_data in scripts_data.items():
+            if not isinstance(script_data, dict):
+                continue
+            if (folder_name := script_data.get("folderName")) is not None:
+                name_to_key, repeated_names = folder_name_to_key, repeated_folder_names
+                name = folder_name
+            else:
+                name_to_key, repeated_names = script_name_to_key, repeated_script_names
+                name = script_data.get("name")
+            if name is None:
                 continue
-            script: Script
-            if script.name == script_name:
-                return script
-        return None
+            if name in name_to_key:
+                repeated_names.add(name)
+            name_to_key[name] = key
+
+    for name in repeated_script_names:
+        script_name_to_key.pop(name)
+    for name in repeated_folder_names:
+        folder_name_to_key.pop(name)
+    return script_name_to_key, folder_name_to_key
 
 
 def variable_category_name_from_variable_class_name(variable_class_name: str) -> str:
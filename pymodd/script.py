@@ -1,4 +1,5 @@
 import ast
+import time
 import inspect
 import textwrap
 from enum import Enum
@@ -9,6 +10,11 @@ from pymodd import _pymodd_helper
 from pymodd.core.function import Function
 from pymodd.function.group import Group
 from pymodd.core.script import Script
+from pymodd.compiler.script_cache import ScriptCompileCache
+from pymodd.compiler.compile_profiler import record_script_compile_time
+from pymodd.compiler.local_scopes import LocalScopes
+from pymodd.compiler.expression_code_cache import compile_expression, digest_of_source
+from pymodd.compiler.action_optimizer import optimized_actions_data
 
 from pymodd.function.type import Condition
 from pymodd.variable.data_type import DataType
@@ -31,21 +37,56 @@ def script(triggers=[], name=None):
 
     def wrapper_script(func):
         class NewScript(Script):
+            identity = f"{func.__module__}.{func.__qualname__}"
+            default_name = name if name is not None else func.__name__.replace("_", " ")
+
             def __init__(self):
                 super().__init__()
                 self.triggers = triggers
-                if name is not None:
-                    self.name = name
-                else:
-                    self.name = func.__name__.replace("_", " ")
+                self.name = NewScript.default_name
                 self.build_actions_function = func
 
             @override
             def to_dict(
-                self, project_globals_data: dict[str, Any] = {}
+                self,
+                project_globals_data: dict[str, Any] = {},
+                compile_cache: ScriptCompileCache | None = None,
+                optimizes_actions: bool = False,
             ) -> dict[str, Any]:
+                actions_data = None
+                fingerprint = None
+                if compile_cache is not None:
+                    fingerprint = compile_cache.fingerprint_of(
+                        self, project_globals_data
+                    )
+                    actions_data = compile_cache.get(fingerprint)
+                if actions_data is None:
+                    actions_data = self.compile_actions_data(project_globals_data)
+                    if compile_cache is not None:
+                        compile_cache.store(fingerprint, actions_data)
+                if optimizes_actions:
+                    # cached actions are shared, the optimizer makes new ones instead of editing them
+                    actions_data = optimized_actions_data(actions_data)
+                return {
+                    "triggers": [{"type": trigger.value} for trigger in self.triggers],
+                    "conditions": [
+                        {"operator": "==", "operandType": "boolean"},
+                        True,
+                        True,
+                    ],
+                    "actions": actions_data,
+                    "name": self.name,
+                    "parent": self.parent,
+                    "key": self.key,
+                    "order": self.order,
+                }
+
+            def compile_actions_data(
+                self, project_globals_data: dict[str, Any]
+            ) -> list[Any]:
                 script_actions_compiler = ScriptActionsCompiler(project_globals_data)
                 actions_data = None
+                start_time = time.perf_counter()
                 try:
                     actions_data = script_actions_compiler.compile_script(self)
                 except ScriptActionsCompileError as compile_error:
@@ -67,19 +108,10 @@ def script(triggers=[], name=None):
                     import sys
 
                     sys.exit(1)
-                return {
-                    "triggers": [{"type": trigger.value} for trigger in self.triggers],
-                    "conditions": [
-                        {"operator": "==", "operandType": "boolean"},
-                        True,
-                        True,
-                    ],
-                    "actions": actions_data,
-                    "name": self.name,
-                    "parent": self.parent,
-                    "key": self.key,
-                    "order": self.order,
-                }
+                record_script_compile_time(
+                    self.identity or str(self.name), time.perf_counter() - start_time
+                )
+                return actions_data
 
         return NewScript
 
@@ -106,14 +138,14 @@ class ScriptActionsCompileError(Exception):
 class ScriptActionsCompiler(ast.NodeVisitor):
     def __init__(self, project_globals_data):
         self.project_globals_data = project_globals_data
-        self.depth = 0
-        self.depth_to_locals_data = {0: {}}
+        self.local_scopes = LocalScopes()
+        self.source_digest = None
         self.actions_data = []
 
     def compile_script(self, script: Script):
-        tree = ast.parse(
-            textwrap.dedent(inspect.getsource(script.build_actions_function))
-        )
+        source = textwrap.dedent(inspect.getsource(script.build_actions_function))
+        self.source_digest = digest_of_source(source)
+        tree = ast.parse(source)
         self.visit(tree)
         return self.actions_data
 
@@ -136,14 +168,12 @@ class ScriptActionsCompiler(ast.NodeVisitor):
                 self.visit_For,
                 self.visit_With,
             ]:
-                self.depth += 1
-                self.depth_to_locals_data[self.depth] = {}
+                self.local_scopes.push()
                 action_data = visitor(node)
-                self.depth_to_locals_data.pop(self.depth)
-                self.depth -= 1
+                self.local_scopes.pop()
             else:
                 action_data = visitor(node)
-            if self.depth == 0:
+            if self.local_scopes.depth == 0:
                 self.actions_data.append(action_data)
             return action_data
         except Exception as error:
@@ -221,7 +251,7 @@ class ScriptActionsCompiler(ast.NodeVisitor):
             return action(group_function, self.parse_actions_of_body(node.body))
 
     def visit_With(self, node: ast.With):
-        evaled_item = self.eval_code(ast.unparse(node.items[0]))
+        evaled_item = self.eval_node(node.items[0].context_expr)
         if (
             isinstance((timeout_action_data := evaled_item), dict)
             and timeout_action_data.get("type") == "setTimeOut"
@@ -261,7 +291,7 @@ class ScriptActionsCompiler(ast.NodeVisitor):
     def visit_Delete(self, node: Delete):
         for target in node.targets:
             if isinstance(target, ast.Name):
-                self.depth_to_locals_data[self.depth].pop(target.id)
+                self.local_scopes.delete(target.id)
 
     def parse_actions_of_body(self, node_body):
         actions_data = []
@@ -272,13 +302,10 @@ class ScriptActionsCompiler(ast.NodeVisitor):
         return actions_data
 
     def get_current_locals_data(self):
-        locals_data = {}
-        for value in self.depth_to_locals_data.values():
-            locals_data.update(value)
-        return locals_data
+        return self.local_scopes.locals_data
 
     def add_local_var_to_curr_depth_locals_data(self, var_name, var_value):
-        self.depth_to_locals_data[self.depth][var_name] = var_value
+        self.local_scopes.set(var_name, var_value)
 
     def eval_condition(self, condition_node: ast.AST):
         if isinstance(condition_node, ast.BoolOp):
@@ -316,12 +343,11 @@ class ScriptActionsCompiler(ast.NodeVisitor):
         )
 
     def eval_node(self, node: ast.AST):
-        return self.eval_code(
-            compile(ast.Expression(body=node), filename="<ast>", mode="eval")
-        )
+        # evaluating the cached code object is faster than walking the node's expression in python
+        return self.eval_code(compile_expression(node, self.source_digest))
 
     def eval_code(self, code):
-        return eval(code, self.project_globals_data, self.get_current_locals_data())
+        return eval(code, self.project_globals_data, self.local_scopes.locals_data)
 
 
 # ---------------------------------------------------------------------------- #
@@ -0,0 +1,17 @@
+from typing import Any
+
+
+def copy_json_data(data: Any) -> Any:
+    """
+    Util function to deep copy data made of dicts, lists and primitives (loaded JSON), faster than copy.deepcopy.
+    Subclasses of dict and list (such as template data instances) are copied as plain dicts and lists
+    """
+    if type(data) is dict:
+        return {key: copy_json_data(value) for key, value in data.items()}
+    if type(data) is list:
+        return [copy_json_data(value) for value in data]
+    if isinstance(data, dict):
+        return {key: copy_json_data(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [copy_json_data(value) for value in data]
+    return data
@@ -0,0 +1,12 @@
+import hashlib
+import string
+
+KEY_CHARACTERS = string.ascii_letters + string.digits
+
+
+def generate_key_from_text(text: str) -> str:
+    """
+    Util function to generate a key in the format of generate_random_key, the same text always generates the same key
+    """
+    digest = hashlib.sha256(text.encode()).digest()
+    return "".join(KEY_CHARACTERS[byte % len(KEY_CHARACTERS)] for byte in digest[:10])
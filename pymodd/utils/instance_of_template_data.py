@@ -0,0 +1,116 @@
+from typing import Any, Mapping
+
+from pymodd.utils.copy_json_data import copy_json_data
+
+
+class ReadOnlyTemplateDict(dict):
+    """Dict of a template shared by many instances, editing it raises a TypeError"""
+
+    __slots__ = ()
+
+    def _raise_read_only(self, *args, **kwargs):
+        raise TypeError(
+            "template data is shared by every instance of it and can not be edited, edit an instance of it instead"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _raise_read_only
+    clear = pop = popitem = setdefault = update = _raise_read_only
+
+    def __reduce__(self):
+        return (ReadOnlyTemplateDict, (dict(self),))
+
+
+class ReadOnlyTemplateList(list):
+    """List of a template shared by many instances, editing it raises a TypeError"""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = (
+        ReadOnlyTemplateDict._raise_read_only
+    )
+    append = clear = extend = insert = pop = remove = reverse = sort = (
+        ReadOnlyTemplateDict._raise_read_only
+    )
+
+    def __reduce__(self):
+        return (ReadOnlyTemplateList, (list(self),))
+
+
+class TemplateDataInstance(dict):
+    """
+    Data created from a read only template. It starts as a copy of the template's first level, its nested dicts and lists
+    stay shared with the template until they are looked up by key, then they are copied the same way.
+    Only the paths that are edited (or looked up to be edited) are copied, iterating the data leaves it shared
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: Any) -> Any:
+        value = dict.__getitem__(self, key)
+        if type(value) in _INSTANCE_TYPE_OF_TEMPLATE_TYPE:
+            value = _INSTANCE_TYPE_OF_TEMPLATE_TYPE[type(value)](value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            dict.__setitem__(self, key, default)
+        return self[key]
+
+    def __reduce__(self):
+        return (TemplateDataInstance, (dict(self),))
+
+
+class TemplateListInstance(list):
+    """List created from a read only template list, see TemplateDataInstance"""
+
+    __slots__ = ()
+
+    def __getitem__(self, index: Any) -> Any:
+        value = list.__getitem__(self, index)
+        if type(index) is not slice and type(value) in _INSTANCE_TYPE_OF_TEMPLATE_TYPE:
+            value = _INSTANCE_TYPE_OF_TEMPLATE_TYPE[type(value)](value)
+            list.__setitem__(self, index, value)
+        return value
+
+    def __reduce__(self):
+        return (TemplateListInstance, (list(self),))
+
+
+_INSTANCE_TYPE_OF_TEMPLATE_TYPE: dict[type, type] = {
+    ReadOnlyTemplateDict: TemplateDataInstance,
+    ReadOnlyTemplateList: TemplateListInstance,
+}
+
+
+def read_only_template_data(template_data: dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Util function to make a template shared by many instances read only, its dicts and lists can no longer be edited.
+    Instances are made with instance_of_template_data
+    """
+    return _read_only_value(template_data)
+
+
+def instance_of_template_data(template_data: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Util function to create data from a template shared by many instances, the data can be edited like a copy of it.
+    Templates made by read_only_template_data are not copied, the instance shares them and copies the paths it edits
+    """
+    if type(template_data) is ReadOnlyTemplateDict:
+        return TemplateDataInstance(template_data)
+    return copy_json_data(template_data)
+
+
+def _read_only_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return ReadOnlyTemplateDict(
+            {key: _read_only_value(item_value) for key, item_value in value.items()}
+        )
+    if isinstance(value, list):
+        return ReadOnlyTemplateList(
+            _read_only_value(item_value) for item_value in value
+        )
+    return value
@@ -2,12 +2,16 @@ from enum import Enum
 from typing import Any
 
 from pymodd.core.base import Base
+from pymodd.core.function import Function
 
 
 def to_dict(obj: Any) -> Any:
     """
-    Util function to convert any object into a dict/JSON acceptable value
+    Util function to convert any object into a dict/JSON acceptable value.
+    The data of functions is shared (see Function.shared_data), it must not be edited
     """
+    if isinstance(obj, Function):
+        return obj.shared_data()
     if isinstance(obj, Base):
         return obj.to_dict()
     if isinstance(obj, Enum):
@@ -2,35 +2,57 @@ from typing import Any
 from caseconverter import camelcase
 from pymodd.core.base import Base
 
+_PRIMITIVE_TO_TYPE = {
+    int: "number",
+    float: "number",
+    complex: "number",
+    bool: "boolean",
+    str: "string",
+}
 
-def type_of_item(item: Any) -> str:
-    primitive_to_type = {
-        int: "number",
-        float: "number",
-        complex: "number",
-        bool: "boolean",
-        str: "string",
-    }
+# marks a class that is neither a VariableType nor a Function
+_NO_OPERAND_TYPE = ("", "")
+
+# the kind ("VariableType" or "Function") and operand type of each class, found once per class
+_class_to_operand_type: dict[type, tuple[str, str]] = {}
 
-    if primitive := primitive_to_type.get(type(item)):
+
+def type_of_item(item: Any) -> str:
+    if primitive := _PRIMITIVE_TO_TYPE.get(type(item)):
         return primitive
     if isinstance(item, Base):
-        base_classes = item.__class__.mro()
-        for i, base_class in enumerate(base_classes):
-            # TODO: find better way to do this? this is hacky
-            if "VariableType" == base_class.__name__:
-                if hasattr(item, "data_type"):
-                    return (
-                        item.data_type.value  # pyright: ignore[reportAttributeAccessIssue]
-                    )
-                return camelcase(base_classes[i - 1].__name__)
-
-            if "Function" == base_class.__name__:
-                if (
-                    item.function  # pyright: ignore[reportUnknownMemberType, reportAttributeAccessIssue]
-                    == "undefinedValue"
-                ):
-                    return ""
-                return camelcase(base_classes[i - 1].__name__)
+        item_class = type(item)
+        if (operand_type := _class_to_operand_type.get(item_class)) is None:
+            operand_type = _class_to_operand_type[item_class] = _operand_type_of_class(
+                item_class
+            )
+        kind, type_name = operand_type
+        if kind == "VariableType":
+            if hasattr(item, "data_type"):
+                return (
+                    item.data_type.value  # pyright: ignore[reportAttributeAccessIssue]
+                )
+            return type_name
+        if kind == "Function":
+            if (
+                item.function  # pyright: ignore[reportUnknownMemberType, reportAttributeAccessIssue]
+                == "undefinedValue"
+            ):
+                return ""
+            return type_name
     print("uh oh")
     return ""
+
+
+def _operand_type_of_class(item_class: type) -> tuple[str, str]:
+    """
+    Returns:
+        tuple(str, str): the first of VariableType and Function found in the mro of the class, and the
+        camel cased name of the class before it, which is the operand type of its items
+    """
+    base_classes = item_class.mro()
+    for i, base_class in enumerate(base_classes):
+        # TODO: find better way to do this? this is hacky
+        if base_class.__name__ in ("VariableType", "Function"):
+            return (base_class.__name__, camelcase(base_classes[i - 1].__name__))
+    return _NO_OPERAND_TYPE
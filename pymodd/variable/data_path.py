@@ -0,0 +1,85 @@
+from __future__ import annotations
+from typing import Any, Iterable, Union
+
+# marks a value that is missing from the data
+_MISSING = object()
+
+
+class DataPath:
+    """
+    Path to a value in the JSON data of a variable, compiled once and shared by every variable using it.
+    Paths are written as:
+        keyword argument names: key1_key2 => data['key1']['key2']
+        dotted strings: "key_1.key_2" => data['key_1']['key_2']
+        tuples of keys: ("key_1", "key_2") => data['key_1']['key_2']
+    """
+
+    _spelling_to_path: dict[Any, DataPath] = {}
+
+    def __init__(self, keys: tuple[str, ...], spelling: str | None = None):
+        if len(keys) == 0 or not all(isinstance(key, str) for key in keys):
+            raise ValueError(f"invalid data path: {keys}")
+        self.keys = keys
+        self.parent_keys = keys[:-1]
+        self.last_key = keys[-1]
+        self.spelling = spelling if spelling is not None else ".".join(keys)
+
+    @classmethod
+    def of(cls, path: DataPathLike) -> DataPath:
+        """
+        Returns:
+            DataPath: the compiled path, the same object for every use of the same spelling
+        """
+        if isinstance(path, DataPath):
+            return path
+        if (data_path := cls._spelling_to_path.get(path)) is not None:
+            return data_path
+        if isinstance(path, tuple):
+            data_path = DataPath(path)
+        elif isinstance(path, str):
+            keys = path.split(".") if "." in path else path.split("_")
+            data_path = DataPath(tuple(keys), spelling=path)
+        else:
+            raise ValueError(f"invalid data path: {path}")
+        cls._spelling_to_path[path] = data_path
+        return data_path
+
+    def get(self, data: Any, default: Any = None) -> Any:
+        """
+        Returns:
+            Any: the value at the path, or the default if the path does not exist in the data
+        """
+        for key in self.keys:
+            data = data.get(key, _MISSING) if isinstance(data, dict) else _MISSING
+            if data is _MISSING:
+                return default
+        return data
+
+    def set(self, data: dict[str, Any], value: Any):
+        """Sets the value at the path, the dicts leading to it must already exist"""
+        for key in self.parent_keys:
+            data = data[key]
+        data[self.last_key] = value
+
+    def set_in_each(self, datas: Iterable[dict[str, Any]], values: Iterable[Any]):
+        """Sets the value at the path in each data, for applying one override to many variables at once"""
+        parent_keys, last_key = self.parent_keys, self.last_key
+        for data, value in zip(datas, values):
+            for key in parent_keys:
+                data = data[key]
+            data[last_key] = value
+
+    def __str__(self) -> str:
+        return self.spelling
+
+    def __repr__(self) -> str:
+        return f"DataPath({self.keys!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, DataPath) and self.keys == other.keys
+
+    def __hash__(self) -> int:
+        return hash(self.keys)
+
+
+DataPathLike = Union[str, tuple[str, ...], DataPath]
@@ -0,0 +1,242 @@
+from __future__ import annotations
+import csv
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from caseconverter import macrocase
+
+from pymodd.variable.data_path import DataPath, DataPathLike
+from pymodd.variable.data_type import DataType
+from pymodd.variable.variable_type import VariableType
+from pymodd.variable_types import VariableBase
+
+try:
+    import pyarrow.parquet as parquet
+except ImportError:
+    parquet = None
+
+# rows read at once from parquet files
+PARQUET_BATCH_SIZE = 1024
+
+NAME_PATH = DataPath.of(("name",))
+
+# attribute name of variables whose names have no letters or numbers
+UNNAMED_ATTRIBUTE_NAME = "UNNAMED"
+
+# absolute paths of the table files read, watched for changes by `pymodd compile --watch`
+read_table_files: set[Path] = set()
+
+
+def read_table_rows(file_path: str | Path) -> Iterator[dict[str, Any]]:
+    """Reads the rows of a table file one by one. Supported files are .csv, .tsv, .json (a list of rows, or
+    rows by id), .jsonl/.ndjson (one row per line), and .parquet (requires the pyarrow package)
+
+    Returns:
+        Iterator[dict]: rows by their column names. values of csv files are strings
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    read_table_files.add(file_path.absolute())
+    if suffix in (".csv", ".tsv"):
+        with open(file_path, newline="", encoding="utf-8-sig") as file:
+            yield from csv.DictReader(file, delimiter="\t" if suffix == ".tsv" else ",")
+    elif suffix in (".jsonl", ".ndjson"):
+        with open(file_path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip() != "":
+                    yield json.loads(line)
+    elif suffix == ".json":
+        with open(file_path, encoding="utf-8") as file:
+            table_data = json.load(file)
+        if isinstance(table_data, dict):
+            for row_id, row in table_data.items():
+                yield {"id": row_id, **row}
+        else:
+            yield from table_data
+    elif suffix == ".parquet":
+        if parquet is None:
+            raise ImportError(
+                "parquet tables require the pyarrow package, install it with `pip install pymodd[parquet]`"
+            )
+        for batch in parquet.ParquetFile(file_path).iter_batches(
+            batch_size=PARQUET_BATCH_SIZE
+        ):
+            yield from batch.to_pylist()
+    else:
+        raise ValueError(f"unsupported table file: {file_path}")
+
+
+def variables_from_table(
+    table: str | Path | Iterable[dict[str, Any]],
+    variable_type: type[VariableType],
+    id_column: str = "id",
+    column_to_path: dict[str, DataPathLike] | None = None,
+    ignored_columns: Iterable[str] = (),
+    json_columns: Iterable[str] = (),
+    data_type_column: str = "dataType",
+) -> Iterator[VariableType]:
+    """Creates a variable for each row of a table. Every column other than the id is a user provided value,
+    set at the path with the column's name (key1_key2 or key1.key2) unless column_to_path gives another one.
+    Empty cells are skipped. Cells of csv files are text, unless their column is one of json_columns
+
+    Args:
+        table (str | Path | Iterable[dict]): path of the table file (see read_table_rows), or its rows
+
+        variable_type (type[VariableType]): class of the variables, like ItemTypeBase
+
+        id_column (str, optional): column holding the ids of the variables. Defaults to "id".
+
+        column_to_path (dict[str, DataPathLike] | None, optional): paths of columns that are not named after them. Defaults to None.
+
+        ignored_columns (Iterable[str], optional): columns that are not user provided values. Defaults to ().
+
+        json_columns (Iterable[str], optional): columns of csv files whose cells are read as JSON (numbers, true, [1, 2]...).
+            Defaults to ().
+
+        data_type_column (str, optional): column holding the data types of VariableBase, EntityVariableBase and
+            PlayerVariableBase variables, like "number". Defaults to "dataType".
+
+    Returns:
+        Iterator[VariableType]: the variables, in the order of the rows
+    """
+    is_text_table = isinstance(table, (str, Path)) and Path(table).suffix.lower() in (
+        ".csv",
+        ".tsv",
+    )
+    rows = read_table_rows(table) if isinstance(table, (str, Path)) else table
+    column_to_path = column_to_path if column_to_path is not None else {}
+    json_columns = set(json_columns)
+    is_typed_variable_type = issubclass(variable_type, VariableBase)
+    ignored_columns = set(ignored_columns)
+    ignored_columns.add(id_column)
+    if is_typed_variable_type:
+        ignored_columns.add(data_type_column)
+    for row_number, row in enumerate(rows, start=1):
+        variable_id = row.get(id_column)
+        if variable_id is None or variable_id == "":
+            raise ValueError(f"row {row_number} of the table has no {id_column}")
+        if is_typed_variable_type:
+            variable = variable_type(
+                str(variable_id),
+                _data_type_of_row(row, data_type_column, row_number),
+            )
+        else:
+            variable = variable_type(str(variable_id))
+        for column, cell in row.items():
+            if (
+                column in ignored_columns
+                or column is None
+                or cell is None
+                or cell == ""
+            ):
+                continue
+            path = DataPath.of(column_to_path.get(column, column))
+            if is_text_table and column in json_columns:
+                cell = _value_of_json_cell(cell, column, row_number)
+            _ = variable.with_value(path, cell)
+        yield variable
+
+
+def add_variables_from_table(
+    variable_class: type,
+    table: str | Path | Iterable[dict[str, Any]],
+    variable_type: type[VariableType],
+    id_column: str = "id",
+    column_to_path: dict[str, DataPathLike] | None = None,
+    ignored_columns: Iterable[str] = (),
+    json_columns: Iterable[str] = (),
+    data_type_column: str = "dataType",
+) -> type:
+    """Adds the variables of a table to a variable class of game_variables.py, like the hand written ones.
+    Their attribute names are made from their names (or ids when a row sets no name), for example "Frog Sword" => FROG_SWORD.
+    See variables_from_table for the other arguments
+
+    Returns:
+        type: the variable class
+    """
+    for variable in variables_from_table(
+        table,
+        variable_type,
+        id_column,
+        column_to_path,
+        ignored_columns,
+        json_columns,
+        data_type_column,
+    ):
+        name = variable.data_path_to_new_value.get(NAME_PATH, variable.id)
+        attribute_name = attribute_name_of(str(name))
+        attribute_number = 1
+        unique_attribute_name = attribute_name
+        while unique_attribute_name in vars(variable_class):
+            attribute_number += 1
+            unique_attribute_name = f"{attribute_name}_{attribute_number}"
+        setattr(variable_class, unique_attribute_name, variable)
+    return variable_class
+
+
+def variable_class_from_table(
+    class_name: str,
+    table: str | Path | Iterable[dict[str, Any]],
+    variable_type: type[VariableType],
+    **table_kwargs,
+) -> type:
+    """Creates a variable class of game_variables.py holding the variables of a table.
+    Example:
+        ItemType = variable_class_from_table(
+            "ItemType", "balance/items.csv", ItemTypeBase, column_to_path={"damage": "bonus.damage"}, json_columns=["damage"]
+        )
+
+    Args:
+        class_name (str): name of the class, one of the class names of game_variables.py for the variables to be compiled
+
+        **table_kwargs: arguments of add_variables_from_table
+
+    Returns:
+        type: the variable class
+    """
+    return add_variables_from_table(
+        type(class_name, (), {}), table, variable_type, **table_kwargs
+    )
+
+
+def attribute_name_of(name: str) -> str:
+    """
+    Returns:
+        str: name in shouty snake case, starting with "N_" when it would start with a number ("1st" => N_1ST).
+            Attributes starting with "_" are not compiled, so names are never given that prefix
+    """
+    attribute_name = "".join(
+        character if character.isalnum() else " " for character in macrocase(name)
+    )
+    attribute_name = "_".join(attribute_name.split())
+    if attribute_name == "":
+        return UNNAMED_ATTRIBUTE_NAME
+    if attribute_name[0].isdigit():
+        return f"N_{attribute_name}"
+    return attribute_name
+
+
+def _data_type_of_row(
+    row: dict[str, Any], data_type_column: str, row_number: int
+) -> DataType:
+    data_type_value = row.get(data_type_column)
+    if data_type_value is None or data_type_value == "":
+        raise ValueError(
+            f"row {row_number} of the table has no {data_type_column}, which variables need to be created"
+        )
+    try:
+        return DataType(data_type_value)
+    except ValueError:
+        raise ValueError(
+            f"row {row_number} of the table has an unknown {data_type_column}: {data_type_value}"
+        ) from None
+
+
+def _value_of_json_cell(cell: str, column: str, row_number: int) -> Any:
+    try:
+        return json.loads(cell)
+    except ValueError:
+        raise ValueError(
+            f"the {column} of row {row_number} of the table is not JSON: {cell}"
+        ) from None
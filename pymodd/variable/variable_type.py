@@ -1,50 +1,83 @@
-from typing import Any
+from typing import Any, Mapping
 
 from pymodd.core.function import Function
 from pymodd.function.type import Calculation, Concat, Exponent
 from pymodd.utils.generate_random_key import generate_random_key
+from pymodd.utils.instance_of_template_data import instance_of_template_data
 from pymodd.utils.type_of_item import type_of_item
+from pymodd.variable.data_path import DataPath, DataPathLike
 from pymodd.variable.data_type import DataType
 
 
 class VariableType(Function):
+    __slots__ = ("id", "data_type", "data_path_to_new_value")
+
     def __init__(self, id: str | None = None, **data_path_to_new_values_kwargs) -> None:
         """
         Args:
         id: id of the variable. will be generated if none is given
         **data_path_to_new_values_kwargs: key represents the path to the value in JSON, value represents the new value.
             Example: data['key1']['key2'] = 1 => key1_key2 = 1
-            Check updated_data_with_user_provided_values for its use case.
+            Check updated_data_with_user_provided_values for its use case, and with_value for keys containing "_".
         """
         super().__init__()
         self.id = generate_random_key() if id is None else id
         self.data_type: DataType | None = None
-        self.data_keys_to_new_values = data_path_to_new_values_kwargs.items()
+        self.data_path_to_new_value: dict[DataPath, Any] = {
+            DataPath.of(path): new_value
+            for path, new_value in data_path_to_new_values_kwargs.items()
+        }
         self.function = {
             "direct": True,
             "value": self.id,
         }
 
+    @property
+    def data_keys_to_new_values(self):
+        """User provided values by the spellings of their paths"""
+        return [
+            (str(path), new_value)
+            for path, new_value in self.data_path_to_new_value.items()
+        ]
+
+    def with_value(self, path: DataPathLike, new_value: Any):
+        """
+        Adds a user provided value by an explicit path, for keys that contain "_".
+        Example:
+            UnitTypeBase('RAND_ID').with_value(('ai', 'max_range'), 500).with_value('body.width', 40) ->
+            data['ai']['max_range'] = 500
+            data['body']['width'] = 40
+
+        Returns:
+            the variable, so calls can be chained
+        """
+        self.data_path_to_new_value[DataPath.of(path)] = new_value
+        return self
+
     def updated_data_with_user_provided_values(
         self, data: dict[str, Any]
     ) -> dict[str, Any]:
         """
-        Updates the passed in variable data with user provided values from data_key_to_new_values.
+        Updates the passed in variable data with user provided values from data_path_to_new_value.
         Example:
             ItemTypeBase('RAND_ID', delayBeforeUse=5, bulletStartPosition_rotation = 180) ->
-            data_keys_to_new_values = {'delayBeforeUse': 5, 'bulletStartPosition_rotation': 180} ->
+            data_path_to_new_value = {DataPath(('delayBeforeUse',)): 5, DataPath(('bulletStartPosition', 'rotation')): 180} ->
             data['delayBeforeUse'] = 5
             data['bulletStartPosition']['rotation'] = 180
         """
-        for path_to_old, new_value in self.data_keys_to_new_values:
-            keys = str(path_to_old).split("_")
-            d = data
-            for i, path_to_old in enumerate(keys):
-                if i == len(keys) - 1:
-                    d[path_to_old] = new_value
-                d = d[path_to_old]
+        for path, new_value in self.data_path_to_new_value.items():
+            path.set(data, new_value)
         return data
 
+    def template_data_instance(
+        self, template_data: Mapping[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Creates the data of this variable from a read only template shared by every variable of its type (see read_only_template_data).
+        The data can be edited like a copy of the template, it shares the template's nested data until it is edited
+        """
+        return instance_of_template_data(template_data)
+
     def get_template_data(self) -> dict[str, Any]:
         raise NotImplementedError("get_template_data method not implemented")
 
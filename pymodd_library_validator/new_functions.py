@@ -2,6 +2,8 @@
 
 
 class GetCameraPosition(Position):
+	__slots__ = ()
+
 	def __init__(self, ):
 		self.function = 'getCameraPosition'
 		self.options = {
@@ -9,6 +11,8 @@ class GetCameraPosition(Position):
 
 
 class LastClickedUiElementId(String):
+	__slots__ = ()
+
 	def __init__(self, player):
 		self.function = 'lastClickedUiElementId'
 		self.options = {
@@ -17,6 +21,8 @@ class LastClickedUiElementId(String):
 
 
 class RealtimeCssOfPlayer(String):
+	__slots__ = ()
+
 	def __init__(self, player):
 		self.function = 'realtimeCSSOfPlayer'
 		self.options = {
@@ -25,6 +31,8 @@ class RealtimeCssOfPlayer(String):
 
 
 class MathCeiling(Number):
+	__slots__ = ()
+
 	def __init__(self, value):
 		self.function = 'mathCeiling'
 		self.options = {
@@ -33,6 +41,8 @@ class MathCeiling(Number):
 
 
 class ToUpperCase(String):
+	__slots__ = ()
+
 	def __init__(self, string):
 		self.function = 'toUpperCase'
 		self.options = {
@@ -41,6 +51,8 @@ class ToUpperCase(String):
 
 
 class GetHighScoreOfPlayer(Number):
+	__slots__ = ()
+
 	def __init__(self, player):
 		self.function = 'getHighScoreOfPlayer'
 		self.options = {
@@ -49,6 +61,8 @@ class GetHighScoreOfPlayer(Number):
 
 
 class IsUnitMoving(Boolean):
+	__slots__ = ()
+
 	def __init__(self, unit):
 		self.function = 'isUnitMoving'
 		self.options = {
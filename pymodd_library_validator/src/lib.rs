@@ -138,6 +138,7 @@ pub fn generate_function_class_from_object(object: &Object) -> String {
     );
     format!(
         "class {}({function_category}):\n\
+            \t__slots__ = ()\n\n\
             \tdef __init__(self, {}):\n\
                 \t\tself.function = '{function_name}'\n\
                 \t\tself.options = {{\n\
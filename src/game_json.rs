@@ -0,0 +1,346 @@
+use std::{collections::HashSet, fmt};
+
+use pyo3::{
+    exceptions::{PyOSError, PyValueError},
+    prelude::*,
+    types::{PyDict, PyList},
+};
+use serde::de::{self, DeserializeSeed, Deserializer, MapAccess, SeqAccess, Visitor};
+use serde_json::value::RawValue;
+
+/// json of a game data category that is left unparsed, it is written back to the compiled file as it is
+#[pyclass(module = "pymodd._pymodd_helper")]
+pub struct RawJson {
+    #[pyo3(get)]
+    pub json: String,
+}
+
+#[pymethods]
+impl RawJson {
+    #[new]
+    fn new(json: String) -> Self {
+        RawJson { json }
+    }
+
+    fn __repr__(&self) -> String {
+        format!("RawJson(<{} characters>)", self.json.len())
+    }
+}
+
+#[pyfunction]
+pub fn load_game_json_file(
+    py: Python,
+    json_file_path: &str,
+    parsed_data_categories: Option<Vec<String>>,
+) -> PyResult<PyObject> {
+    let json_file_content = std::fs::read_to_string(json_file_path)
+        .map_err(|err| PyOSError::new_err(format!("{json_file_path}: {err}")))?;
+    let parsed_data_categories =
+        parsed_data_categories.map(|categories| categories.into_iter().collect());
+
+    let mut deserializer = serde_json::Deserializer::from_str(&json_file_content);
+    deserializer.disable_recursion_limit();
+    let deserializer = serde_stacker::Deserializer::new(&mut deserializer);
+    PyObjectSeed {
+        py,
+        position: Position::Root,
+        parsed_data_categories: &parsed_data_categories,
+    }
+    .deserialize(deserializer)
+    .map_err(|err| PyValueError::new_err(format!("error parsing {json_file_path}: {err}")))
+}
+
+#[derive(Clone, Copy)]
+enum Position {
+    Root,
+    // the object holding the game data categories
+    Data,
+    Nested,
+}
+
+/// deserializes json straight into python objects, keeping the order of the keys
+struct PyObjectSeed<'py, 'a> {
+    py: Python<'py>,
+    position: Position,
+    // categories of the game data that are parsed, every category is parsed when None
+    parsed_data_categories: &'a Option<HashSet<String>>,
+}
+
+impl<'py, 'a> PyObjectSeed<'py, 'a> {
+    fn at(&self, position: Position) -> Self {
+        PyObjectSeed {
+            py: self.py,
+            position,
+            parsed_data_categories: self.parsed_data_categories,
+        }
+    }
+}
+
+impl<'de, 'py, 'a> DeserializeSeed<'de> for PyObjectSeed<'py, 'a> {
+    type Value = PyObject;
+
+    fn deserialize<D>(self, deserializer: D) -> Result<Self::Value, D::Error>
+    where
+        D: Deserializer<'de>,
+    {
+        deserializer.deserialize_any(self)
+    }
+}
+
+impl<'de, 'py, 'a> Visitor<'de> for PyObjectSeed<'py, 'a> {
+    type Value = PyObject;
+
+    fn expecting(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
+        formatter.write_str("any json value")
+    }
+
+    fn visit_bool<E>(self, value: bool) -> Result<Self::Value, E>
+    where
+        E: de::Error,
+    {
+        Ok(value.into_py(self.py))
+    }
+
+    fn visit_i64<E>(self, value: i64) -> Result<Self::Value, E>
+    where
+        E: de::Error,
+    {
+        Ok(value.into_py(self.py))
+    }
+
+    fn visit_u64<E>(self, value: u64) -> Result<Self::Value, E>
+    where
+        E: de::Error,
+    {
+        Ok(value.into_py(self.py))
+    }
+
+    fn visit_f64<E>(self, value: f64) -> Result<Self::Value, E>
+    where
+        E: de::Error,
+    {
+        Ok(value.into_py(self.py))
+    }
+
+    fn visit_str<E>(self, value: &str) -> Result<Self::Value, E>
+    where
+        E: de::Error,
+    {
+        Ok(value.into_py(self.py))
+    }
+
+    fn visit_unit<E>(self) -> Result<Self::Value, E>
+    where
+        E: de::Error,
+    {
+        Ok(self.py.None())
+    }
+
+    fn visit_none<E>(self) -> Result<Self::Value, E>
+    where
+        E: de::Error,
+    {
+        Ok(self.py.None())
+    }
+
+    fn visit_seq<A>(self, mut seq: A) -> Result<Self::Value, A::Error>
+    where
+        A: SeqAccess<'de>,
+    {
+        let list = PyList::empty(self.py);
+        while let Some(element) = seq.next_element_seed(self.at(Position::Nested))? {
+            list.append(element).map_err(de::Error::custom)?;
+        }
+        Ok(list.into_py(self.py))
+    }
+
+    fn visit_map<A>(self, mut map: A) -> Result<Self::Value, A::Error>
+    where
+        A: MapAccess<'de>,
+    {
+        let dict = PyDict::new(self.py);
+        while let Some(key) = map.next_key::<String>()? {
+            let value = match self.position {
+                Position::Root if key == "data" => map.next_value_seed(self.at(Position::Data))?,
+                Position::Data
+                    if self
+                        .parsed_data_categories
+                        .as_ref()
+                        .map_or(false, |categories| !categories.contains(&key)) =>
+                {
+                    let raw_value: Box<RawValue> = map.next_value()?;
+                    Py::new(
+                        self.py,
+                        RawJson {
+                            json: raw_value.get().to_string(),
+                        },
+                    )
+                    .map_err(de::Error::custom)?
+                    .into_py(self.py)
+                }
+                _ => map.next_value_seed(self.at(Position::Nested))?,
+            };
+            dict.set_item(key, value).map_err(de::Error::custom)?;
+        }
+        Ok(dict.into_py(self.py))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::path::PathBuf;
+
+    use pyo3::{
+        exceptions::{PyOSError, PyValueError},
+        prelude::*,
+        types::PyDict,
+    };
+
+    use super::{load_game_json_file, RawJson};
+
+    /// loads the content written to a temporary game json file, tests run in parallel so each one names its file
+    fn load_game_json_content(
+        py: Python,
+        file_name: &str,
+        content: &str,
+        parsed_data_categories: Option<Vec<&str>>,
+    ) -> PyResult<PyObject> {
+        let path = game_json_file_path(file_name);
+        std::fs::write(&path, content).unwrap();
+        let game_data = load_game_json_file(
+            py,
+            path.to_str().unwrap(),
+            parsed_data_categories
+                .map(|categories| categories.into_iter().map(String::from).collect()),
+        );
+        std::fs::remove_file(&path).unwrap();
+        game_data
+    }
+
+    fn game_json_file_path(file_name: &str) -> PathBuf {
+        std::env::temp_dir().join(format!(
+            "pymodd_game_json_{}_{file_name}",
+            std::process::id()
+        ))
+    }
+
+    #[test]
+    fn load_floats_like_python() {
+        let numbers = [
+            "0.1",
+            "0.30000000000000004",
+            "2.2250738585072011e-308",
+            "1.7976931348623157e308",
+            "5e-324",
+            "9007199254740993.0",
+            "1.00000000000000011102230246251565404236316680908203125",
+        ];
+        Python::with_gil(|py| {
+            let game_data = load_game_json_content(
+                py,
+                "floats.json",
+                &format!("[{}]", numbers.join(", ")),
+                None,
+            )
+            .unwrap();
+            assert_eq!(
+                game_data.extract::<Vec<f64>>(py).unwrap(),
+                numbers
+                    .iter()
+                    .map(|number| number.parse::<f64>().unwrap())
+                    .collect::<Vec<f64>>()
+            );
+        });
+    }
+
+    #[test]
+    fn load_keys_in_order() {
+        Python::with_gil(|py| {
+            let game_data =
+                load_game_json_content(py, "keys.json", r#"{"b": 1, "a": {"d": 2, "c": 3}}"#, None)
+                    .unwrap();
+            let game_data: &PyDict = game_data.as_ref(py).downcast().unwrap();
+            assert_eq!(
+                game_data.keys().extract::<Vec<String>>().unwrap(),
+                ["b", "a"]
+            );
+            let nested_data: &PyDict = game_data.get_item("a").unwrap().downcast().unwrap();
+            assert_eq!(
+                nested_data.keys().extract::<Vec<String>>().unwrap(),
+                ["d", "c"]
+            );
+        });
+    }
+
+    #[test]
+    fn load_unparsed_data_categories_as_raw_json() {
+        Python::with_gil(|py| {
+            let game_data = load_game_json_content(
+                py,
+                "categories.json",
+                r#"{"title": "game", "data": {"scripts": {"speed": 1.5}, "map": {"layers": [1, 2.50]}}}"#,
+                Some(vec!["scripts"]),
+            )
+            .unwrap();
+            let game_data: &PyDict = game_data.as_ref(py).downcast().unwrap();
+            assert_eq!(
+                game_data
+                    .get_item("title")
+                    .unwrap()
+                    .extract::<String>()
+                    .unwrap(),
+                "game"
+            );
+            let data: &PyDict = game_data.get_item("data").unwrap().downcast().unwrap();
+            let scripts_data: &PyDict = data.get_item("scripts").unwrap().downcast().unwrap();
+            assert_eq!(
+                scripts_data
+                    .get_item("speed")
+                    .unwrap()
+                    .extract::<f64>()
+                    .unwrap(),
+                1.5
+            );
+            let map_data: PyRef<RawJson> = data.get_item("map").unwrap().extract().unwrap();
+            assert_eq!(map_data.json, r#"{"layers": [1, 2.50]}"#);
+        });
+    }
+
+    #[test]
+    fn load_every_data_category_when_none_are_given() {
+        Python::with_gil(|py| {
+            let game_data = load_game_json_content(
+                py,
+                "every_category.json",
+                r#"{"data": {"map": {"layers": []}}}"#,
+                None,
+            )
+            .unwrap();
+            let game_data: &PyDict = game_data.as_ref(py).downcast().unwrap();
+            let data: &PyDict = game_data.get_item("data").unwrap().downcast().unwrap();
+            assert!(data.get_item("map").unwrap().downcast::<PyDict>().is_ok());
+        });
+    }
+
+    #[test]
+    fn load_missing_file_fails() {
+        Python::with_gil(|py| {
+            let error = load_game_json_file(
+                py,
+                game_json_file_path("missing.json").to_str().unwrap(),
+                None,
+            )
+            .unwrap_err();
+            assert!(error.is_instance_of::<PyOSError>(py));
+        });
+    }
+
+    #[test]
+    fn load_invalid_json_fails() {
+        Python::with_gil(|py| {
+            let error = load_game_json_content(py, "invalid.json", r#"{"data": {"map": "#, None)
+                .unwrap_err();
+            assert!(error.is_instance_of::<PyValueError>(py));
+        });
+    }
+}
@@ -1,8 +1,10 @@
 mod game_data;
+mod game_json;
 mod project_generator;
 
 use crossterm::style::Stylize;
 use game_data::GameData;
+use game_json::{load_game_json_file, RawJson};
 use project_generator::ProjectGenerator;
 use pyo3::prelude::*;
 
@@ -64,6 +66,8 @@ fn _pymodd_helper(_py: Python, m: &PyModule) -> PyResult<()> {
         generate_project_from_json_file_content,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(load_game_json_file, m)?)?;
+    m.add_class::<RawJson>()?;
     m.add_function(wrap_pyfunction!(log_success, m)?)?;
     m.add_function(wrap_pyfunction!(log_error, m)?)?;
     m.add_function(wrap_pyfunction!(log_cli_start_message, m)?)?;
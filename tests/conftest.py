@@ -0,0 +1,41 @@
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+FROGE_PROJECT_DIRECTORY = Path(__file__).parent.parent.joinpath("examples", "froge")
+
+
+def _run_pymodd(project_directory: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from pymodd.console_scripts.pymodd_command import main_cli; main_cli()",
+            *args,
+        ],
+        cwd=project_directory,
+        capture_output=True,
+        text=True,
+    )
+
+
+@pytest.fixture
+def run_pymodd() -> Callable[..., subprocess.CompletedProcess]:
+    """Runs the pymodd command inside of a project directory"""
+    return _run_pymodd
+
+
+@pytest.fixture
+def froge_project(tmp_path: Path) -> Path:
+    """Copy of the froge example project, without its output and cache"""
+    project_directory = tmp_path.joinpath("froge")
+    _ = shutil.copytree(
+        FROGE_PROJECT_DIRECTORY,
+        project_directory,
+        ignore=shutil.ignore_patterns("output", ".pymodd_cache", "__pycache__"),
+    )
+    return project_directory
@@ -0,0 +1,201 @@
+import copy
+
+import pytest
+
+from pymodd.actions import set_variable, update_ui_target_for_player_for_miliseconds
+from pymodd.compiler.action_optimizer import MAX_SAFE_INTEGER, optimized_actions_data
+from pymodd.function.type import Calculation, Concat, Exponent
+from pymodd.functions import LastTriggeringPlayer
+from pymodd.script import Trigger, UiTarget, script
+from pymodd.variable.data_type import DataType
+from pymodd.variable_types import VariableBase
+
+SHOWS_DEBUG_MESSAGES = False
+SCORE = VariableBase("score", DataType.NUMBER)
+SCORE_DATA = {"function": "getVariable", "variableName": "score"}
+
+
+@script(triggers=[Trigger.GAME_START])
+def constant_script():
+    if 1 > 2:
+        update_ui_target_for_player_for_miliseconds(
+            UiTarget.CENTER,
+            Concat("debug ", "message"),
+            LastTriggeringPlayer(),
+            5000,
+        )
+    else:
+        set_variable(SCORE, Calculation(2, "*", 3) + Exponent(2, 10))
+    if SHOWS_DEBUG_MESSAGES == True:
+        update_ui_target_for_player_for_miliseconds(
+            UiTarget.CENTER, "debug", LastTriggeringPlayer(), 5000
+        )
+    if SCORE > 0:
+        set_variable(SCORE, Concat("a", "b"))
+
+
+def condition(operator: str, item_a, item_b, operand_type="number") -> list:
+    return [{"operandType": operand_type, "operator": operator}, item_a, item_b]
+
+
+def condition_action(conditions, then, else_=None) -> dict:
+    return {
+        "type": "condition",
+        "conditions": conditions,
+        "then": then,
+        "else": else_ if else_ is not None else [],
+    }
+
+
+def set_score_action(value) -> dict:
+    return {"type": "setVariable", "variableName": "score", "value": value}
+
+
+def calculation(operator: str, item_a, item_b) -> dict:
+    return {"function": "calculate", "items": [{"operator": operator}, item_a, item_b]}
+
+
+def test_optimized_script_matches_the_expected_actions():
+    compiled_script = constant_script()
+
+    actions_data = compiled_script.to_dict(globals(), optimizes_actions=True)["actions"]
+
+    assert actions_data == [
+        set_score_action(1030),
+        condition_action(condition(">", SCORE_DATA, 0), [set_score_action("ab")]),
+    ]
+    assert compiled_script.to_dict(globals())["actions"][0]["type"] == "condition"
+
+
+@pytest.mark.parametrize(
+    "function_data, folded_value",
+    [
+        (calculation("+", 1, 2), 3),
+        (calculation("-", 1, 2.5), -1.5),
+        (calculation("/", 6, 4), 1.5),
+        (calculation("/", 6, 3), 2),
+        (calculation("%", -7, 3), -1),
+        (calculation("*", calculation("+", 1, 2), 4), 12),
+        ({"function": "getExponent", "base": 2, "power": 0.5}, 2**0.5),
+        ({"function": "concat", "textA": "a", "textB": "b"}, "ab"),
+    ],
+)
+def test_functions_of_constants_are_folded(function_data, folded_value):
+    assert optimized_actions_data([set_score_action(function_data)]) == [
+        set_score_action(folded_value)
+    ]
+
+
+@pytest.mark.parametrize(
+    "function_data",
+    [
+        calculation("+", SCORE_DATA, 1),
+        calculation("/", 1, 0),
+        calculation("%", 1, 0),
+        calculation("*", MAX_SAFE_INTEGER, 2),
+        {"function": "getExponent", "base": 10, "power": 400},
+        {"function": "concat", "textA": "a", "textB": 1},
+    ],
+)
+def test_functions_that_are_not_written_the_same_by_javascript_are_kept(
+    function_data,
+):
+    actions_data = [set_score_action(function_data)]
+
+    assert optimized_actions_data(actions_data) is actions_data
+
+
+@pytest.mark.parametrize(
+    "conditions, branch",
+    [
+        (condition("==", 1, 1), "then"),
+        (condition("<=", 2, 1), "else"),
+        (condition("==", "a", "b", "string"), "else"),
+        (condition("!=", True, False, "boolean"), "then"),
+        (
+            condition("AND", condition("==", 1, 1), condition("<", 1, 2), "boolean"),
+            "then",
+        ),
+        (
+            condition(
+                "OR",
+                condition(">", SCORE_DATA, 0),
+                condition("==", 1, 1),
+                "boolean",
+            ),
+            "then",
+        ),
+        (
+            condition(
+                "AND",
+                condition(">", SCORE_DATA, 0),
+                condition("==", 1, 2),
+                "boolean",
+            ),
+            "else",
+        ),
+    ],
+)
+def test_condition_actions_known_while_compiling_are_replaced_by_their_branch(
+    conditions, branch
+):
+    branches = {"then": [set_score_action(1)], "else": [set_score_action(2)]}
+
+    optimized_actions = optimized_actions_data(
+        [condition_action(conditions, branches["then"], branches["else"])]
+    )
+
+    assert optimized_actions == branches[branch]
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        condition(">", SCORE_DATA, 0),
+        condition("<", "a", "b", "string"),
+        condition("==", 1, "1"),
+        condition(
+            "AND", condition("==", 1, 1), condition(">", SCORE_DATA, 0), "boolean"
+        ),
+    ],
+)
+def test_condition_actions_depending_on_the_game_are_kept(conditions):
+    optimized_actions = optimized_actions_data(
+        [condition_action(conditions, [set_score_action(1)])]
+    )
+
+    assert optimized_actions[0]["type"] == "condition"
+
+
+def test_known_parts_of_joined_conditions_are_dropped():
+    optimized_actions = optimized_actions_data(
+        [
+            condition_action(
+                condition(
+                    "AND",
+                    condition("==", 1, 1),
+                    condition(">", SCORE_DATA, 0),
+                    "boolean",
+                ),
+                [set_score_action(1)],
+            )
+        ]
+    )
+
+    assert optimized_actions[0]["conditions"] == condition(">", SCORE_DATA, 0)
+
+
+def test_disabled_actions_and_the_compiled_actions_are_left_unchanged():
+    disabled_action = {**set_score_action(calculation("+", 1, 2)), "disabled": True}
+    actions_data = [
+        disabled_action,
+        condition_action(
+            condition("==", 1, 1), [set_score_action(calculation("+", 1, 2))]
+        ),
+    ]
+    compiled_actions_data = copy.deepcopy(actions_data)
+
+    optimized_actions = optimized_actions_data(actions_data)
+
+    assert optimized_actions == [disabled_action, set_score_action(3)]
+    assert actions_data == compiled_actions_data
@@ -0,0 +1,50 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from pymodd import game
+
+FROGE_GAME_JSON_FILE = Path(__file__).parent.parent.joinpath(
+    "examples", "froge", "utils", "game.json"
+)
+
+IMPORT_WITHOUT_EXTENSION_CODE = """
+import importlib.abc
+import json
+import sys
+
+class ExtensionBlocker(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name == "pymodd._pymodd_helper":
+            raise ImportError("the extension is not built")
+
+sys.modules.pop("pymodd._pymodd_helper", None)
+import pymodd
+vars(pymodd).pop("_pymodd_helper", None)
+sys.meta_path.insert(0, ExtensionBlocker())
+
+from pymodd.game import load_game_data
+print(json.dumps(load_game_data(sys.argv[1])))
+"""
+
+
+def test_game_data_is_loaded_with_json_without_the_extension(monkeypatch):
+    monkeypatch.setattr(game, "_pymodd_helper", None)
+
+    game_data = game.load_game_data(str(FROGE_GAME_JSON_FILE))
+
+    expected_game_data = json.loads(FROGE_GAME_JSON_FILE.read_text())
+    assert game_data == expected_game_data
+    assert list(game_data["data"]) == list(expected_game_data["data"])
+
+
+def test_game_module_is_imported_without_the_extension():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_WITHOUT_EXTENSION_CODE, FROGE_GAME_JSON_FILE],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == json.loads(FROGE_GAME_JSON_FILE.read_text())
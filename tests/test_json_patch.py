@@ -0,0 +1,147 @@
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from pymodd.compiler.json_patch import apply_json_patch, game_data_patch
+
+OLD_GAME_DATA = {
+    "title": "Froge",
+    "data": {
+        "scripts": {
+            "initialize": {"name": "initialize", "actions": [{"type": "a"}]},
+            "removed": {"name": "removed", "actions": []},
+            "a/b~c": {"name": "escaped key", "actions": []},
+        },
+        "variables": {
+            "score": {"dataType": "number", "default": 0},
+            "flag": {"dataType": "boolean", "default": 1},
+        },
+        "unitTypes": {"frog": {"name": "Frog", "controls": {"abilities": {}}}},
+        "map": {"width": 64},
+    },
+}
+
+NEW_GAME_DATA = {
+    "title": "Froge",
+    "data": {
+        "scripts": {
+            "initialize": {
+                "name": "initialize",
+                "actions": [{"type": "a"}, {"type": "b"}],
+            },
+            "a/b~c": {"name": "escaped key", "actions": [{"type": "c"}]},
+            "added": {"name": "added", "actions": []},
+        },
+        "variables": {
+            "score": {"dataType": "number", "default": 0.0},
+            "flag": {"dataType": "boolean", "default": True},
+        },
+        "unitTypes": {
+            "frog": {"name": "Frog", "controls": {"abilities": {"e": {"cost": {}}}}}
+        },
+        "itemTypes": {"sword": {"name": "Sword"}},
+        "map": {"width": 64},
+    },
+}
+
+CATEGORIES = ["scripts", "variables", "unitTypes", "itemTypes", "shops"]
+
+
+def test_applying_the_patch_to_the_old_game_data_gives_the_new_game_data():
+    patch = game_data_patch(OLD_GAME_DATA, NEW_GAME_DATA, CATEGORIES)
+
+    patched_game_data = apply_json_patch(copy.deepcopy(OLD_GAME_DATA), patch)
+
+    assert json.dumps(patched_game_data, sort_keys=True) == json.dumps(
+        NEW_GAME_DATA, sort_keys=True
+    )
+
+
+def test_the_patch_only_holds_the_changes():
+    patch = game_data_patch(OLD_GAME_DATA, NEW_GAME_DATA, CATEGORIES)
+
+    assert {operation["path"] for operation in patch} == {
+        "/data/scripts/initialize/actions",
+        "/data/scripts/removed",
+        "/data/scripts/a~1b~0c/actions",
+        "/data/scripts/added",
+        "/data/variables/score/default",
+        "/data/variables/flag/default",
+        "/data/unitTypes/frog/controls/abilities/e",
+        "/data/itemTypes",
+    }
+    assert game_data_patch(OLD_GAME_DATA, OLD_GAME_DATA, CATEGORIES) == []
+
+
+def test_patches_are_applied_by_rfc_6902_operations():
+    data = {"list": [1, 2], "object": {"key": "value"}}
+
+    patched_data = apply_json_patch(
+        data,
+        [
+            {"op": "add", "path": "/list/-", "value": 3},
+            {"op": "add", "path": "/list/0", "value": 0},
+            {"op": "copy", "from": "/object", "path": "/copied"},
+            {"op": "move", "from": "/object/key", "path": "/moved"},
+            {"op": "test", "path": "/moved", "value": "value"},
+            {"op": "remove", "path": "/list/1"},
+        ],
+    )
+
+    assert patched_data == {
+        "list": [0, 2, 3],
+        "object": {},
+        "copied": {"key": "value"},
+        "moved": "value",
+    }
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"op": "test", "path": "/title", "value": "Other"},
+        {"op": "remove", "path": "/data/missing"},
+        {"op": "replace", "path": "/data/map/width"},
+        {"op": "add", "path": "/data/list/01", "value": 1},
+        {"op": "unknown", "path": "/title"},
+    ],
+)
+def test_invalid_patches_are_rejected(operation):
+    game_data = {**copy.deepcopy(OLD_GAME_DATA), "data": {"list": [0], "map": {}}}
+
+    with pytest.raises(ValueError):
+        _ = apply_json_patch(game_data, [operation])
+
+
+def test_emitted_patch_applied_to_the_stored_game_gives_the_compiled_game(
+    froge_project: Path, run_pymodd
+):
+    scripts_file = froge_project.joinpath("scripts.py")
+    _ = scripts_file.write_text(
+        scripts_file.read_text().replace("'BOSS SPAWNED'", "'THE BOSS HAS SPAWNED'")
+    )
+
+    compile_result = run_pymodd(froge_project, "compile")
+    patch_result = run_pymodd(froge_project, "compile", "--emit-patch")
+    apply_result = run_pymodd(
+        froge_project,
+        "apply-patch",
+        "output/Froge.patch.json",
+        "--output",
+        "output/patched.json",
+    )
+
+    for result in [compile_result, patch_result, apply_result]:
+        assert result.returncode == 0, result.stdout + result.stderr
+    patch = json.loads(froge_project.joinpath("output", "Froge.patch.json").read_text())
+    compiled_game_data = json.loads(
+        froge_project.joinpath("output", "Froge.json").read_text()
+    )
+    assert len(patch) > 0
+    assert len(json.dumps(patch)) < len(json.dumps(compiled_game_data))
+    assert (
+        json.loads(froge_project.joinpath("output", "patched.json").read_text())
+        == compiled_game_data
+    )
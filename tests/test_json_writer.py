@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from pymodd.compiler import json_writer
+from pymodd.compiler.json_writer import is_encoded_by_orjson_as_by_json, write_json
+
+GAME_DATA = {
+    "title": "Frögé ゲーム",
+    "data": {
+        "unitTypes": {
+            "frog": {
+                "name": "Grenouille à épée",
+                "attributes": {"health": {"value": 100.5, "max": 2**40}},
+                "tags": ["ß", "😀", " "],
+            }
+        },
+        "variables": {"speed": {"default": 1.25}},
+    },
+}
+
+
+def read_json_data(file_path: Path):
+    # re-encoded, since nan is not equal to itself
+    return json.dumps(json.loads(file_path.read_text(encoding="utf-8")), sort_keys=True)
+
+
+def assert_compact_output_matches_indented_output(data, tmp_path: Path):
+    compact_file, indented_file = tmp_path / "compact.json", tmp_path / "indented.json"
+    write_json(data, compact_file, compact=True)
+    write_json(data, indented_file)
+
+    assert read_json_data(compact_file) == read_json_data(indented_file)
+    assert json.loads(compact_file.read_text(encoding="utf-8")) == json.loads(
+        json.dumps(data)
+    )
+
+
+def test_compact_output_matches_indented_output_for_non_ascii_strings(tmp_path: Path):
+    assert_compact_output_matches_indented_output(GAME_DATA, tmp_path)
+
+
+@pytest.mark.parametrize(
+    "unusual_value",
+    [
+        float("nan"),
+        float("inf"),
+        float("-inf"),
+        2**70,
+        {1: "int key", None: "null key"},
+    ],
+)
+def test_compact_output_matches_indented_output_for_values_orjson_can_not_encode(
+    unusual_value, tmp_path: Path
+):
+    data = {
+        **GAME_DATA,
+        "data": {**GAME_DATA["data"], "variables": {"unusual": unusual_value}},
+    }
+
+    assert not is_encoded_by_orjson_as_by_json(data)
+    assert_compact_output_matches_indented_output(data, tmp_path)
+
+
+def test_compact_output_is_written_by_a_single_encoder(tmp_path: Path):
+    data = {**GAME_DATA, "data": {**GAME_DATA["data"], "nan": float("nan")}}
+    compact_file = tmp_path / "compact.json"
+
+    write_json(data, compact_file, compact=True)
+
+    # the non-finite float makes json write the whole document, escaping every non-ascii string
+    compact_json = compact_file.read_text(encoding="utf-8")
+    assert "NaN" in compact_json
+    assert compact_json.isascii()
+
+
+@pytest.mark.skipif(json_writer.orjson is None, reason="orjson is not installed")
+def test_compact_output_uses_orjson_when_it_encodes_the_data_as_json(tmp_path: Path):
+    compact_file = tmp_path / "compact.json"
+
+    write_json(GAME_DATA, compact_file, compact=True)
+
+    assert compact_file.read_bytes() == json_writer.orjson.dumps(GAME_DATA)
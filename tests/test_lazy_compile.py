@@ -0,0 +1,44 @@
+import json
+from pathlib import Path
+
+SCRIPT_POSITIONS_FILE = Path(".pymodd_cache", "script_positions.json")
+
+
+def test_lazy_compile_without_stored_positions_fails(froge_project: Path, run_pymodd):
+    result = run_pymodd(
+        froge_project, "compile", "--only-scripts", "folder/initialize", "--lazy"
+    )
+
+    assert "were not stored by a full compile" in result.stdout + result.stderr
+    assert not froge_project.joinpath("output", "initialize.json").exists()
+
+
+def test_lazy_compile_of_script_missing_from_stored_positions_fails(
+    froge_project: Path, run_pymodd
+):
+    _ = run_pymodd(froge_project, "compile")
+    script_positions_file = froge_project.joinpath(SCRIPT_POSITIONS_FILE)
+    identity_to_position = json.loads(script_positions_file.read_text())
+    del identity_to_position["scripts.initialize"]
+    _ = script_positions_file.write_text(json.dumps(identity_to_position))
+
+    result = run_pymodd(
+        froge_project, "compile", "--only-scripts", "folder/initialize", "--lazy"
+    )
+
+    assert "scripts.initialize" in result.stdout + result.stderr
+    assert not froge_project.joinpath("output", "initialize.json").exists()
+
+
+def test_lazy_compile_matches_compile_of_built_game(froge_project: Path, run_pymodd):
+    _ = run_pymodd(froge_project, "compile")
+    compiled_script_file = froge_project.joinpath("output", "initialize.json")
+    _ = run_pymodd(froge_project, "compile", "--only-scripts", "folder/initialize")
+    script_data = json.loads(compiled_script_file.read_text())
+    compiled_script_file.unlink()
+
+    _ = run_pymodd(
+        froge_project, "compile", "--only-scripts", "folder/initialize", "--lazy"
+    )
+
+    assert json.loads(compiled_script_file.read_text()) == script_data
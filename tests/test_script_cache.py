@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+
+OUTPUT_FILE = Path("output", "Froge.json")
+
+
+def add_helper_returning_imported_constant(project_directory: Path, message: str):
+    _ = project_directory.joinpath("constants.py").write_text(
+        f"BOSS_MESSAGE = {message!r}\n"
+    )
+    _ = project_directory.joinpath("messages.py").write_text(
+        "from constants import BOSS_MESSAGE\n\n\n"
+        "def boss_message():\n"
+        "    return BOSS_MESSAGE\n"
+    )
+    scripts_file = project_directory.joinpath("scripts.py")
+    _ = scripts_file.write_text(
+        scripts_file.read_text()
+        .replace(
+            "from game_variables import *\n",
+            "from game_variables import *\nfrom messages import boss_message\n",
+        )
+        .replace("'BOSS SPAWNED'", "boss_message()")
+    )
+
+
+def compiled_game_data(project_directory: Path, run_pymodd, *args: str) -> dict:
+    result = run_pymodd(project_directory, "compile", *args)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return json.loads(project_directory.joinpath(OUTPUT_FILE).read_text())
+
+
+def test_cached_compile_matches_compile_without_cache(froge_project: Path, run_pymodd):
+    uncached_game_data = compiled_game_data(froge_project, run_pymodd, "--no-cache")
+    _ = compiled_game_data(froge_project, run_pymodd)
+
+    assert compiled_game_data(froge_project, run_pymodd) == uncached_game_data
+
+
+def test_editing_a_constant_imported_by_a_helper_invalidates_the_cache(
+    froge_project: Path, run_pymodd
+):
+    add_helper_returning_imported_constant(froge_project, "BOSS SPAWNED")
+    _ = compiled_game_data(froge_project, run_pymodd)
+    _ = froge_project.joinpath("constants.py").write_text(
+        "BOSS_MESSAGE = 'THE FROG BOSS HAS SPAWNED'\n"
+    )
+
+    game_data = compiled_game_data(froge_project, run_pymodd)
+
+    assert game_data == compiled_game_data(froge_project, run_pymodd, "--no-cache")
+    assert "THE FROG BOSS HAS SPAWNED" in json.dumps(game_data)
+    assert "'BOSS SPAWNED'" not in json.dumps(game_data)
+
+
+def test_editing_a_variable_returned_by_a_helper_invalidates_the_cache(
+    froge_project: Path, run_pymodd
+):
+    _ = froge_project.joinpath("players.py").write_text(
+        "from game_variables import Variable\n\n\n"
+        "def ai_player():\n"
+        "    return Variable.AI\n"
+    )
+    scripts_file = froge_project.joinpath("scripts.py")
+    _ = scripts_file.write_text(
+        scripts_file.read_text()
+        .replace(
+            "from game_variables import *\n",
+            "from game_variables import *\nfrom players import ai_player\n",
+        )
+        .replace(
+            "assign_player_to_player_type(Variable.AI, PlayerType.AI)",
+            "assign_player_to_player_type(ai_player(), PlayerType.AI)",
+        )
+    )
+    _ = compiled_game_data(froge_project, run_pymodd)
+    game_variables_file = froge_project.joinpath("game_variables.py")
+    old_game_variables = game_variables_file.read_text()
+    _ = game_variables_file.write_text(
+        old_game_variables.replace("VariableBase('AI'", "VariableBase('computerPlayer'")
+    )
+    assert game_variables_file.read_text() != old_game_variables
+
+    assert compiled_game_data(froge_project, run_pymodd) == compiled_game_data(
+        froge_project, run_pymodd, "--no-cache"
+    )
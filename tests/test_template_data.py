@@ -0,0 +1,80 @@
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from pymodd.game import Game
+from pymodd.utils.copy_json_data import copy_json_data
+from pymodd.variable_types import ITEM_TYPE_TEMPLATE_DATA, ItemTypeBase
+
+FROGE_GAME_JSON_FILE = Path(__file__).parent.parent.joinpath(
+    "examples", "froge", "utils", "game.json"
+)
+
+
+class TemplateGame(Game):
+    pass
+
+
+def test_templates_can_not_be_edited():
+    with pytest.raises(TypeError):
+        ITEM_TYPE_TEMPLATE_DATA["name"] = "Edited"
+    with pytest.raises(TypeError):
+        ITEM_TYPE_TEMPLATE_DATA["bulletStartPosition"]["rotation"] = 180
+    with pytest.raises(TypeError):
+        ITEM_TYPE_TEMPLATE_DATA["canBeUsedBy"].append("unitType")
+
+
+def test_editing_an_instance_leaves_the_template_untouched():
+    template_json = json.dumps(ITEM_TYPE_TEMPLATE_DATA)
+    item_type_data = ItemTypeBase("sword").get_template_data()
+
+    item_type_data["name"] = "Sword"
+    item_type_data["bulletStartPosition"]["rotation"] = 180
+    item_type_data["canBeUsedBy"].append("unitType")
+    del item_type_data["cost"]
+
+    assert json.dumps(ITEM_TYPE_TEMPLATE_DATA) == template_json
+    assert ItemTypeBase("bow").get_template_data() == copy_json_data(
+        ITEM_TYPE_TEMPLATE_DATA
+    )
+    assert item_type_data["bulletStartPosition"]["rotation"] == 180
+    assert item_type_data["canBeUsedBy"] == ["unitType"]
+
+
+def test_instances_share_the_paths_they_do_not_edit():
+    item_type_data = ItemTypeBase("sword").get_template_data()
+
+    item_type_data["bulletStartPosition"]["rotation"] = 180
+
+    assert dict.get(item_type_data, "damage") is ITEM_TYPE_TEMPLATE_DATA["damage"]
+    assert (
+        dict.get(item_type_data, "bulletStartPosition")
+        is not ITEM_TYPE_TEMPLATE_DATA["bulletStartPosition"]
+    )
+
+
+def test_instances_copy_and_serialize_like_plain_data():
+    item_type_data = ItemTypeBase("sword").get_template_data()
+    item_type_data["bulletStartPosition"]["rotation"] = 180
+    plain_data = json.loads(json.dumps(item_type_data))
+
+    assert copy_json_data(item_type_data) == plain_data
+    assert type(copy_json_data(item_type_data)["damage"]) is dict
+    assert copy.deepcopy(item_type_data) == plain_data
+
+
+def test_new_variables_are_created_from_their_templates():
+    class ItemTypes:
+        SWORD = ItemTypeBase("newSword", name="Sword").with_value(
+            "bulletStartPosition.rotation", 90
+        )
+
+    game = TemplateGame(str(FROGE_GAME_JSON_FILE), [ItemTypes], {})
+
+    sword_data = game.data["data"]["itemTypes"]["newSword"]
+    assert sword_data["name"] == "Sword"
+    assert sword_data["bulletStartPosition"] == {"rotation": 90, "y": 0, "x": 0}
+    assert ITEM_TYPE_TEMPLATE_DATA["name"] == "New Item Type"
+    assert ITEM_TYPE_TEMPLATE_DATA["bulletStartPosition"]["rotation"] == 0
@@ -0,0 +1,124 @@
+from pathlib import Path
+
+import pytest
+
+from pymodd.game import Game
+from pymodd.variable.data_type import DataType
+from pymodd.variable_types import (
+    EntityVariableBase,
+    MusicBase,
+    PlayerVariableBase,
+    VariableBase,
+)
+from pymodd.variable.variable_table import (
+    attribute_name_of,
+    variable_class_from_table,
+    variables_from_table,
+)
+
+FROGE_GAME_JSON_FILE = Path(__file__).parent.parent.joinpath(
+    "examples", "froge", "utils", "game.json"
+)
+
+
+class TableGame(Game):
+    pass
+
+
+def test_attribute_names_never_start_with_an_underscore():
+    assert attribute_name_of("Frog Sword") == "FROG_SWORD"
+    assert attribute_name_of("1st") == "N_1ST"
+    assert attribute_name_of("_hidden") == "HIDDEN"
+    assert not attribute_name_of("!!!").startswith("_")
+
+
+def test_variables_named_with_a_leading_number_are_compiled(tmp_path: Path):
+    table_file = tmp_path.joinpath("music.csv")
+    _ = table_file.write_text("id,name,volume\nfirstSong,1st,40\n")
+
+    Music = variable_class_from_table(
+        "Music", table_file, MusicBase, json_columns=["volume"]
+    )
+    game = TableGame(str(FROGE_GAME_JSON_FILE), [Music], {})
+
+    assert Music.N_1ST.id == "firstSong"
+    assert game.data["data"]["music"]["firstSong"]["name"] == "1st"
+    assert game.data["data"]["music"]["firstSong"]["volume"] == 40
+
+
+def test_csv_cells_stay_text_unless_their_column_is_read_as_json(tmp_path: Path):
+    table_file = tmp_path.joinpath("music.csv")
+    _ = table_file.write_text(
+        "id,name,artist,volume\nsong,1,true,40\nnullSong,null,null,[1]\n"
+    )
+
+    song, null_song = variables_from_table(
+        table_file, MusicBase, json_columns=["volume"]
+    )
+
+    assert song.data_keys_to_new_values == [
+        ("name", "1"),
+        ("artist", "true"),
+        ("volume", 40),
+    ]
+    assert null_song.data_keys_to_new_values == [
+        ("name", "null"),
+        ("artist", "null"),
+        ("volume", [1]),
+    ]
+
+
+def test_json_cells_that_are_not_json_are_rejected(tmp_path: Path):
+    table_file = tmp_path.joinpath("music.csv")
+    _ = table_file.write_text("id,volume\nsong,loud\n")
+
+    with pytest.raises(ValueError, match="volume of row 1"):
+        _ = list(variables_from_table(table_file, MusicBase, json_columns=["volume"]))
+
+
+@pytest.mark.parametrize(
+    "variable_type", [VariableBase, EntityVariableBase, PlayerVariableBase]
+)
+def test_variables_are_created_with_the_data_types_of_their_rows(
+    variable_type, tmp_path: Path
+):
+    table_file = tmp_path.joinpath("variables.csv")
+    _ = table_file.write_text(
+        "id,dataType,default\nscore,number,0\nnickname,string,0\n"
+    )
+
+    score, nickname = variables_from_table(
+        table_file, variable_type, json_columns=["default"]
+    )
+
+    assert (score.id, score.data_type) == ("score", DataType.NUMBER)
+    assert (nickname.id, nickname.data_type) == ("nickname", DataType.STRING)
+    assert score.data_keys_to_new_values == [("default", 0)]
+
+
+def test_variables_are_compiled_with_the_data_types_of_their_rows():
+    Variable = variable_class_from_table(
+        "Variables",
+        [{"id": "tableScore", "dataType": "number", "default": 5}],
+        VariableBase,
+    )
+
+    game = TableGame(str(FROGE_GAME_JSON_FILE), [Variable], {})
+
+    assert Variable.TABLE_SCORE.data_type == DataType.NUMBER
+    assert game.data["data"]["variables"]["tableScore"] == {
+        "dataType": "number",
+        "default": 5,
+    }
+
+
+@pytest.mark.parametrize(
+    "row, error",
+    [
+        ({"id": "score"}, "row 1 of the table has no dataType"),
+        ({"id": "score", "dataType": "numbr"}, "unknown dataType: numbr"),
+    ],
+)
+def test_variables_without_a_known_data_type_are_rejected(row, error):
+    with pytest.raises(ValueError, match=error):
+        _ = list(variables_from_table([row], VariableBase))